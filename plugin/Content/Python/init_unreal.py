@@ -13,20 +13,38 @@ plugin_python_path = os.path.dirname(os.path.abspath(__file__))
 if plugin_python_path not in sys.path:
     sys.path.append(plugin_python_path)
 
-try:
-    # Import listener module
-    import uemcp_listener
+_READY_BANNER = (
+    "UEMCP: Ready on http://localhost:8765\n"
+    "UEMCP: Commands: from uemcp_helpers import *\n"
+    "UEMCP: Functions: restart_listener(), stop_listener(), status(), start_listener()"
+)
 
-    # Also check if port is in use from a crashed session
-    from utils import is_port_in_use
+try:
 
     def _deferred_startup(delta_time):
         """Deferred startup to avoid blocking the UE main thread."""
         if hasattr(_deferred_startup, "_handle"):
             unreal.unregister_slate_post_tick_callback(_deferred_startup._handle)
 
-        # Stop any listener already running in this process (e.g. from a previous
-        # hot-reload).  stop_listener() waits for the server thread to exit cleanly;
+        # The listener pulls in the command registry and operation modules, so it is
+        # imported here on the first tick rather than while the plugin is loading.
+        try:
+            import uemcp_listener
+
+            # Also check if port is in use from a crashed session
+            from utils import is_port_in_use
+        except ImportError as e:
+            unreal.log_error(f"UEMCP: Could not import module: {e}")
+            return
+
+        # Re-running this script does not reload the listener module, so a healthy
+        # listener from a previous run is left in place rather than restarted.
+        if uemcp_listener.is_healthy():
+            unreal.log("UEMCP: Listener already running on http://localhost:8765")
+            return
+
+        # Stop a listener that is still flagged as running in this process but is
+        # no longer serving.  stop_listener() waits for the server thread to exit cleanly;
         # as a last resort it calls force_free_port_silent, which kills any process
         # holding the port — including the Unreal Editor itself if the thread hangs.
         if uemcp_listener.server_running:
@@ -47,19 +65,17 @@ try:
         started = uemcp_listener.start_listener()
         if not started:
             # This should rarely happen now with automatic cleanup
-            unreal.log_warning("UEMCP: Could not start listener")
-            unreal.log("UEMCP: Check the output log for details")
+            unreal.log_warning("UEMCP: Could not start listener - check the output log for details")
 
         if started:
-            # Success - show status
-            unreal.log("UEMCP: Ready on http://localhost:8765")
-            unreal.log("UEMCP: Commands: from uemcp_helpers import *")
-            unreal.log("UEMCP: Functions: restart_listener(), stop_listener(), status(), start_listener()")
+            # Success - show status as a single log entry
+            unreal.log(_READY_BANNER)
 
     # Schedule startup on next Slate tick to avoid blocking UE main thread
     _deferred_startup._handle = unreal.register_slate_post_tick_callback(_deferred_startup)
 
-    # Import helper functions for convenience (made available to Python console)
+    # Import helper functions for convenience (made available to Python console).
+    # uemcp_helpers only imports the listener when one of them is called.
     from uemcp_helpers import reload_uemcp, restart_listener, start_listener, status, stop_listener  # noqa: F401
 
 except ImportError as e:
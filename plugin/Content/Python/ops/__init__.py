@@ -1,43 +1,38 @@
 """
 UEMCP Operations Package - Contains all operation modules
+
+Submodules and operation classes are imported lazily on first access
+(PEP 562), so importing a single module such as ``ops.system`` does not pull
+in every other operation module with it.
 """
 
-# Import all operation classes for easy access
-# Import blueprint operations as modules since they use standalone functions
-from . import (
-    animation,
-    audio,
-    blueprint,
-    blueprint_graph,
-    blueprint_nodes,
-    datatable,
-    input_system,
-    material_graph,
-    mesh,
-    performance,
-    statetree,
-    struct_enum,
-    widget,
-)
-from .actor import ActorOperations
-from .asset import AssetOperations
-from .level import LevelOperations
-from .material import MaterialOperations
-from .system import SystemOperations
-from .viewport import ViewportOperations
+import importlib
 
+# Operation classes re-exported at package level, mapped to their defining module.
+# Standalone-function modules (blueprint, mesh, ...) are imported on demand by
+# ``from ops import <module>`` through the normal submodule import machinery.
+#
 # Niagara and PCG are optional -- only available when the respective plugins are enabled.
-# Imports are guarded so the package loads even without these plugins; callers that
+# Importing ops.niagara / ops.pcg raises ImportError without them; callers that
 # need them should import the module directly and catch ImportError.
-try:
-    from . import niagara  # noqa: F401
-except ImportError:
-    pass  # Niagara plugin not available; ops.niagara will raise on direct import
+_LAZY_CLASSES = {
+    "ActorOperations": "actor",
+    "AssetOperations": "asset",
+    "LevelOperations": "level",
+    "ViewportOperations": "viewport",
+    "SystemOperations": "system",
+    "MaterialOperations": "material",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-try:
-    from . import pcg  # noqa: F401
-except ImportError:
-    pass  # PCG plugin not available; ops.pcg will raise on direct import
 
 __all__ = [
     "ActorOperations",
@@ -4,18 +4,27 @@ UEMCP Actor Operations - All actor-related operations
 Enhanced with improved error handling framework to eliminate try/catch boilerplate.
 """
 
+import fnmatch
+import itertools
+import math
+import os
+import re
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 import unreal
 
 from utils import (
+    build_actor_name_index,
     create_rotator,
     create_transform,
     create_vector,
     get_actor_subsystem,
     load_asset,
     log_debug,
+    validate_actor_deleted,
+    validate_actor_modifications,
+    validate_actor_spawn,
 )
 
 # Enhanced error handling framework
@@ -34,6 +43,186 @@ from utils.error_handling import (
     safe_operation,
     validate_inputs,
 )
+from utils.validation import ValidationResult
+
+# Default for every ``validate`` parameter below. Scripts that trust their inputs can
+# set UEMCP_VALIDATE=0 before the plugin loads to skip post-operation validation
+# unless a call asks for it explicitly.
+_DEFAULT_VALIDATE = os.environ.get("UEMCP_VALIDATE", "1").strip().lower() in ("1", "true", "yes", "on")
+
+# organize patterns with this prefix are whole-name globs rather than substrings
+_GLOB_PREFIX = "glob:"
+
+_AXIS_NAMES = ("X", "Y", "Z")
+_ORIGIN = (0, 0, 0)
+_UNIT_SCALE = (1, 1, 1)
+
+# Pair classifications produced by ActorOperations._pair_gap_overlap
+_GAP, _OVERLAP, _TOUCHING = 0, 1, 2
+_PAIR_KINDS = ("gap", "overlap", "touching")
+
+# Actors covering more placement-grid cells than this (e.g. floors and landscapes)
+# are paired with every other actor directly instead of being entered in each cell
+_MAX_GRID_CELLS = 64
+
+# Overlaps deeper than these fractions of the modular size are critical / major
+_CRITICAL_OVERLAP_RATIO = 0.25
+_MAJOR_OVERLAP_RATIO = 0.1
+
+
+def _bucket_boxes(mins, maxs, cutoff):
+    """Enter bounding boxes into the cells of a uniform grid of side ``cutoff``.
+
+    Each box goes into every cell that its bounds, grown by ``cutoff / 2`` on
+    each side, touch. Boxes covering more than _MAX_GRID_CELLS cells are left
+    out of the grid.
+
+    Returns:
+        tuple: (grid, low_cells, oversized) - cell -> member indices in index
+        order, each box's lowest cell (None when oversized), oversized indices
+    """
+    floor = math.floor
+    half = cutoff / 2
+    grid = {}
+    low_cells = [None] * len(mins)
+    oversized = []
+    for k in range(len(mins)):
+        x0, y0, z0 = mins[k]
+        x1, y1, z1 = maxs[k]
+        lx, ly, lz = floor((x0 - half) / cutoff), floor((y0 - half) / cutoff), floor((z0 - half) / cutoff)
+        hx, hy, hz = floor((x1 + half) / cutoff), floor((y1 + half) / cutoff), floor((z1 + half) / cutoff)
+        if (hx - lx + 1) * (hy - ly + 1) * (hz - lz + 1) > _MAX_GRID_CELLS:
+            oversized.append(k)
+            continue
+        low_cells[k] = (lx, ly, lz)
+        for cell in itertools.product(range(lx, hx + 1), range(ly, hy + 1), range(lz, hz + 1)):
+            members = grid.get(cell)
+            if members is None:
+                grid[cell] = [k]
+            else:
+                members.append(k)
+    return grid, low_cells, oversized
+
+
+def _grid_cell_pairs(grid, low_cells):
+    """Yield each pair of boxes sharing a grid cell, from the lowest cell they share.
+
+    Yields:
+        tuple: (i, j) index pairs with i < j
+    """
+    for (cx, cy, cz), members in grid.items():
+        last = len(members)
+        if last < 2:
+            continue
+        # Members were entered in index order, so i < j below
+        for a in range(last - 1):
+            i = members[a]
+            ix, iy, iz = low_cells[i]
+            for b in range(a + 1, last):
+                j = members[b]
+                jx, jy, jz = low_cells[j]
+                if max(ix, jx) == cx and max(iy, jy) == cy and max(iz, jz) == cz:
+                    yield i, j
+
+
+def _neighbour_pairs(mins, maxs, cutoff):
+    """Yield candidate neighbour pairs of bounding boxes from a uniform grid.
+
+    Two boxes no more than ``cutoff`` apart on every axis always share a cell
+    of the grid built by _bucket_boxes; each pair is yielded only from the
+    lowest cell the two share, so it is yielded once. Boxes too large for the
+    grid are paired with every other box instead.
+
+    Yields:
+        tuple: (i, j) index pairs with i < j, in no particular order
+    """
+    count = len(mins)
+    if cutoff <= 0:
+        yield from itertools.combinations(range(count), 2)
+        return
+
+    grid, low_cells, oversized = _bucket_boxes(mins, maxs, cutoff)
+    yield from _grid_cell_pairs(grid, low_cells)
+
+    oversized_set = set(oversized)
+    for i in oversized:
+        for j in range(count):
+            if j != i and (j not in oversized_set or j > i):
+                yield (i, j) if i < j else (j, i)
+
+
+def _scan_pairs(mins, maxs, tolerance, cutoff):
+    """Find neighbouring bounding boxes whose gap or overlap exceeds ``tolerance``.
+
+    Only neighbours are compared: pairs separated by more than ``cutoff`` on any
+    axis are skipped. Candidates come from a uniform grid (see _neighbour_pairs),
+    so each box is tested against the boxes around it rather than against every
+    other box. The per-axis math of ActorOperations._pair_gap_overlap is
+    unrolled into local float arithmetic so pairs that are not reported cost no
+    calls or allocations.
+
+    Args:
+        mins: Per-actor [x, y, z] bounds minimums
+        maxs: Per-actor [x, y, z] bounds maximums, parallel to ``mins``
+        tolerance: Gaps and overlaps up to this distance are ignored
+        cutoff: Pairs further apart than this on any axis are not neighbours
+
+    Returns:
+        list: (i, j, kind, distance, axis) tuples with i < j, in pair order
+    """
+    hits = []
+    append = hits.append
+    for i, j in _neighbour_pairs(mins, maxs, cutoff):
+        ax0, ay0, az0 = mins[i]
+        ax1, ay1, az1 = maxs[i]
+        bx0, by0, bz0 = mins[j]
+        bx1, by1, bz1 = maxs[j]
+        # Length of the intersection on each axis; negative means separated
+        dx = (ax1 if ax1 < bx1 else bx1) - (ax0 if ax0 > bx0 else bx0)
+        dy = (ay1 if ay1 < by1 else by1) - (ay0 if ay0 > by0 else by0)
+        dz = (az1 if az1 < bz1 else bz1) - (az0 if az0 > bz0 else bz0)
+        if dx < -cutoff or dy < -cutoff or dz < -cutoff:
+            # Sharing a grid cell does not guarantee the boxes are neighbours
+            continue
+
+        if dx < 0 or dy < 0 or dz < 0:
+            # Smallest separation wins; ties keep the first axis
+            kind = _GAP
+            distance = axis = None
+            if dx < 0:
+                distance, axis = -dx, 0
+            if dy < 0 and (distance is None or -dy < distance):
+                distance, axis = -dy, 1
+            if dz < 0 and (distance is None or -dz < distance):
+                distance, axis = -dz, 2
+        else:
+            # Deepest overlap wins; ties keep the first axis
+            kind = _OVERLAP
+            distance, axis = dx, 0
+            if dy > distance:
+                distance, axis = dy, 1
+            if dz > distance:
+                distance, axis = dz, 2
+            if distance <= 0:
+                # Touching on every axis -- never reported
+                continue
+
+        if distance > tolerance:
+            append((i, j, kind, distance, axis))
+
+    # Report in the callers' actor order, independent of the grid layout
+    hits.sort()
+    return hits
+
+
+class ActorBoundsInfo(NamedTuple):
+    """Axis-aligned bounds of one actor, as used by placement validation."""
+
+    actor: Any
+    name: str
+    location: List[float]
+    bounds_min: List[float]
+    bounds_max: List[float]
 
 
 class ActorOperations:
@@ -68,7 +257,7 @@ class ActorOperations:
         scale: Optional[List[float]] = None,
         name: Optional[str] = None,
         folder: Optional[str] = None,
-        validate: bool = True,
+        validate: bool = _DEFAULT_VALIDATE,
     ):
         """Spawn an actor in the level.
 
@@ -94,7 +283,7 @@ class ActorOperations:
 
         # Generate name if not provided
         if not name:
-            name = f"UEMCP_Actor_{int(time.time())}"
+            name = self._auto_actor_name()
 
         # Create transform
         ue_location, ue_rotation, ue_scale = create_transform(location, rotation, scale)
@@ -103,28 +292,14 @@ class ActorOperations:
         asset = require_asset(assetPath)
 
         # Spawn based on asset type
-        editor_actor_subsystem = get_actor_subsystem()
-        actor = None
-        if isinstance(asset, unreal.StaticMesh):
-            # Spawn static mesh actor
-            actor = editor_actor_subsystem.spawn_actor_from_class(
-                unreal.StaticMeshActor.static_class(), ue_location, ue_rotation
-            )
-
-            if actor:
-                # Set mesh
-                mesh_comp = actor.get_editor_property("static_mesh_component")
-                mesh_comp.set_static_mesh(asset)
-
-        elif isinstance(asset, unreal.Blueprint):
-            # Spawn blueprint actor
-            actor = editor_actor_subsystem.spawn_actor_from_object(asset, ue_location, ue_rotation)
-        else:
+        handler = self._get_spawn_handler(asset)
+        if handler is None:
             raise ProcessingError(
                 f"Unsupported asset type: {type(asset).__name__}",
                 operation="spawn_actor",
                 details={"assetPath": assetPath},
             )
+        actor = handler(self, get_actor_subsystem(), asset, ue_location, ue_rotation)
 
         if not actor:
             raise ProcessingError(
@@ -174,24 +349,68 @@ class ActorOperations:
 
         # Add validation if requested
         if validate:
-            from utils import validate_actor_spawn
-
             validation_result = validate_actor_spawn(
-                name,
+                actor,
                 expected_location=location,
                 expected_rotation=rotation,
                 expected_scale=scale,
-                expected_mesh_path=assetPath if isinstance(asset, unreal.StaticMesh) else None,
+                expected_mesh_path=assetPath if handler is ActorOperations._spawn_static_mesh else None,
                 expected_folder=folder,
             )
             self._merge_validation(result, validation_result)
 
         return result
 
+    # Per-session sequence for generated actor names
+    _spawn_seq = itertools.count()
+
+    @classmethod
+    def _auto_actor_name(cls):
+        """Generate a label for an unnamed spawn.
+
+        The timestamp keeps names distinct across editor sessions and the
+        sequence number keeps spawns within the same second distinct, so the
+        editor never has to resolve a label collision.
+        """
+        return f"UEMCP_Actor_{int(time.time())}_{next(cls._spawn_seq)}"
+
+    def _spawn_static_mesh(self, editor_actor_subsystem, asset, ue_location, ue_rotation):
+        """Spawn a StaticMeshActor and assign the mesh asset to it."""
+        actor = editor_actor_subsystem.spawn_actor_from_class(
+            unreal.StaticMeshActor.static_class(), ue_location, ue_rotation
+        )
+        if actor:
+            mesh_comp = actor.get_editor_property("static_mesh_component")
+            mesh_comp.set_static_mesh(asset)
+        return actor
+
+    def _spawn_blueprint(self, editor_actor_subsystem, asset, ue_location, ue_rotation):
+        """Spawn an instance of a Blueprint asset."""
+        return editor_actor_subsystem.spawn_actor_from_object(asset, ue_location, ue_rotation)
+
+    # Asset class name -> spawn handler. Keyed by name rather than by unreal class so
+    # the table does not depend on engine types at import time; subclasses such as
+    # AnimBlueprint resolve to their parent's handler through the MRO walk below.
+    _SPAWN_HANDLERS = {"StaticMesh": _spawn_static_mesh, "Blueprint": _spawn_blueprint}
+
+    @classmethod
+    def _get_spawn_handler(cls, asset):
+        """Return the spawn handler for an asset, or None if its type is unsupported."""
+        asset_type = type(asset)
+        handler = cls._SPAWN_HANDLERS.get(asset_type.__name__)
+        if handler is not None:
+            return handler
+        # Subclasses (e.g. a project's StaticMesh subclass) fall back to their nearest supported base
+        for asset_class in asset_type.__mro__[1:]:
+            handler = cls._SPAWN_HANDLERS.get(asset_class.__name__)
+            if handler is not None:
+                return handler
+        return None
+
     @validate_inputs({"actorName": [RequiredRule(), TypeRule(str)]})
     @handle_unreal_errors("delete_actor")
     @safe_operation("actor")
-    def delete(self, actorName: str, validate: bool = True):
+    def delete(self, actorName: str, validate: bool = _DEFAULT_VALIDATE):
         """Delete an actor from the level.
 
         Args:
@@ -213,13 +432,71 @@ class ActorOperations:
 
         # Add validation if requested
         if validate:
-            from utils import validate_actor_deleted
-
             validation_result = validate_actor_deleted(actorName)
             self._merge_validation(result, validation_result)
 
         return result
 
+    @validate_inputs({"actorNames": [RequiredRule(), TypeRule(list)]})
+    @handle_unreal_errors("delete_actors")
+    @safe_operation("actor")
+    def delete_many(self, actorNames: List[str], validate: bool = _DEFAULT_VALIDATE):
+        """Delete several actors from the level in a single call.
+
+        All names are resolved from one level scan and the actors are destroyed
+        together in one editor transaction.
+
+        Args:
+            actorNames: Names of the actors to delete
+            validate: Whether to validate the deletions
+
+        Returns:
+            dict: Deleted actor names and any names that were not found
+        """
+        malformed = [f"actorNames[{i}]" for i, name in enumerate(actorNames) if not isinstance(name, str)]
+        if malformed:
+            raise ValidationError(
+                f"{', '.join(malformed)} must be strings",
+                operation="delete_actors",
+                details={"parameter": "actorNames", "entries": malformed},
+            )
+
+        actor_index = build_actor_name_index()
+        deleted = []
+        victims = []
+        missing = []
+        # Repeated names are handled once, at their first occurrence
+        for actor_name in dict.fromkeys(actorNames):
+            actor = actor_index.pop(actor_name, None)
+            if actor is None:
+                missing.append(actor_name)
+            else:
+                deleted.append(actor_name)
+                victims.append(actor)
+
+        if victims:
+            with unreal.ScopedEditorTransaction("UEMCP Delete Actors"):
+                get_actor_subsystem().destroy_actors(victims)
+            log_debug(f"Deleted {len(victims)} actors")
+
+        result = {
+            "deletedActors": deleted,
+            "deletedCount": len(deleted),
+            "notFound": missing,
+            "message": f"Deleted {len(deleted)} actors",
+        }
+
+        # One rescan checks every deletion, instead of a level scan per name
+        if validate and deleted:
+            remaining = build_actor_name_index()
+            validation_result = ValidationResult()
+            for actor_name in deleted:
+                if actor_name in remaining:
+                    validation_result.add_error(f"Actor '{actor_name}' still exists in level")
+            self._merge_validation(result, validation_result)
+
+        return result
+
     @validate_inputs(
         {
             "actorName": [RequiredRule(), TypeRule(str)],
@@ -240,7 +517,7 @@ class ActorOperations:
         scale: Optional[List[float]] = None,
         folder: Optional[str] = None,
         mesh: Optional[str] = None,
-        validate: bool = True,
+        validate: bool = _DEFAULT_VALIDATE,
     ):
         """Modify properties of an existing actor.
 
@@ -259,11 +536,16 @@ class ActorOperations:
         # Find actor using error handling framework
         actor = require_actor(actorName)
 
+        # Clients that re-send state can call this with nothing to change; skip the
+        # engine reads and validation entirely
+        if location is None and rotation is None and scale is None and folder is None and mesh is None:
+            return {"actorName": actorName, "modified": False, "message": f"No changes requested for {actorName}"}
+
         # Apply all modifications
         self._apply_actor_modifications(actor, location, rotation, scale, folder, mesh)
 
         # Build result
-        result = self._build_modification_result(actor, actorName)
+        result = self._build_modification_result(actor, actorName, location, rotation, scale)
 
         # Add validation if requested
         if validate:
@@ -271,6 +553,91 @@ class ActorOperations:
 
         return result
 
+    # Per-entry checks for modify_many, matching modify's input validation
+    _MODIFY_MANY_RULES = (
+        ("location", ListLengthRule(3, allow_none=True)),
+        ("rotation", ListLengthRule(3, allow_none=True)),
+        ("scale", ListLengthRule(3, allow_none=True)),
+        ("folder", TypeRule(str, allow_none=True)),
+        ("mesh", TypeRule(str, allow_none=True)),
+    )
+
+    @validate_inputs({"modifications": [RequiredRule(), TypeRule(list)]})
+    @handle_unreal_errors("modify_actors")
+    @safe_operation("actor")
+    def modify_many(self, modifications: List[Dict[str, Any]], validate: bool = _DEFAULT_VALIDATE):
+        """Modify many actors in a single call.
+
+        Every actor is resolved from one level scan, and all changes are made in
+        one editor transaction with viewport updates suspended.
+
+        Args:
+            modifications: One dict per actor with actorName and any of location,
+                           rotation, scale, folder and mesh, as for actor_modify
+            validate: Whether to validate the modifications
+
+        Returns:
+            dict: Per-actor results for modified actors, names of actors with
+                  nothing to change and per-actor failures
+        """
+        malformed = [f"modifications[{i}]" for i, entry in enumerate(modifications) if not isinstance(entry, dict)]
+        if malformed:
+            raise ValidationError(
+                f"{', '.join(malformed)} must be objects with an actorName",
+                operation="modify_actors",
+                details={"parameter": "modifications", "entries": malformed},
+            )
+
+        actor_index = build_actor_name_index()
+        modified = []
+        skipped = []
+        failed = []
+        # The transaction is entered first so the deferred modify() flush on
+        # leaving DisableViewportUpdates is recorded in the same undo step
+        with unreal.ScopedEditorTransaction("UEMCP Modify Actors"), DisableViewportUpdates():
+            for entry in modifications:
+                actor_name = entry.get("actorName")
+                actor = actor_index.get(actor_name) if isinstance(actor_name, str) else None
+                if actor is None:
+                    failed.append({"actorName": actor_name, "error": f"Actor not found: {actor_name}"})
+                    continue
+
+                errors = []
+                for key, rule in self._MODIFY_MANY_RULES:
+                    error = rule.validate(entry.get(key), key)
+                    if error:
+                        errors.append(error)
+                if errors:
+                    failed.append({"actorName": actor_name, "error": "; ".join(errors)})
+                    continue
+
+                values = [entry.get(key) for key, _ in self._MODIFY_MANY_RULES]
+                if all(value is None for value in values):
+                    skipped.append(actor_name)
+                    continue
+
+                try:
+                    self._apply_actor_modifications(actor, *values)
+                except (ProcessingError, ValidationError) as e:
+                    failed.append({"actorName": actor_name, "error": str(e)})
+                    continue
+
+                modified.append((actor, actor_name, values))
+
+        results = []
+        for actor, actor_name, values in modified:
+            result = self._build_modification_result(actor, actor_name, *values[:3])
+            if validate:
+                self._add_validation_to_result(result, actor, *values)
+            results.append(result)
+
+        return {
+            "modifiedActors": results,
+            "modifiedCount": len(results),
+            "skippedActors": skipped,
+            "failedActors": failed,
+        }
+
     def _apply_actor_modifications(self, actor, location, rotation, scale, folder, mesh):
         """Apply modifications to an actor.
 
@@ -282,11 +649,16 @@ class ActorOperations:
             folder: New folder or None
             mesh: New mesh path or None
         """
-        # Apply transform modifications
-        if location is not None:
+        # Resolve the mesh swap first so a missing asset or component fails
+        # before anything on the actor has changed
+        mesh_swap = self._resolve_mesh_swap(actor, mesh) if mesh is not None else None
+
+        # Apply transform modifications; location and rotation together go through one engine call
+        if location is not None and rotation is not None:
+            actor.set_actor_location_and_rotation(create_vector(location), create_rotator(rotation), False, False)
+        elif location is not None:
             actor.set_actor_location(create_vector(location), False, False)
-
-        if rotation is not None:
+        elif rotation is not None:
             actor.set_actor_rotation(create_rotator(rotation), False)
 
         if scale is not None:
@@ -295,16 +667,21 @@ class ActorOperations:
         if folder is not None:
             actor.set_folder_path(folder)
 
-        # Apply mesh modification if needed
-        if mesh is not None:
-            self._apply_mesh_modification(actor, mesh)
+        if mesh_swap is not None:
+            mesh_component, new_mesh = mesh_swap
+            mesh_component.set_static_mesh(new_mesh)
+            # Force update; inside a batch this is deferred to one call per actor at batch end
+            DisableViewportUpdates.mark_modified(actor)
 
-    def _apply_mesh_modification(self, actor, mesh_path):
-        """Apply mesh modification to an actor.
+    def _resolve_mesh_swap(self, actor, mesh_path):
+        """Look up the component and mesh for a mesh modification.
 
         Args:
             actor: Actor to modify
             mesh_path: Path to new mesh
+
+        Returns:
+            tuple: (StaticMeshComponent, new mesh asset)
         """
         mesh_component = actor.get_component_by_class(unreal.StaticMeshComponent)
         if not mesh_component:
@@ -314,29 +691,40 @@ class ActorOperations:
                 details={"actorName": actor.get_actor_label(), "mesh": mesh_path},
             )
 
-        new_mesh = require_asset(mesh_path)
-        mesh_component.set_static_mesh(new_mesh)
-        actor.modify()  # Force update
+        return mesh_component, require_asset(mesh_path)
 
-    def _build_modification_result(self, actor, actor_name):
+    def _build_modification_result(self, actor, actor_name, location=None, rotation=None, scale=None):
         """Build the result dictionary after modifications.
 
+        Transform values the caller just set are echoed back as given; only the
+        unchanged ones are read from the engine. Validation still reads the
+        actor itself.
+
         Args:
             actor: Modified actor
             actor_name: Name of the actor
+            location: Location that was set, or None
+            rotation: Rotation that was set, or None
+            scale: Scale that was set, or None
 
         Returns:
             dict: Result with actor properties
         """
-        current_location = actor.get_actor_location()
-        current_rotation = actor.get_actor_rotation()
-        current_scale = actor.get_actor_scale3d()
+        if location is None:
+            current_location = actor.get_actor_location()
+            location = [current_location.x, current_location.y, current_location.z]
+        if rotation is None:
+            current_rotation = actor.get_actor_rotation()
+            rotation = [current_rotation.roll, current_rotation.pitch, current_rotation.yaw]
+        if scale is None:
+            current_scale = actor.get_actor_scale3d()
+            scale = [current_scale.x, current_scale.y, current_scale.z]
 
         return {
             "actorName": actor_name,
-            "location": [current_location.x, current_location.y, current_location.z],
-            "rotation": [current_rotation.roll, current_rotation.pitch, current_rotation.yaw],
-            "scale": [current_scale.x, current_scale.y, current_scale.z],
+            "location": [float(v) for v in location],
+            "rotation": [float(v) for v in rotation],
+            "scale": [float(v) for v in scale],
             "message": f"Modified actor: {actor_name}",
         }
 
@@ -352,8 +740,6 @@ class ActorOperations:
             folder: Folder modification or None
             mesh: Mesh modification or None
         """
-        from utils import validate_actor_modifications
-
         # Build modifications dict
         modifications = {}
         for key, value in [
@@ -380,22 +766,30 @@ class ActorOperations:
     @handle_unreal_errors("duplicate_actor")
     @safe_operation("actor")
     def duplicate(
-        self, sourceName: str, name: Optional[str] = None, offset: Optional[Dict] = None, validate: bool = True
+        self,
+        sourceName: str,
+        name: Optional[str] = None,
+        offset: Optional[Dict] = None,
+        validate: bool = _DEFAULT_VALIDATE,
     ):
         """Duplicate an existing actor.
 
         Args:
             sourceName: Name of the actor to duplicate
             name: Name for the new actor
-            offset: Position offset from source
+            offset: Position offset from source, as {x, y, z} or [X, Y, Z]
             validate: Whether to validate the duplication
 
         Returns:
             dict: Result with success status and new actor details
         """
-        # Set default for mutable parameter
+        # OffsetRule accepts both {x, y, z} and [x, y, z]; unpack either form once
         if offset is None:
-            offset = {"x": 0, "y": 0, "z": 0}
+            offset_x = offset_y = offset_z = 0
+        elif isinstance(offset, dict):
+            offset_x, offset_y, offset_z = offset["x"], offset["y"], offset["z"]
+        else:
+            offset_x, offset_y, offset_z = offset
 
         source_actor = require_actor(sourceName)
 
@@ -406,9 +800,7 @@ class ActorOperations:
 
         # Calculate new location with offset
         new_location = unreal.Vector(
-            source_location.x + offset.get("x", 0),
-            source_location.y + offset.get("y", 0),
-            source_location.z + offset.get("z", 0),
+            source_location.x + offset_x, source_location.y + offset_y, source_location.z + offset_z
         )
 
         # Duplicate based on actor type
@@ -438,25 +830,22 @@ class ActorOperations:
         if source_folder:
             new_actor.set_folder_path(source_folder)
 
-        log_debug(f"Duplicated actor {sourceName} to {new_actor.get_actor_label()}")
+        # Read the label and transform components once for both the response and validation
+        new_name = new_actor.get_actor_label()
+        location_x, location_y, location_z = float(new_location.x), float(new_location.y), float(new_location.z)
+        log_debug(f"Duplicated actor {sourceName} to {new_name}")
 
         result = {
-            "actorName": new_actor.get_actor_label(),
-            "location": {"x": float(new_location.x), "y": float(new_location.y), "z": float(new_location.z)},
+            "actorName": new_name,
+            "location": {"x": location_x, "y": location_y, "z": location_z},
         }
 
         # Add validation if requested
         if validate:
-            from utils import validate_actor_spawn
-
             validation_result = validate_actor_spawn(
-                new_actor.get_actor_label(),
-                expected_location=[new_location.x, new_location.y, new_location.z],
-                expected_rotation=[
-                    source_rotation.roll,
-                    source_rotation.pitch,
-                    source_rotation.yaw,
-                ],
+                new_actor,
+                expected_location=[location_x, location_y, location_z],
+                expected_rotation=[source_rotation.roll, source_rotation.pitch, source_rotation.yaw],
                 expected_scale=[source_scale.x, source_scale.y, source_scale.z],
                 expected_folder=str(source_folder) if source_folder else None,
             )
@@ -467,18 +856,22 @@ class ActorOperations:
     @validate_inputs(
         {
             "actors": [TypeRule(list, allow_none=True)],
-            "pattern": [TypeRule(str, allow_none=True)],
+            "pattern": [TypeRule((str, re.Pattern), allow_none=True)],
             "folder": [RequiredRule(), TypeRule(str)],
         }
     )
     @handle_unreal_errors("organize_actors")
     @safe_operation("actor")
-    def organize(self, actors: Optional[List] = None, pattern: Optional[str] = None, folder: str = ""):
+    def organize(
+        self, actors: Optional[List] = None, pattern: Optional[Union[str, re.Pattern]] = None, folder: str = ""
+    ):
         """Organize actors into World Outliner folders.
 
         Args:
             actors: List of specific actor names
-            pattern: Pattern to match actor names
+            pattern: Substring to match in actor names, a whole-name glob opted into
+                     with a "glob:" prefix (e.g. "glob:Wall_*"), or (from Python
+                     callers) a compiled regex searched in each name
             folder: Target folder path
 
         Returns:
@@ -507,6 +900,10 @@ class ActorOperations:
     def _organize_actors_by_criteria(self, all_actors, actor_names, pattern, folder):
         """Organize actors based on names or pattern.
 
+        Matching actors are collected first and then moved in a single pass
+        inside one editor transaction with viewport updates suspended, so the
+        editor does not redraw after every folder change.
+
         Args:
             all_actors: List of all actors in level
             actor_names: Specific actor names to organize
@@ -516,31 +913,38 @@ class ActorOperations:
         Returns:
             list: Names of organized actors
         """
-        organized_actors = []
+        matches = self._build_name_matcher(actor_names, pattern)
+        if matches is None:
+            return []
 
+        matched = []
         for actor in all_actors:
             if not self._is_valid_actor(actor):
                 continue
 
-            # Safely get actor name
-            if not hasattr(actor, "get_actor_label"):
-                continue
-
             actor_name = actor.get_actor_label()
             if not actor_name:
                 continue
 
             # Check if actor matches criteria
-            if self._actor_matches_criteria(actor_name, actor_names, pattern):
-                # Safely set folder path
-                if hasattr(actor, "set_folder_path"):
-                    actor.set_folder_path(folder)
-                    organized_actors.append(actor_name)
+            if matches(actor_name) and hasattr(actor, "set_folder_path"):
+                matched.append((actor, actor_name))
+
+        if not matched:
+            return []
+
+        # A single transaction makes the move one undo step with one round of outliner notifications
+        with DisableViewportUpdates(), unreal.ScopedEditorTransaction("UEMCP Organize Actors"):
+            for actor, _ in matched:
+                actor.set_folder_path(folder)
 
-        return organized_actors
+        return [actor_name for _, actor_name in matched]
 
     def _is_valid_actor(self, actor):
-        """Check if actor is valid and has required attributes.
+        """Check if actor is a live level actor.
+
+        A type check is a cheap C-level slot lookup, whereas hasattr on an engine
+        object goes through reflection for every actor in the level.
 
         Args:
             actor: Actor to check
@@ -548,35 +952,51 @@ class ActorOperations:
         Returns:
             bool: True if actor is valid
         """
-        return actor and hasattr(actor, "get_actor_label")
+        return isinstance(actor, unreal.Actor)
+
+    @staticmethod
+    def _build_name_matcher(actor_names, pattern):
+        """Build the name predicate for organize once, before scanning the level.
 
-    def _actor_matches_criteria(self, actor_name, actor_names, pattern):
-        """Check if actor name matches organization criteria.
+        Name lists become a set so each check is O(1). Compiled regexes are
+        searched as given. Patterns prefixed with ``glob:`` are compiled once to
+        a regex matching the whole name; every other pattern keeps its substring
+        behaviour, so e.g. "Light[0]" matches literally.
 
         Args:
-            actor_name: Name of the actor
-            actor_names: List of specific names to match
+            actor_names: Specific actor names to match
             pattern: Pattern to match in name
 
         Returns:
-            bool: True if actor matches criteria
+            callable or None: Predicate taking an actor name, or None if no criteria
         """
         if actor_names:
-            return actor_name in actor_names
-        elif pattern:
-            return pattern in actor_name
-        return False
+            return set(actor_names).__contains__
+        if isinstance(pattern, re.Pattern):
+            return lambda actor_name: pattern.search(actor_name) is not None
+        if pattern:
+            if pattern.startswith(_GLOB_PREFIX):
+                regex = re.compile(fnmatch.translate(pattern[len(_GLOB_PREFIX) :]))
+                return lambda actor_name: regex.match(actor_name) is not None
+            return lambda actor_name: pattern in actor_name
+        return None
 
     @validate_inputs({"actors": [RequiredRule(), TypeRule(list)]})
     @handle_unreal_errors("batch_spawn_actors")
     @safe_operation("actor")
-    def batch_spawn(self, actors: List[Dict[str, Any]], commonFolder: Optional[str] = None, validate: bool = True):
+    def batch_spawn(
+        self,
+        actors: List[Dict[str, Any]],
+        commonFolder: Optional[str] = None,
+        validate: bool = _DEFAULT_VALIDATE,
+    ):
         """Spawn multiple actors efficiently in a single operation.
 
         Args:
             actors: List of actor configurations to spawn
             commonFolder: Optional common folder for all spawned actors
-            validate: Whether to validate spawns after creation (default: True).
+            validate: Whether to validate spawns after creation (default: True,
+                     or False when UEMCP_VALIDATE=0).
                      Note: For large batches (>100 actors), validation may add
                      0.5-2 seconds. Set to False for maximum performance if you are
                      confident in the spawn parameters.
@@ -584,14 +1004,14 @@ class ActorOperations:
         Returns:
             dict: Results with spawned actors and any failures
         """
-        import time
-
         start_time = time.time()
         spawned_actors = []
         failed_spawns = []
 
-        # Manage viewport for performance, restoring on exit regardless of errors
-        with DisableViewportUpdates():
+        # Manage viewport for performance, restoring on exit regardless of errors.
+        # One editor transaction covers the whole batch, so it is a single undo step
+        # and the editor sends its change notifications once rather than per spawn.
+        with DisableViewportUpdates(), unreal.ScopedEditorTransaction("UEMCP Batch Spawn"):
             self._spawn_actors_batch_loop(actors, commonFolder, spawned_actors, failed_spawns)
 
         execution_time = time.time() - start_time
@@ -613,6 +1033,12 @@ class ActorOperations:
     def _spawn_actors_batch_loop(self, actors, commonFolder, spawned_actors, failed_spawns):
         """Spawn actors in a loop, collecting results without framework interference.
 
+        Spawning happens in two passes: every actor is spawned first, then
+        labels, folders and tags are applied in a single follow-up pass so the
+        World Outliner is not re-sorted between individual spawns. Assets are
+        loaded once per unique path, since batches typically reuse a handful
+        of meshes for many actors.
+
         Args:
             actors: List of actor configurations
             commonFolder: Common folder for all actors
@@ -622,21 +1048,36 @@ class ActorOperations:
         Returns:
             None
         """
+        pending = []
+        asset_cache = {}
+        # Modular builds reuse a few rotations (0/90/180/-90 yaw); share one Rotator per distinct value
+        rotator_cache = {}
+        # Resolve the subsystem's spawn method once rather than per actor
+        spawn_from_object = get_actor_subsystem().spawn_actor_from_object
         for actor_config in actors:
-            result = self._spawn_single_batch_actor(actor_config, commonFolder)
+            result = self._spawn_single_batch_actor(actor_config, asset_cache, spawn_from_object, rotator_cache)
             if result["success"]:
-                spawned_actors.append(result["actor_data"])
+                pending.append((result["actor_data"], actor_config))
             else:
                 failed_spawns.append(result["error_data"])
 
+        for actor_data, actor_config in pending:
+            actor_data["name"] = self._configure_spawned_actor(actor_data["_actor_ref"], actor_config, commonFolder)
+            spawned_actors.append(actor_data)
+
         return None
 
-    def _spawn_single_batch_actor(self, actor_config, common_folder):
+    def _spawn_single_batch_actor(self, actor_config, asset_cache, spawn_from_object, rotator_cache):
         """Spawn a single actor from batch configuration.
 
+        The actor is left unconfigured; labels, folders and tags are applied
+        afterwards by ``_configure_spawned_actor``.
+
         Args:
             actor_config: Actor configuration dict
-            common_folder: Common folder for all actors
+            asset_cache: Dict of asset path -> loaded asset (or None) shared across the batch
+            spawn_from_object: Bound EditorActorSubsystem.spawn_actor_from_object
+            rotator_cache: Dict of rotation tuple -> unreal.Rotator shared across the batch
 
         Returns:
             dict: Result with success status and actor data or error
@@ -646,7 +1087,9 @@ class ActorOperations:
         if not asset_path:
             return {"success": False, "error_data": {"assetPath": "Unknown", "error": "Missing required assetPath"}}
 
-        asset = load_asset(asset_path)
+        if asset_path not in asset_cache:
+            asset_cache[asset_path] = load_asset(asset_path)
+        asset = asset_cache[asset_path]
         if not asset:
             return {
                 "success": False,
@@ -654,17 +1097,14 @@ class ActorOperations:
             }
 
         # Spawn actor
-        spawned_actor = self._spawn_actor_with_params(asset, actor_config)
+        spawned_actor = self._spawn_actor_with_params(asset, actor_config, spawn_from_object, rotator_cache)
         if not spawned_actor:
             return {
                 "success": False,
                 "error_data": {"assetPath": asset_path, "error": "Spawn failed - check location for collisions"},
             }
 
-        # Configure spawned actor
-        actor_name = self._configure_spawned_actor(spawned_actor, actor_config, common_folder)
-
-        # Build actor data
+        # Build actor data (name is filled in once the actor is configured)
         location = actor_config.get("location", [0, 0, 0])
         rotation = actor_config.get("rotation", [0, 0, 0])
         scale = actor_config.get("scale", [1, 1, 1])
@@ -672,7 +1112,7 @@ class ActorOperations:
         return {
             "success": True,
             "actor_data": {
-                "name": actor_name,
+                "name": None,
                 "assetPath": asset_path,
                 "location": location,
                 "rotation": rotation,
@@ -681,24 +1121,32 @@ class ActorOperations:
             },
         }
 
-    def _spawn_actor_with_params(self, asset, actor_config):
+    def _spawn_actor_with_params(self, asset, actor_config, spawn_from_object, rotator_cache):
         """Spawn an actor with given parameters.
 
         Args:
             asset: Asset to spawn
             actor_config: Actor configuration
+            spawn_from_object: Bound EditorActorSubsystem.spawn_actor_from_object
+            rotator_cache: Dict of rotation tuple -> unreal.Rotator shared across the batch
 
         Returns:
             Spawned actor or None
         """
-        location = unreal.Vector(*actor_config.get("location", [0, 0, 0]))
-        rotation = unreal.Rotator(*actor_config.get("rotation", [0, 0, 0]))
-        scale = unreal.Vector(*actor_config.get("scale", [1, 1, 1]))
-
-        editor_actor_subsystem = get_actor_subsystem()
-        spawned_actor = editor_actor_subsystem.spawn_actor_from_object(asset, location, rotation)
-        if spawned_actor:
-            spawned_actor.set_actor_scale3d(scale)
+        vector = unreal.Vector
+        loc = actor_config.get("location") or _ORIGIN
+        location = vector(loc[0], loc[1], loc[2])
+        rotation_key = tuple(actor_config.get("rotation") or _ORIGIN)
+        rotation = rotator_cache.get(rotation_key)
+        if rotation is None:
+            # Spawning copies the struct, so one Rotator can safely back every actor with this rotation
+            rotation = rotator_cache[rotation_key] = unreal.Rotator(*rotation_key)
+        scale = actor_config.get("scale")
+
+        spawned_actor = spawn_from_object(asset, location, rotation)
+        # Actors spawn at unit scale; skip the extra struct and reflection call when nothing changes
+        if spawned_actor and scale and tuple(scale) != _UNIT_SCALE:
+            spawned_actor.set_actor_scale3d(vector(scale[0], scale[1], scale[2]))
         return spawned_actor
 
     def _configure_spawned_actor(self, spawned_actor, actor_config, common_folder):
@@ -750,12 +1198,14 @@ class ActorOperations:
         validated_actors = []
         validation_failures = []
 
+        # One level query plus set membership, rather than a per-actor engine call
+        level_actors = set(get_actor_subsystem().get_all_level_actors())
+
         for actor_data in spawned_actors:
-            actor_ref = actor_data.get("_actor_ref")
+            actor_ref = actor_data.pop("_actor_ref", None)
 
-            if actor_ref:
-                clean_data = {k: v for k, v in actor_data.items() if k != "_actor_ref"}
-                validated_actors.append(clean_data)
+            if actor_ref is not None and actor_ref in level_actors:
+                validated_actors.append(actor_data)
             else:
                 validation_failures.append(
                     {
@@ -769,13 +1219,18 @@ class ActorOperations:
     def _clean_actor_refs(self, spawned_actors):
         """Remove actor references from data.
 
+        The dicts are built by this batch and not shared, so the reference is
+        dropped in place rather than copying every dict.
+
         Args:
             spawned_actors: List of actor data with references
 
         Returns:
             list: Cleaned actor data
         """
-        return [{k: v for k, v in actor_data.items() if k != "_actor_ref"} for actor_data in spawned_actors]
+        for actor_data in spawned_actors:
+            actor_data.pop("_actor_ref", None)
+        return spawned_actors
 
     @validate_inputs(
         {
@@ -804,8 +1259,6 @@ class ActorOperations:
         Returns:
             dict: Detailed validation results with gaps, overlaps, and alignment issues
         """
-        import time
-
         start_time = time.time()
         GAP_THRESHOLD = 3  # Maximum number of gaps before marking as major issues
 
@@ -814,8 +1267,8 @@ class ActorOperations:
         if error:
             raise ValidationError(f"Actor data gathering failed: {error}")
 
-        # Detect placement issues
-        gaps, overlaps = self._detect_placement_issues(actor_data, tolerance, modularSize)
+        # Detect placement issues; overlap severities are counted as they are found
+        gaps, overlaps, severity_counts = self._detect_placement_issues(actor_data, tolerance, modularSize)
 
         # Check alignment if requested
         alignment_issues = []
@@ -824,9 +1277,11 @@ class ActorOperations:
 
         # Generate summary and status
         execution_time = time.time() - start_time
-        overall_status = self._determine_overall_status(gaps, overlaps, alignment_issues, GAP_THRESHOLD)
+        overall_status = self._determine_overall_status(
+            severity_counts, gaps, overlaps, alignment_issues, GAP_THRESHOLD
+        )
         return self._build_validation_result(
-            gaps, overlaps, alignment_issues, overall_status, len(actors), execution_time
+            severity_counts, gaps, overlaps, alignment_issues, overall_status, len(actors), execution_time
         )
 
     def _gather_actor_data(self, actor_names):
@@ -838,18 +1293,8 @@ class ActorOperations:
         Returns:
             tuple: (actor_data list, error message or None)
         """
-        # Pre-build label→actor dict to avoid O(N*M) find_actor_by_name calls
-        all_level_actors = get_actor_subsystem().get_all_level_actors()
-        actor_lookup: dict = {}
-        for a in all_level_actors:
-            if not a or not hasattr(a, "get_actor_label"):
-                continue
-            try:
-                label = a.get_actor_label()
-                if label not in actor_lookup:
-                    actor_lookup[label] = a
-            except Exception as e:
-                log_debug(f"Skipping actor due to label access error: {e}")
+        # One level scan resolves every name, rather than a find_actor_by_name scan per name
+        actor_lookup = build_actor_name_index()
 
         actor_objects = []
         missing_actors = []
@@ -857,7 +1302,7 @@ class ActorOperations:
         for actor_name in actor_names:
             actor = actor_lookup.get(actor_name)
             if actor:
-                actor_objects.append(actor)
+                actor_objects.append((actor_name, actor))
             else:
                 missing_actors.append(actor_name)
 
@@ -867,10 +1312,10 @@ class ActorOperations:
         if len(actor_objects) < 2:
             return None, "At least 2 actors are required for placement validation"
 
-        # Get bounds for each actor
+        # Get bounds for each actor; the label is already known from the lookup
         actor_data = []
-        for actor in actor_objects:
-            bounds_info = self._get_actor_bounds_info(actor)
+        for actor_name, actor in actor_objects:
+            bounds_info = self._get_actor_bounds_info(actor, actor_name)
             if bounds_info:
                 actor_data.append(bounds_info)
 
@@ -879,39 +1324,46 @@ class ActorOperations:
 
         return actor_data, None
 
-    def _get_actor_bounds_info(self, actor):
+    def _get_actor_bounds_info(self, actor, name=None):
         """Get bounds information for a single actor.
 
+        Only the location and bounds are read from the engine; callers that
+        resolved the actor by label pass it in rather than reading it again.
+
         Args:
             actor: Actor to get bounds for
+            name: Actor label, if already known
 
         Returns:
-            dict or None: Actor bounds information
+            ActorBoundsInfo or None: Actor bounds information
         """
-        if not actor or not hasattr(actor, "get_actor_location"):
+        if not actor:
             return None
 
         location = actor.get_actor_location()
-        if not hasattr(actor, "get_actor_bounds"):
-            return None
-
         bounds = actor.get_actor_bounds(only_colliding_components=False)
         if not bounds or len(bounds) < 2:
             return None
 
         box_extent = bounds[1]  # bounds[1] is the extent (half-size)
 
-        return {
-            "actor": actor,
-            "name": actor.get_actor_label(),
-            "location": [location.x, location.y, location.z],
-            "bounds_min": [location.x - box_extent.x, location.y - box_extent.y, location.z - box_extent.z],
-            "bounds_max": [location.x + box_extent.x, location.y + box_extent.y, location.z + box_extent.z],
-            "size": [box_extent.x * 2, box_extent.y * 2, box_extent.z * 2],
-        }
+        # Read each component off the engine structs once and do the math on floats
+        lx, ly, lz = location.x, location.y, location.z
+        ex, ey, ez = box_extent.x, box_extent.y, box_extent.z
+
+        return ActorBoundsInfo(
+            actor,
+            name if name is not None else actor.get_actor_label(),
+            [lx, ly, lz],
+            [lx - ex, ly - ey, lz - ez],
+            [lx + ex, ly + ey, lz + ez],
+        )
 
     def _detect_placement_issues(self, actor_data, tolerance, modular_size):
-        """Detect gaps and overlaps between actors.
+        """Detect gaps and overlaps between neighbouring actors.
+
+        Actors more than ``max(tolerance, modular_size)`` apart on any axis are
+        not compared.
 
         Args:
             actor_data: List of actor bounds data
@@ -919,24 +1371,37 @@ class ActorOperations:
             modular_size: Size of modular grid
 
         Returns:
-            tuple: (gaps list, overlaps list)
+            tuple: (gaps list, overlaps list, (critical, major) overlap counts)
         """
         gaps = []
         overlaps = []
+        severity_counts = {"critical": 0, "major": 0, "minor": 0}
+
+        # Split the per-actor records into parallel lists once, so the pair loop below
+        # indexes lists instead of repeating the same field lookups for every pair
+        mins = [a.bounds_min for a in actor_data]
+        maxs = [a.bounds_max for a in actor_data]
+
+        # First pass: classify neighbouring pairs numerically, keeping only the
+        # (usually few) pairs that exceed the tolerance. Pieces further apart than
+        # one module are not adjacent, so their separation is not a placement gap.
+        hits = _scan_pairs(mins, maxs, tolerance, max(tolerance, modular_size))
+
+        # Severity thresholds depend only on the grid size, so work them out once
+        severity_thresholds = (modular_size * _CRITICAL_OVERLAP_RATIO, modular_size * _MAJOR_OVERLAP_RATIO)
+
+        # Second pass: only reported pairs pay for location math and result dicts
+        for i, j, kind, distance, axis in hits:
+            actor1, actor2 = actor_data[i], actor_data[j]
+            gap_overlap = self._gap_overlap_result(actor1, actor2, kind, distance, axis)
+            if kind == _GAP:
+                gaps.append(self._format_gap_info(gap_overlap, actor1, actor2))
+            else:
+                overlap_info = self._format_overlap_info(gap_overlap, actor1, actor2, severity_thresholds)
+                severity_counts[overlap_info["severity"]] += 1
+                overlaps.append(overlap_info)
 
-        for i, actor1 in enumerate(actor_data):
-            for j, actor2 in enumerate(actor_data):
-                if i >= j:  # Avoid duplicate checks
-                    continue
-
-                gap_overlap = self._calculate_gap_overlap(actor1, actor2, tolerance)
-
-                if gap_overlap["type"] == "gap" and gap_overlap["distance"] > tolerance:
-                    gaps.append(self._format_gap_info(gap_overlap, actor1, actor2))
-                elif gap_overlap["type"] == "overlap" and gap_overlap["distance"] > tolerance:
-                    overlaps.append(self._format_overlap_info(gap_overlap, actor1, actor2, modular_size))
-
-        return gaps, overlaps
+        return gaps, overlaps, (severity_counts["critical"], severity_counts["major"])
 
     def _format_gap_info(self, gap_overlap, actor1, actor2):
         """Format gap information for output.
@@ -952,43 +1417,44 @@ class ActorOperations:
         return {
             "location": gap_overlap["location"],
             "distance": gap_overlap["distance"],
-            "actors": [actor1["name"], actor2["name"]],
+            "actors": [actor1.name, actor2.name],
             "direction": gap_overlap["direction"],
         }
 
-    def _format_overlap_info(self, gap_overlap, actor1, actor2, modular_size):
+    def _format_overlap_info(self, gap_overlap, actor1, actor2, severity_thresholds):
         """Format overlap information with severity.
 
         Args:
             gap_overlap: Gap/overlap calculation result
             actor1: First actor data
             actor2: Second actor data
-            modular_size: Size of modular grid
+            severity_thresholds: (critical, major) overlap distances for the modular grid
 
         Returns:
             dict: Formatted overlap information
         """
-        severity = self._calculate_overlap_severity(gap_overlap["distance"], modular_size)
+        severity = self._calculate_overlap_severity(gap_overlap["distance"], *severity_thresholds)
         return {
             "location": gap_overlap["location"],
             "amount": gap_overlap["distance"],
-            "actors": [actor1["name"], actor2["name"]],
+            "actors": [actor1.name, actor2.name],
             "severity": severity,
         }
 
-    def _calculate_overlap_severity(self, distance, modular_size):
+    def _calculate_overlap_severity(self, distance, critical_threshold, major_threshold):
         """Calculate severity of overlap.
 
         Args:
             distance: Overlap distance
-            modular_size: Size of modular grid
+            critical_threshold: Overlaps deeper than this are critical
+            major_threshold: Overlaps deeper than this are major
 
         Returns:
             str: Severity level
         """
-        if distance > modular_size * 0.25:  # >25% of modular size
+        if distance > critical_threshold:
             return "critical"
-        elif distance > modular_size * 0.1:  # >10% of modular size
+        elif distance > major_threshold:
             return "major"
         else:
             return "minor"
@@ -996,6 +1462,11 @@ class ActorOperations:
     def _check_all_alignments(self, actor_data, modular_size, tolerance):
         """Check alignment for all actors.
 
+        Only X and Y are checked because Z is typically not critical for modular
+        building pieces. Each actor's grid offsets are computed once; the report
+        dict is built only for actors that are off-grid, naming the first
+        offending axis.
+
         Args:
             actor_data: List of actor bounds data
             modular_size: Size of modular grid
@@ -1006,15 +1477,40 @@ class ActorOperations:
         """
         alignment_issues = []
         for actor_info in actor_data:
-            alignment_issue = self._check_modular_alignment(actor_info, modular_size, tolerance)
-            if alignment_issue:
-                alignment_issues.append(alignment_issue)
+            location = actor_info.location
+            x, y = location[0], location[1]
+            # Nearest grid position on each axis
+            grid_x = round(x / modular_size) * modular_size
+            grid_y = round(y / modular_size) * modular_size
+            offset_x, offset_y = x - grid_x, y - grid_y
+
+            if abs(offset_x) > tolerance:
+                suggested = [grid_x, y, location[2]]
+                offset = [offset_x, 0, 0]
+                axis = "X"
+            elif abs(offset_y) > tolerance:
+                suggested = [x, grid_y, location[2]]
+                offset = [0, offset_y, 0]
+                axis = "Y"
+            else:
+                continue
+
+            alignment_issues.append(
+                {
+                    "actor": actor_info.name,
+                    "currentLocation": location,
+                    "suggestedLocation": suggested,
+                    "offset": offset,
+                    "axis": axis,
+                }
+            )
         return alignment_issues
 
-    def _determine_overall_status(self, gaps, overlaps, alignment_issues, gap_threshold):
+    def _determine_overall_status(self, severity_counts, gaps, overlaps, alignment_issues, gap_threshold):
         """Determine overall validation status.
 
         Args:
+            severity_counts: (critical, major) overlap counts from _detect_placement_issues
             gaps: List of gaps
             overlaps: List of overlaps
             alignment_issues: List of alignment issues
@@ -1023,8 +1519,7 @@ class ActorOperations:
         Returns:
             str: Overall status
         """
-        critical_overlaps = sum(1 for o in overlaps if o["severity"] == "critical")
-        major_overlaps = sum(1 for o in overlaps if o["severity"] == "major")
+        critical_overlaps, major_overlaps = severity_counts
         total_issues = len(gaps) + len(overlaps) + len(alignment_issues)
 
         if critical_overlaps > 0:
@@ -1036,10 +1531,13 @@ class ActorOperations:
         else:
             return "good"
 
-    def _build_validation_result(self, gaps, overlaps, alignment_issues, overall_status, total_actors, execution_time):
+    def _build_validation_result(
+        self, severity_counts, gaps, overlaps, alignment_issues, overall_status, total_actors, execution_time
+    ):
         """Build the final validation result.
 
         Args:
+            severity_counts: (critical, major) overlap counts from _detect_placement_issues
             gaps: List of gaps
             overlaps: List of overlaps
             alignment_issues: List of alignment issues
@@ -1050,8 +1548,7 @@ class ActorOperations:
         Returns:
             dict: Validation result
         """
-        critical_overlaps = sum(1 for o in overlaps if o["severity"] == "critical")
-        major_overlaps = sum(1 for o in overlaps if o["severity"] == "major")
+        critical_overlaps, major_overlaps = severity_counts
         total_issues = len(gaps) + len(overlaps) + len(alignment_issues)
 
         return {
@@ -1072,109 +1569,66 @@ class ActorOperations:
             },
         }
 
-    @staticmethod
-    def _calculate_axis_gaps(actor1, actor2):
-        """Return [x_gap, y_gap, z_gap] — minimum separation on each axis (0 if touching/overlapping)."""
-        return [
-            max(
-                0,
-                max(
-                    actor1["bounds_min"][i] - actor2["bounds_max"][i], actor2["bounds_min"][i] - actor1["bounds_max"][i]
-                ),
-            )
-            for i in range(3)
-        ]
+    def _calculate_gap_overlap(self, actor1, actor2, _tolerance):
+        """Calculate gap or overlap between two actors."""
+        kind, distance, axis = self._pair_gap_overlap(
+            actor1.bounds_min, actor1.bounds_max, actor2.bounds_min, actor2.bounds_max
+        )
+        return self._gap_overlap_result(actor1, actor2, kind, distance, axis)
 
     @staticmethod
-    def _calculate_axis_overlaps(actor1, actor2):
-        """Return [x_overlap, y_overlap, z_overlap] — intersection depth on each axis (0 if separated)."""
-        return [
-            max(
-                0,
-                min(actor1["bounds_max"][i], actor2["bounds_max"][i])
-                - max(actor1["bounds_min"][i], actor2["bounds_min"][i]),
-            )
-            for i in range(3)
-        ]
+    def _pair_gap_overlap(min1, max1, min2, max2):
+        """Classify two bounding boxes as separated, overlapping or touching.
 
-    def _calculate_gap_overlap(self, actor1, actor2, _tolerance):
-        """Calculate gap or overlap between two actors."""
-        gaps = self._calculate_axis_gaps(actor1, actor2)
-        overlaps = self._calculate_axis_overlaps(actor1, actor2)
-        axis_names = ["X", "Y", "Z"]
-
-        # If there's any gap, find the smallest gap
-        if any(gap > 0 for gap in gaps):
-            min_gap_index = gaps.index(min(gap for gap in gaps if gap > 0))
-            midpoint = [(actor1["location"][i] + actor2["location"][i]) / 2 for i in range(3)]
-            return {
-                "type": "gap",
-                "distance": gaps[min_gap_index],
-                "location": midpoint,
-                "direction": axis_names[min_gap_index],
-            }
+        Per axis, the two bounds intervals intersect over [max(mins), min(maxes)];
+        a negative length is a gap and a positive one is the overlap depth, so a
+        single pass over the three axes yields both. Only scalars are returned so
+        pairs that are not reported never allocate anything.
 
-        # If there's overlap, find the largest overlap
-        if any(overlap > 0 for overlap in overlaps):
-            max_overlap_index = overlaps.index(max(overlaps))
-            overlap_center = [
-                (
-                    max(actor1["bounds_min"][i], actor2["bounds_min"][i])
-                    + min(actor1["bounds_max"][i], actor2["bounds_max"][i])
-                )
-                / 2
+        Returns:
+            tuple: (kind, distance, axis index or None), kind being _GAP, _OVERLAP
+            or _TOUCHING. Gaps report the smallest separation, overlaps the deepest
+            axis; ties keep the first axis (X before Y before Z).
+        """
+        gap_axis = overlap_axis = None
+        min_gap = max_overlap = 0
+        for i in range(3):
+            low = min1[i] if min1[i] > min2[i] else min2[i]
+            high = max1[i] if max1[i] < max2[i] else max2[i]
+            depth = high - low
+            if depth < 0 and (gap_axis is None or -depth < min_gap):
+                gap_axis, min_gap = i, -depth
+            elif depth > max_overlap:
+                overlap_axis, max_overlap = i, depth
+
+        if gap_axis is not None:
+            return _GAP, min_gap, gap_axis
+        if overlap_axis is not None:
+            return _OVERLAP, max_overlap, overlap_axis
+        return _TOUCHING, 0, None
+
+    @staticmethod
+    def _gap_overlap_result(actor1, actor2, kind, distance, axis):
+        """Build the gap/overlap dict for a classified pair of actors."""
+        if kind == _OVERLAP:
+            # Centre of the intersection box
+            min1, max1, min2, max2 = actor1.bounds_min, actor1.bounds_max, actor2.bounds_min, actor2.bounds_max
+            location = [
+                ((min1[i] if min1[i] > min2[i] else min2[i]) + (max1[i] if max1[i] < max2[i] else max2[i])) / 2
                 for i in range(3)
             ]
-            return {
-                "type": "overlap",
-                "distance": overlaps[max_overlap_index],
-                "location": overlap_center,
-                "direction": axis_names[max_overlap_index],
-            }
+        else:
+            # Midpoint between the actors (gaps, and touching actors)
+            loc1, loc2 = actor1.location, actor2.location
+            location = [(loc1[i] + loc2[i]) / 2 for i in range(3)]
 
-        # Actors are touching (within tolerance)
         return {
-            "type": "touching",
-            "distance": 0,
-            "location": [(actor1["location"][i] + actor2["location"][i]) / 2 for i in range(3)],
-            "direction": "None",
+            "type": _PAIR_KINDS[kind],
+            "distance": distance,
+            "location": location,
+            "direction": _AXIS_NAMES[axis] if axis is not None else "None",
         }
 
-    def _check_modular_alignment(self, actor_info, modular_size, tolerance):
-        """Check if an actor is aligned to the modular grid."""
-        location = actor_info["location"]
-        name = actor_info["name"]
-
-        # Only X and Y axes are checked for alignment because Z is typically not critical for modular building pieces.
-        # Check alignment on X and Y axes (Z is usually fine for building
-        # pieces)
-
-        for axis_index, axis_name in enumerate(["X", "Y"]):
-            coord = location[axis_index]
-
-            # Find nearest grid position
-            nearest_grid = round(coord / modular_size) * modular_size
-            offset = coord - nearest_grid
-
-            if abs(offset) > tolerance:
-                # Create suggested position
-                suggested_location = location.copy()
-                suggested_location[axis_index] = nearest_grid
-
-                # Create offset array with proper indexing
-                offset_array = [0, 0, 0]
-                offset_array[axis_index] = offset
-
-                return {
-                    "actor": name,
-                    "currentLocation": location,
-                    "suggestedLocation": suggested_location,
-                    "offset": offset_array,
-                    "axis": axis_name,
-                }
-
-        return None
-
     @validate_inputs(
         {
             "sourceActor": [RequiredRule(), TypeRule(str)],
@@ -1194,7 +1648,7 @@ class ActorOperations:
         targetSocket: str,
         sourceSocket: Optional[str] = None,
         offset: Optional[Dict] = None,
-        validate: bool = True,
+        validate: bool = _DEFAULT_VALIDATE,
     ):
         """Snap an actor to another actor's socket for precise modular placement.
 
@@ -1213,9 +1667,11 @@ class ActorOperations:
         if offset is None:
             offset = {"x": 0, "y": 0, "z": 0}
 
-        # Find the actors using require_actor for automatic error handling
-        source = require_actor(sourceActor)
-        target = require_actor(targetActor)
+        # Find the actors using require_actor for automatic error handling,
+        # resolving both names from a single level scan
+        actor_index = build_actor_name_index()
+        source = require_actor(sourceActor, actor_index)
+        target = require_actor(targetActor, actor_index)
 
         # Get the target socket transform (raises ProcessingError on failure)
         socket_transform = self._get_target_socket_transform(target, targetActor, targetSocket)
@@ -1239,6 +1695,124 @@ class ActorOperations:
 
         return result
 
+    @validate_inputs(
+        {
+            "sourceActors": [RequiredRule(), TypeRule(list)],
+            "targetActor": [RequiredRule(), TypeRule(str)],
+            "targetSocket": [RequiredRule(), TypeRule(str)],
+            "sourceSocket": [TypeRule(str, allow_none=True)],
+            "offsets": [TypeRule(list, allow_none=True)],
+            "validate": [TypeRule(bool)],
+        }
+    )
+    @handle_unreal_errors("snap_batch")
+    @safe_operation("actor")
+    def snap_batch(
+        self,
+        sourceActors: List[str],
+        targetActor: str,
+        targetSocket: str,
+        sourceSocket: Optional[str] = None,
+        offsets: Optional[List] = None,
+        validate: bool = _DEFAULT_VALIDATE,
+    ):
+        """Snap many actors to the same socket of one target actor in a single call.
+
+        The level is scanned once to resolve every name and the target socket
+        transform is looked up once for the whole batch. All moves happen in one
+        editor transaction with viewport updates suspended.
+
+        Args:
+            sourceActors: Names of the actors to snap (will be moved)
+            targetActor: Name of the target actor with the socket
+            targetSocket: Name of the socket on the target actor
+            sourceSocket: Optional socket on each source actor to align (defaults to pivot)
+            offsets: Optional per-actor offsets from the socket position, parallel to
+                     sourceActors; each is [X, Y, Z] or {x, y, z}
+            validate: Whether to validate the snapped positions
+
+        Returns:
+            dict: Snapped actor names with parallel new locations, the shared rotation
+                  and any per-actor failures
+        """
+        if offsets is not None and len(offsets) != len(sourceActors):
+            raise ValidationError(
+                f"offsets has {len(offsets)} entries but sourceActors has {len(sourceActors)}",
+                operation="snap_batch",
+            )
+        if targetActor in sourceActors:
+            # Snapping the target would move the socket the other sources snap to
+            raise ValidationError(
+                f"targetActor {targetActor} cannot also be in sourceActors",
+                operation="snap_batch",
+                details={"parameter": "sourceActors", "value": targetActor},
+            )
+        if offsets is not None:
+            # Reject malformed offsets before anything is moved
+            offset_rule = OffsetRule()
+            offset_errors = [
+                error
+                for error in (offset_rule.validate(entry, f"offsets[{i}]") for i, entry in enumerate(offsets))
+                if error
+            ]
+            if offset_errors:
+                raise ValidationError(
+                    "; ".join(offset_errors),
+                    operation="snap_batch",
+                    details={"parameter": "offsets", "errors": offset_errors},
+                )
+
+        actor_index = build_actor_name_index()
+        target = require_actor(targetActor, actor_index)
+
+        # Every source snaps to the same socket, so resolve its transform once
+        socket_transform = self._get_target_socket_transform(target, targetActor, targetSocket)
+        socket_location = socket_transform.translation
+        new_rotation = socket_transform.rotation.rotator()
+
+        snapped = []
+        new_locations = []
+        moved = []
+        failed = []
+        with DisableViewportUpdates(), unreal.ScopedEditorTransaction("UEMCP Snap Batch"):
+            for index, source_name in enumerate(sourceActors):
+                source = actor_index.get(source_name)
+                if source is None:
+                    failed.append({"actorName": source_name, "error": f"Actor not found: {source_name}"})
+                    continue
+
+                offset = offsets[index] if offsets is not None else None
+                new_location = self._snap_location(socket_location, new_rotation, offset, source, sourceSocket)
+                source.set_actor_location(new_location, sweep=False, teleport=True)
+                source.set_actor_rotation(new_rotation)
+
+                snapped.append(source_name)
+                new_locations.append([new_location.x, new_location.y, new_location.z])
+                moved.append((source_name, source, new_location))
+
+        log_debug(f"Snapped {len(snapped)} actors to {targetActor}'s socket '{targetSocket}'")
+
+        result = {
+            "targetActor": targetActor,
+            "targetSocket": targetSocket,
+            "snappedActors": snapped,
+            "newLocations": new_locations,
+            "newRotation": [new_rotation.roll, new_rotation.pitch, new_rotation.yaw],
+            "snappedCount": len(snapped),
+            "failedActors": failed,
+        }
+
+        if sourceSocket:
+            result["sourceSocket"] = sourceSocket
+
+        if validate:
+            mismatched = [
+                name for name, source, location in moved if not self._validate_snap(source, location)["success"]
+            ]
+            result["validation"] = {"success": not mismatched, "mismatchedActors": mismatched}
+
+        return result
+
     def _get_target_socket_transform(self, target, targetActor, targetSocket):
         """Get the target socket transform.
 
@@ -1312,9 +1886,16 @@ class ActorOperations:
         Returns:
             tuple: (new_location, new_rotation)
         """
-        new_location = socket_transform.translation
         new_rotation = socket_transform.rotation.rotator()
+        new_location = self._snap_location(socket_transform.translation, new_rotation, offset, source, sourceSocket)
+        return new_location, new_rotation
+
+    def _snap_location(self, new_location, new_rotation, offset, source, sourceSocket):
+        """Apply the offset and source socket alignment to a socket location.
 
+        Returns:
+            The location the source actor should be moved to.
+        """
         # Apply offset if provided
         if offset:
             # Check if offset has non-zero values (handle both dict and array formats)
@@ -1331,7 +1912,7 @@ class ActorOperations:
         if sourceSocket:
             new_location = self._adjust_for_source_socket(source, sourceSocket, new_location)
 
-        return new_location, new_rotation
+        return new_location
 
     def _apply_offset_to_location(self, location, rotation, offset):
         """Apply offset to location in world space."""
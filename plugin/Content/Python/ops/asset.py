@@ -5,6 +5,7 @@ Enhanced with improved error handling framework to eliminate try/catch boilerpla
 """
 
 import os
+import time
 from typing import Any, Dict, List, Optional
 
 import unreal
@@ -457,14 +458,21 @@ class AssetOperations:
         Returns:
             dict: Validation results for each path
         """
+        # Tally while checking so the results are walked once, not once per count
         results = {}
+        valid_count = 0
         for path in paths:
-            results[path] = asset_exists(path)
+            if path in results:
+                continue
+            exists = asset_exists(path)
+            results[path] = exists
+            if exists:
+                valid_count += 1
 
         return {
             "results": results,
-            "validCount": sum(1 for v in results.values() if v),
-            "invalidCount": sum(1 for v in results.values() if not v),
+            "validCount": valid_count,
+            "invalidCount": len(results) - valid_count,
         }
 
     @validate_inputs(
@@ -565,8 +573,6 @@ class AssetOperations:
         Returns:
             dict: Import results with statistics and asset information
         """
-        import time
-
         start_time = time.time()
 
         # Prepare import settings
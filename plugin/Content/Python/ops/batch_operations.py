@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 from uemcp_command_registry import dispatch_command
 from utils import log_debug, track_operation
+from utils.error_handling import DisableViewportUpdates
 
 
 class BatchOperationManager:
@@ -39,6 +40,26 @@ class BatchOperationManager:
             "executionTime": 0,
         }
 
+        # Suspend realtime viewport redraws for the whole batch so a sequence of
+        # camera/actor commands renders once at the end instead of after each op.
+        with DisableViewportUpdates():
+            self._execute_operations(operations, results)
+
+        results["executionTime"] = time.time() - self.start_time
+        log_debug(f"Batch execution completed in {results['executionTime']:.2f}s")
+
+        # Track the entire batch as a single operation for memory management
+        track_operation()
+
+        return results
+
+    def _execute_operations(self, operations: List[Dict[str, Any]], results: Dict[str, Any]):
+        """Run each operation in order, recording per-operation results.
+
+        Args:
+            operations: List of operation dictionaries
+            results: Batch result dict updated in place
+        """
         for i, op in enumerate(operations):
             op_id = op.get("id", f"op_{i}")
             operation_name = op.get("operation")
@@ -94,14 +115,6 @@ class BatchOperationManager:
 
             results["operations"].append(operation_result)
 
-        results["executionTime"] = time.time() - self.start_time
-        log_debug(f"Batch execution completed in {results['executionTime']:.2f}s")
-
-        # Track the entire batch as a single operation for memory management
-        track_operation()
-
-        return results
-
     def _execute_single_operation(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a single operation within the batch via the command registry."""
         return dispatch_command(operation, params)
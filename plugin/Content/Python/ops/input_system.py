@@ -190,16 +190,24 @@ def list_actions(
     Returns:
         Dictionary with list of input actions
     """
-    all_assets = unreal.EditorAssetLibrary.list_assets(path, recursive=True, include_folder=False)
-
+    # Query the registry for InputActions only and match names on the asset data,
+    # so only the actions actually returned are loaded from disk
+    ar_filter = unreal.ARFilter()
+    ar_filter.package_paths = [path]
+    ar_filter.recursive_paths = True
+    ar_filter.class_names = ["InputAction"]
+    asset_datas = unreal.AssetRegistryHelpers.get_asset_registry().get_assets(ar_filter)
+
+    filter_lower = filter.lower() if filter else None
     actions = []
-    for asset_path in all_assets:
-        asset = unreal.EditorAssetLibrary.load_asset(asset_path)
-        if not asset or not isinstance(asset, unreal.InputAction):
+    for asset_data in asset_datas:
+        action_name = str(asset_data.asset_name)
+        if filter_lower and filter_lower not in action_name.lower():
             continue
 
-        action_name = asset.get_name()
-        if filter and filter.lower() not in action_name.lower():
+        asset_path = f"{asset_data.package_name}.{action_name}"
+        asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+        if not asset:
             continue
 
         value_type = str(asset.get_editor_property("value_type"))
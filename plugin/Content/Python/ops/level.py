@@ -4,7 +4,10 @@ UEMCP Level Operations - All level and project-related operations
 
 from typing import Optional
 
+import unreal
+
 from utils import (
+    filter_actors,
     get_actor_subsystem,
     get_all_actors,
     get_level_editor_subsystem,
@@ -14,6 +17,7 @@ from utils import (
 
 # Enhanced error handling framework
 from utils.error_handling import (
+    DisableViewportUpdates,
     ProcessingError,
     TypeRule,
     ValidationError,
@@ -41,6 +45,9 @@ class LevelOperations:
         "PlayerStart",
     )
 
+    # Engine-managed actor classes that must never be destroyed.
+    _PROTECTED_CLASSES = frozenset(("WorldSettings", "Brush", "AbstractNavData"))
+
     @validate_inputs({"save": [TypeRule(bool)], "delete_test_assets": [TypeRule(bool)]})
     @handle_unreal_errors("level_reset_demo_scene")
     @safe_operation("level")
@@ -52,7 +59,7 @@ class LevelOperations:
         test assets from the content browser and saves the level.
 
         Args:
-            save: Save the level after cleanup (default True)
+            save: Save the level after cleanup if any actors were removed (default True)
             delete_test_assets: Delete test asset directories (default True)
 
         Returns:
@@ -64,15 +71,20 @@ class LevelOperations:
         all_actors = editor.get_all_level_actors()
 
         removed = []
+        victims = []
         for actor in all_actors:
             label = actor.get_actor_label()
-            cls = type(actor).__name__
-            if cls in ("WorldSettings", "Brush", "AbstractNavData"):
+            if type(actor).__name__ in self._PROTECTED_CLASSES:
                 continue
-            if any(label.startswith(p) for p in self._BASELINE_PREFIXES):
+            if label.startswith(self._BASELINE_PREFIXES):
                 continue
             removed.append(label)
-            editor.destroy_actor(actor)
+            victims.append(actor)
+
+        # Destroy in one call so the editor handles the removals as a single batch
+        if victims:
+            with DisableViewportUpdates():
+                editor.destroy_actors(victims)
 
         deleted_assets = []
         if delete_test_assets:
@@ -83,9 +95,13 @@ class LevelOperations:
                     unreal.EditorAssetLibrary.delete_directory(path)
                     deleted_assets.append(path)
 
-        saved = bool(save and (removed or deleted_assets))
+        # Only the level was modified (deleted directories are already gone from
+        # disk), so save map packages but not every dirty content package. Map
+        # packages cover dirty sublevels and, on One-File-Per-Actor / World
+        # Partition maps, the __ExternalActors__ packages of destroyed actors.
+        saved = bool(save and removed)
         if saved:
-            unreal.EditorLoadingAndSavingUtils.save_dirty_packages(True, True)
+            unreal.EditorLoadingAndSavingUtils.save_dirty_packages(True, False)
 
         return {
             "removedActors": removed,
@@ -142,28 +158,11 @@ class LevelOperations:
             raise ValidationError("offset must be greater than or equal to 0", operation="get_level_actors")
         if limit <= 0:
             raise ValidationError("limit must be greater than 0", operation="get_level_actors")
-        actors = get_all_actors(filter_text=filter, limit=offset + limit)
-        actors = actors[offset:]
-
-        # Count total actors
-        editor_actor_subsystem = get_actor_subsystem()
-        all_actors = editor_actor_subsystem.get_all_level_actors()
-
-        if filter:
-            # Count filtered actors
-            filter_lower = filter.lower()
-            total_count = sum(
-                1
-                for actor in all_actors
-                if actor
-                and hasattr(actor, "get_actor_label")
-                and (
-                    filter_lower in actor.get_actor_label().lower()
-                    or filter_lower in actor.get_class().get_name().lower()
-                )
-            )
-        else:
-            total_count = len([a for a in all_actors if a and hasattr(a, "get_actor_label")])
+        # Fetch and filter the level once; both the page and the total count
+        # are derived from the same list.
+        matching_actors = filter_actors(get_actor_subsystem().get_all_level_actors(), filter)
+        actors = get_all_actors(limit=limit, offset=offset, actors=matching_actors)
+        total_count = len(matching_actors)
 
         return {
             "actors": actors,
@@ -191,16 +190,9 @@ class LevelOperations:
         # Build folder structure
         folder_structure, unorganized_actors, organized_count = self._build_folder_structure(all_actors, maxDepth)
 
-        # Sort all actors
-        self._sort_folder_actors(folder_structure)
+        # Sort, prune and count folders in a single walk of the tree
         unorganized_actors.sort()
-
-        # Remove empty folders if requested
-        if not showEmpty:
-            self._remove_empty_folders(folder_structure)
-
-        # Count total folders
-        total_folders = self._count_folders(folder_structure)
+        total_folders = self._finalize_folders(folder_structure, showEmpty)
 
         return {
             "outliner": {
@@ -228,6 +220,8 @@ class LevelOperations:
         folder_structure = {}
         unorganized_actors = []
         organized_count = 0
+        # Many actors share a folder, so each distinct path is walked once and its actor list reused
+        folder_actor_lists = {}
 
         for actor in all_actors:
             if not self._is_valid_actor(actor):
@@ -238,7 +232,14 @@ class LevelOperations:
 
             if folder_path:
                 organized_count += 1
-                self._add_actor_to_folder_structure(folder_structure, actor_label, str(folder_path), maxDepth)
+                folder_path_str = str(folder_path)
+                if folder_path_str not in folder_actor_lists:
+                    folder_actor_lists[folder_path_str] = self._get_folder_actor_list(
+                        folder_structure, folder_path_str, maxDepth
+                    )
+                actor_list = folder_actor_lists[folder_path_str]
+                if actor_list is not None:
+                    actor_list.append(actor_label)
             else:
                 unorganized_actors.append(actor_label)
 
@@ -253,19 +254,22 @@ class LevelOperations:
         Returns:
             bool: True if valid
         """
-        return actor is not None and hasattr(actor, "get_actor_label")
+        return isinstance(actor, unreal.Actor)
 
-    def _add_actor_to_folder_structure(self, folder_structure, actor_label, folder_path_str, maxDepth):
-        """Add an actor to the folder structure.
+    def _get_folder_actor_list(self, folder_structure, folder_path_str, maxDepth):
+        """Create the folders along a path and return the actor list of its last folder.
 
         Args:
             folder_structure: The folder structure dictionary
-            actor_label: Label of the actor
             folder_path_str: Folder path as string
             maxDepth: Maximum folder depth
+
+        Returns:
+            list or None: Actor list of the folder, or None if it lies deeper than maxDepth
         """
         parts = folder_path_str.split("/")
         current = folder_structure
+        actor_list = None
 
         for i, part in enumerate(parts):
             if i >= maxDepth:
@@ -274,70 +278,39 @@ class LevelOperations:
             if part not in current:
                 current[part] = {"actors": [], "subfolders": {}}
 
-            # If this is the last part, add the actor
+            # Actors are only listed in the last folder of their path
             if i == len(parts) - 1:
-                current[part]["actors"].append(actor_label)
+                actor_list = current[part]["actors"]
 
             # Move to subfolder for next iteration
             current = current[part]["subfolders"]
 
-    def _sort_folder_actors(self, folder_dict):
-        """Recursively sort actors in all folders.
+        return actor_list
 
-        Args:
-            folder_dict: Folder dictionary to sort
-        """
-        for _folder_name, folder_data in folder_dict.items():
-            if "actors" in folder_data:
-                folder_data["actors"].sort()
-            if "subfolders" in folder_data:
-                self._sort_folder_actors(folder_data["subfolders"])
-
-    def _remove_empty_folders(self, folder_dict):
-        """Recursively remove empty folders.
+    def _finalize_folders(self, folder_dict, showEmpty):
+        """Recursively sort folder actors, drop empty folders and count the rest.
 
         Args:
-            folder_dict: Folder dictionary to clean
+            folder_dict: Folder dictionary to finalize in place
+            showEmpty: Whether to keep folders without actors or subfolders
+
+        Returns:
+            int: Number of folders remaining in the tree
         """
+        count = 0
         to_remove = []
 
         for folder_name, folder_data in folder_dict.items():
-            # Recursively clean subfolders
-            if "subfolders" in folder_data:
-                self._remove_empty_folders(folder_data["subfolders"])
+            folder_data["actors"].sort()
+            subfolder_count = self._finalize_folders(folder_data["subfolders"], showEmpty)
 
-            # Check if this folder is empty
-            if self._is_folder_empty(folder_data):
+            if not showEmpty and not folder_data["actors"] and not folder_data["subfolders"]:
                 to_remove.append(folder_name)
+                continue
+
+            count += 1 + subfolder_count
 
-        # Remove empty folders
         for folder_name in to_remove:
             del folder_dict[folder_name]
 
-    def _is_folder_empty(self, folder_data):
-        """Check if a folder is empty.
-
-        Args:
-            folder_data: Folder data dictionary
-
-        Returns:
-            bool: True if folder is empty
-        """
-        has_actors = "actors" in folder_data and len(folder_data["actors"]) > 0
-        has_subfolders = "subfolders" in folder_data and len(folder_data["subfolders"]) > 0
-        return not has_actors and not has_subfolders
-
-    def _count_folders(self, folder_dict):
-        """Recursively count total folders.
-
-        Args:
-            folder_dict: Folder dictionary to count
-
-        Returns:
-            int: Total folder count
-        """
-        count = len(folder_dict)
-        for folder_data in folder_dict.values():
-            if "subfolders" in folder_data:
-                count += self._count_folders(folder_data["subfolders"])
         return count
@@ -4,15 +4,16 @@ UEMCP Material Operations - All material creation and management operations
 Enhanced with improved error handling framework to eliminate try/catch boilerplate.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import unreal
 
-from utils import asset_exists, get_actor_subsystem, load_asset, log_debug
+from utils import asset_exists, build_actor_name_index, get_actor_subsystem, load_asset, log_debug
 
 # Enhanced error handling framework
 from utils.error_handling import (
     AssetPathRule,
+    DisableViewportUpdates,
     ProcessingError,
     RequiredRule,
     TypeRule,
@@ -197,24 +198,6 @@ class MaterialOperations:
 
         return info
 
-    def _validate_and_load_material(self, material_path):
-        """Validate material exists and load it.
-
-        Args:
-            material_path: Path to the material
-
-        Returns:
-            tuple: (material object, error dict or None)
-        """
-        if not asset_exists(material_path):
-            return None, {"success": False, "error": f"Material does not exist: {material_path}"}
-
-        material = load_asset(material_path)
-        if not material:
-            return None, {"success": False, "error": f"Failed to load material: {material_path}"}
-
-        return material, None
-
     def _build_basic_material_info(self, material, material_path):
         """Build basic material information.
 
@@ -430,24 +413,12 @@ class MaterialOperations:
         material = require_asset(material_path)
 
         # Get the static mesh component
-        static_mesh_component = None
-
-        # Try different ways to get the mesh component
-        if hasattr(actor, "static_mesh_component"):
-            static_mesh_component = actor.static_mesh_component
-        elif hasattr(actor, "get_component_by_class"):
-            static_mesh_component = actor.get_component_by_class(unreal.StaticMeshComponent)
-        else:
-            # Get components and find first StaticMeshComponent
-            components = actor.get_components_by_class(unreal.StaticMeshComponent)
-            if components and len(components) > 0:
-                static_mesh_component = components[0]
-
+        static_mesh_component = self._get_static_mesh_component(actor)
         if not static_mesh_component:
             raise ProcessingError(f"No static mesh component found on actor: {actor_name}")
 
         # Apply the material to the specified slot
-        static_mesh_component.set_material(slot_index, material)
+        self._set_material_if_changed(static_mesh_component, slot_index, material)
 
         # Mark actor as modified
         editor_actor_subsystem = get_actor_subsystem()
@@ -460,6 +431,123 @@ class MaterialOperations:
             "componentName": static_mesh_component.get_name(),
         }
 
+    @validate_inputs(
+        {
+            "actor_names": [RequiredRule(), TypeRule(list)],
+            "material_path": [RequiredRule(), AssetPathRule()],
+            "slot_index": [TypeRule(int)],
+        }
+    )
+    @handle_unreal_errors("apply_material_to_actors")
+    @safe_operation("material")
+    def apply_material_to_actors(
+        self, actor_names: List[str], material_path: str, slot_index: int = 0
+    ) -> Dict[str, Any]:
+        """Apply one material to the same slot on many actors in a single call.
+
+        The material is loaded once, the level is scanned once to resolve all
+        names, viewport updates are suspended while materials are assigned, and
+        the affected actors are added to the current selection together at the end.
+
+        Args:
+            actor_names: Names of the actors to modify
+            material_path: Path to the material to apply
+            slot_index: Material slot index (default: 0)
+
+        Returns:
+            dict: Applied actors and per-actor failures
+        """
+        malformed = [f"actor_names[{i}]" for i, name in enumerate(actor_names) if not isinstance(name, str)]
+        if malformed:
+            raise ValidationError(
+                f"{', '.join(malformed)} must be strings",
+                operation="apply_material_to_actors",
+                details={"parameter": "actor_names", "entries": malformed},
+            )
+
+        material = require_asset(material_path)
+
+        editor_actor_subsystem = get_actor_subsystem()
+        actors_by_name = build_actor_name_index(editor_actor_subsystem.get_all_level_actors())
+
+        applied = []
+        failed = []
+        modified_actors = []
+        with DisableViewportUpdates():
+            # Repeated names are applied and reported once
+            for actor_name in dict.fromkeys(actor_names):
+                actor = actors_by_name.get(actor_name)
+                if actor is None:
+                    failed.append({"actorName": actor_name, "error": f"Actor not found: {actor_name}"})
+                    continue
+
+                static_mesh_component = self._get_static_mesh_component(actor)
+                if not static_mesh_component:
+                    failed.append(
+                        {"actorName": actor_name, "error": f"No static mesh component found on actor: {actor_name}"}
+                    )
+                    continue
+
+                self._set_material_if_changed(static_mesh_component, slot_index, material)
+                applied.append(actor_name)
+                modified_actors.append(actor)
+
+        # Mark actors as modified with one selection update instead of one per actor,
+        # adding to the user's selection like apply_material_to_actor does
+        if modified_actors:
+            selection = list(editor_actor_subsystem.get_selected_level_actors())
+            selected = set(selection)
+            selection.extend(actor for actor in modified_actors if actor not in selected)
+            editor_actor_subsystem.set_selected_level_actors(selection)
+
+        return {
+            "materialPath": material_path,
+            "slotIndex": slot_index,
+            "appliedActors": applied,
+            "appliedCount": len(applied),
+            "failedActors": failed,
+        }
+
+    def _set_material_if_changed(self, component, slot_index, material):
+        """Assign a material to a slot unless that exact material is already there.
+
+        Re-assigning the same shared material still dirties the actor and
+        rebuilds its render state, which adds up when bulk re-applying materials.
+
+        Args:
+            component: Mesh component to modify
+            slot_index: Material slot index
+            material: Material to assign
+
+        Returns:
+            bool: True if the slot was changed
+        """
+        current = component.get_material(slot_index)
+        if current is not None and current.get_path_name() == material.get_path_name():
+            return False
+        component.set_material(slot_index, material)
+        return True
+
+    def _get_static_mesh_component(self, actor):
+        """Find the static mesh component that carries an actor's materials.
+
+        Args:
+            actor: Actor to inspect
+
+        Returns:
+            StaticMeshComponent or None if the actor has none
+        """
+        if hasattr(actor, "static_mesh_component"):
+            return actor.static_mesh_component
+        if hasattr(actor, "get_component_by_class"):
+            return actor.get_component_by_class(unreal.StaticMeshComponent)
+
+        # Get components and find first StaticMeshComponent
+        components = actor.get_components_by_class(unreal.StaticMeshComponent)
+        if components:
+            return components[0]
+        return None
+
     @validate_inputs(
         {
             "material_name": [RequiredRule(), TypeRule(str)],
@@ -591,6 +679,9 @@ class MaterialOperations:
             material_instance: The material instance to modify
             parameters: Dictionary of parameter name -> value mappings
         """
+        # Several parameters often share one texture; resolve each path once
+        textures = {}
+
         for param_name, param_value in parameters.items():
             if isinstance(param_value, (int, float)):
                 # Scalar parameter
@@ -601,10 +692,14 @@ class MaterialOperations:
                     param_value["r"], param_value["g"], param_value["b"], param_value.get("a", 1.0)
                 )
                 material_instance.set_vector_parameter_value(param_name, color)
-            elif isinstance(param_value, str) and asset_exists(param_value):
+            elif isinstance(param_value, str):
                 # Texture parameter
-                texture = load_asset(param_value)
+                if param_value not in textures:
+                    textures[param_value] = load_asset(param_value) if asset_exists(param_value) else None
+                texture = textures[param_value]
                 if texture:
                     material_instance.set_texture_parameter_value(param_name, texture)
+                else:
+                    log_debug(f"Texture not found for {param_name}: {param_value}")
             else:
                 log_debug(f"Unsupported parameter type for {param_name}: {type(param_value)}")
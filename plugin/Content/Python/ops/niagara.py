@@ -14,7 +14,7 @@ from typing import Any, Optional
 import unreal
 
 # Fail fast at import time if Niagara plugin is not available, so that
-# try/except ImportError guards in __init__.py and command_registry work.
+# the try/except ImportError guards in command_registry work.
 if not hasattr(unreal, "NiagaraSystem"):
     raise ImportError("Niagara plugin is not available (unreal.NiagaraSystem not found)")
 
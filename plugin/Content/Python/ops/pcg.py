@@ -10,12 +10,13 @@ from typing import Any, Optional
 import unreal
 
 # Fail fast at import time if PCG plugin is not available, so that
-# try/except ImportError guards in __init__.py and command_registry work.
+# the try/except ImportError guards in command_registry work.
 if not hasattr(unreal, "PCGGraphInterface"):
     raise ImportError("PCG plugin is not available (unreal.PCGGraphInterface not found)")
 
 from utils.error_handling import (
     AssetPathRule,
+    DisableViewportUpdates,
     ListLengthRule,
     ProcessingError,
     RequiredRule,
@@ -619,10 +620,12 @@ def execute(
             details={"graph_path": graph_path, "actor_name": actor_name},
         )
 
+    # Each generate() can add many instances; redraw the viewport once after all of them
     executed = []
-    for actor, comp in targets:
-        comp.generate()
-        executed.append(actor.get_actor_label())
+    with DisableViewportUpdates():
+        for actor, comp in targets:
+            comp.generate()
+            executed.append(actor.get_actor_label())
 
     log_debug(f"Executed PCG graph {graph_path} on {len(executed)} actor(s)")
 
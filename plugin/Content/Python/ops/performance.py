@@ -3,6 +3,7 @@ Performance profiling operations for gathering rendering stats,
 GPU timing info, and per-actor scene cost breakdowns.
 """
 
+import heapq
 from typing import Any
 
 import unreal
@@ -29,56 +30,67 @@ def _get_all_actors():
     return actor_subsystem.get_all_level_actors()
 
 
-def _safe_mesh_triangle_count(static_mesh) -> int:
-    """Get triangle count from a StaticMesh, tolerating API signature variation."""
-    if hasattr(static_mesh, "get_num_triangles"):
+# Whether StaticMesh count getters take a LOD index in this engine build,
+# keyed by method name. Probed on first use so later meshes skip the
+# TypeError fallback entirely.
+_LOD_ARG_SUPPORT: dict[str, bool] = {}
+
+
+def _call_lod0_getter(static_mesh, method_name: str):
+    """Call a LOD-0 count getter, probing its signature only once per process.
+
+    Returns None if the getter cannot be called with either signature.
+    """
+    method = getattr(static_mesh, method_name)
+    takes_lod = _LOD_ARG_SUPPORT.get(method_name)
+    if takes_lod is not None:
         try:
-            return static_mesh.get_num_triangles(0)
+            return method(0) if takes_lod else method()
         except TypeError:
-            try:
-                return static_mesh.get_num_triangles()
-            except TypeError:
-                pass
+            return None
 
-    if hasattr(static_mesh, "get_num_sections") and hasattr(static_mesh, "get_section_info"):
+    for takes_lod, args in ((True, (0,)), (False, ())):
         try:
-            count = 0
-            num_sections = static_mesh.get_num_sections(0)
-            for i in range(num_sections):
-                info = static_mesh.get_section_info(0, i)
-                if info and hasattr(info, "num_triangles"):
-                    count += info.num_triangles
-            return count
+            result = method(*args)
         except TypeError:
-            pass
+            continue
+        _LOD_ARG_SUPPORT[method_name] = takes_lod
+        return result
+    return None
+
+
+def _sum_section_info(static_mesh, field: str) -> int:
+    """Sum a per-section count over LOD 0, returning -1 if unavailable."""
+    if not (hasattr(static_mesh, "get_num_sections") and hasattr(static_mesh, "get_section_info")):
+        return -1
+    try:
+        count = 0
+        num_sections = static_mesh.get_num_sections(0)
+        for i in range(num_sections):
+            info = static_mesh.get_section_info(0, i)
+            if info and hasattr(info, field):
+                count += getattr(info, field)
+        return count
+    except TypeError:
+        return -1
 
-    return -1
+
+def _safe_mesh_triangle_count(static_mesh) -> int:
+    """Get triangle count from a StaticMesh, tolerating API signature variation."""
+    if hasattr(static_mesh, "get_num_triangles"):
+        count = _call_lod0_getter(static_mesh, "get_num_triangles")
+        if count is not None:
+            return count
+    return _sum_section_info(static_mesh, "num_triangles")
 
 
 def _safe_mesh_vertex_count(static_mesh) -> int:
     """Get vertex count from a StaticMesh, tolerating API signature variation."""
     if hasattr(static_mesh, "get_num_vertices"):
-        try:
-            return static_mesh.get_num_vertices(0)
-        except TypeError:
-            try:
-                return static_mesh.get_num_vertices()
-            except TypeError:
-                pass
-
-    if hasattr(static_mesh, "get_num_sections") and hasattr(static_mesh, "get_section_info"):
-        try:
-            count = 0
-            num_sections = static_mesh.get_num_sections(0)
-            for i in range(num_sections):
-                info = static_mesh.get_section_info(0, i)
-                if info and hasattr(info, "num_vertices"):
-                    count += info.num_vertices
+        count = _call_lod0_getter(static_mesh, "get_num_vertices")
+        if count is not None:
             return count
-        except TypeError:
-            pass
-
-    return -1
+    return _sum_section_info(static_mesh, "num_vertices")
 
 
 def _safe_get_num_lods(static_mesh) -> int:
@@ -91,6 +103,19 @@ def _safe_get_num_lods(static_mesh) -> int:
     return -1
 
 
+def _cached_mesh_counts(static_mesh, mesh_path: str, cache: dict) -> tuple[int, int]:
+    """Return (triangles, vertices) for a mesh, computing them once per path.
+
+    Scenes usually place the same mesh many times, so callers share a cache
+    dict for the duration of one scan.
+    """
+    counts = cache.get(mesh_path)
+    if counts is None:
+        counts = (_safe_mesh_triangle_count(static_mesh), _safe_mesh_vertex_count(static_mesh))
+        cache[mesh_path] = counts
+    return counts
+
+
 def _normalize_path(path: str) -> str:
     """Strip UE path suffix after ':' for consistent comparisons."""
     return path.split(":")[0] if ":" in path else path
@@ -123,62 +148,41 @@ def rendering_stats() -> dict[str, Any]:
     light_count = 0
     unique_meshes: set = set()
     unique_materials: set = set()
+    mesh_counts: dict = {}
 
     for actor in actors:
-        # Static mesh components (excluding instanced, which are a subclass)
-        sm_comps = actor.get_components_by_class(unreal.StaticMeshComponent)
-        for comp in sm_comps:
-            # Skip instanced components — they are counted separately below
-            if _is_instanced_component(comp):
-                continue
-
+        # One component query covers both regular and instanced meshes, since
+        # InstancedStaticMeshComponent is a StaticMeshComponent subclass.
+        for comp in actor.get_components_by_class(unreal.StaticMeshComponent):
             sm = comp.static_mesh
             if not sm:
                 continue
-            static_mesh_component_count += 1
-
-            mesh_path = _normalize_path(sm.get_path_name())
-            unique_meshes.add(mesh_path)
 
-            # Materials
-            mats = comp.get_materials()
-            material_slot_count += len(mats)
-            for mat in mats:
-                if mat:
-                    unique_materials.add(_normalize_path(mat.get_path_name()))
-
-            # Tri/vert counts from LOD 0
-            tri_count = _safe_mesh_triangle_count(sm)
-            vert_count = _safe_mesh_vertex_count(sm)
-            if tri_count > 0:
-                total_triangles += tri_count
-            if vert_count > 0:
-                total_vertices += vert_count
-
-        # Instanced static mesh components — count and include scaled tri/vert totals
-        instanced_comps = actor.get_components_by_class(unreal.InstancedStaticMeshComponent)
-        for comp in instanced_comps:
-            sm = comp.static_mesh
-            if not sm:
-                continue
-            instanced_mesh_component_count += 1
+            is_instanced = _is_instanced_component(comp)
+            if is_instanced:
+                instanced_mesh_component_count += 1
+            else:
+                static_mesh_component_count += 1
 
             mesh_path = _normalize_path(sm.get_path_name())
             unique_meshes.add(mesh_path)
 
+            # Materials
             mats = comp.get_materials()
             material_slot_count += len(mats)
             for mat in mats:
                 if mat:
                     unique_materials.add(_normalize_path(mat.get_path_name()))
 
-            tri_count = _safe_mesh_triangle_count(sm)
-            vert_count = _safe_mesh_vertex_count(sm)
-            instance_count = comp.get_instance_count() if hasattr(comp, "get_instance_count") else 0
+            # Tri/vert counts from LOD 0, scaled by instance count for instanced components
+            tri_count, vert_count = _cached_mesh_counts(sm, mesh_path, mesh_counts)
+            multiplier = 1
+            if is_instanced:
+                multiplier = comp.get_instance_count() if hasattr(comp, "get_instance_count") else 0
             if tri_count > 0:
-                total_triangles += tri_count * instance_count
+                total_triangles += tri_count * multiplier
             if vert_count > 0:
-                total_vertices += vert_count * instance_count
+                total_vertices += vert_count * multiplier
 
         # Skeletal mesh components
         skeletal_mesh_component_count += len(actor.get_components_by_class(unreal.SkeletalMeshComponent))
@@ -326,6 +330,10 @@ def scene_breakdown(
 
     actors = _get_all_actors()
     actor_entries: list[dict[str, Any]] = []
+    mesh_counts: dict = {}
+    # Scene totals are accumulated during the scan rather than re-read from every entry afterwards
+    scene_total_tris = 0
+    scene_total_verts = 0
 
     for actor in actors:
         sm_comps = actor.get_components_by_class(unreal.StaticMeshComponent)
@@ -351,8 +359,7 @@ def scene_breakdown(
             num_lods = _safe_get_num_lods(sm)
             actor_lod_count = max(actor_lod_count, num_lods)
 
-            tri_count = _safe_mesh_triangle_count(sm)
-            vert_count = _safe_mesh_vertex_count(sm)
+            tri_count, vert_count = _cached_mesh_counts(sm, mesh_path, mesh_counts)
 
             # For instanced components, scale by instance count
             instance_count = 1
@@ -398,6 +405,8 @@ def scene_breakdown(
 
         # Only add the actor if it has at least one valid mesh entry
         if mesh_details:
+            scene_total_tris += actor_triangles
+            scene_total_verts += actor_vertices
             actor_entries.append(
                 {
                     "actor_name": actor_name,
@@ -418,16 +427,12 @@ def scene_breakdown(
         "materials": lambda e: e["total_materials"],
         "name": lambda e: e["actor_name"],
     }
-    reverse = sort_by != "name"
-    actor_entries.sort(key=sort_key_map[sort_by], reverse=reverse)
-
-    # Compute scene-wide totals before applying limit
-    scene_total_tris = sum(e["total_triangles"] for e in actor_entries)
-    scene_total_verts = sum(e["total_vertices"] for e in actor_entries)
     actors_total_with_meshes = len(actor_entries)
 
-    # Apply limit to determine which actors are returned
-    returned_actors = actor_entries[:limit]
+    # Select the top `limit` entries without sorting the whole scene; heapq keeps ties
+    # in scan order, matching a stable sort followed by a slice
+    select = heapq.nsmallest if sort_by == "name" else heapq.nlargest
+    returned_actors = select(limit, actor_entries, key=sort_key_map[sort_by])
 
     log_debug(
         f"📊 scene_breakdown: {len(returned_actors)} actors returned, "
@@ -55,9 +55,12 @@ class SystemOperations:
                 "actor_spawn",
                 "actor_duplicate",
                 "actor_delete",
+                "actor_delete_many",
                 "actor_modify",
+                "actor_modify_many",
                 "actor_organize",
                 "actor_snap_to_socket",
+                "actor_snap_batch",
                 "batch_spawn",
                 "placement_validate",
             ],
@@ -72,7 +75,13 @@ class SystemOperations:
                 "viewport_fit",
                 "viewport_look_at",
             ],
-            "material": ["material_list", "material_info", "material_create", "material_apply"],
+            "material": [
+                "material_list",
+                "material_info",
+                "material_create",
+                "material_apply",
+                "material_apply_material_to_actors",
+            ],
             "blueprint": [
                 "blueprint_create",
                 "blueprint_list",
@@ -95,7 +104,7 @@ class SystemOperations:
                     "scale": "[X, Y, Z] scale factors (default: [1, 1, 1])",
                     "name": "Actor name (optional)",
                     "folder": "World Outliner folder path (optional)",
-                    "validate": "Validate spawn success (default: true)",
+                    "validate": "Validate spawn success (default: UEMCP_VALIDATE env var, true if unset)",
                 },
                 "examples": [
                     'actor_spawn({ assetPath: "/Game/Meshes/SM_Cube" })',
@@ -174,6 +183,37 @@ class SystemOperations:
                     "slotIndex: 1 })",
                 ],
             },
+            "material_apply_material_to_actors": {
+                "description": "Apply one material to the same slot on many actors in a single call",
+                "parameters": {
+                    "actor_names": "Names of the actors to apply the material to",
+                    "material_path": "Path to the material to apply",
+                    "slot_index": "Material slot index (default: 0)",
+                },
+                "examples": [
+                    'material_apply_material_to_actors({ actor_names: ["Wall_01", "Wall_02"], '
+                    'material_path: "/Game/Materials/M_Brick" })',
+                ],
+            },
+            "actor_modify_many": {
+                "description": "Modify many actors in one call with a single level scan and one undo step",
+                "parameters": {
+                    "modifications": "List of { actorName, location?, rotation?, scale?, folder?, mesh? } entries",
+                    "validate": "Validate modifications (default: UEMCP_VALIDATE env var, true if unset)",
+                },
+                "examples": [
+                    'actor_modify_many({ modifications: [{ actorName: "Wall_01", location: [0, 0, 0] }, '
+                    '{ actorName: "Wall_02", folder: "House/Walls" }] })',
+                ],
+            },
+            "actor_delete_many": {
+                "description": "Delete several actors in one call with a single level scan and one undo step",
+                "parameters": {
+                    "actorNames": "Names of actors to delete",
+                    "validate": "Validate deletions (default: UEMCP_VALIDATE env var, true if unset)",
+                },
+                "examples": ['actor_delete_many({ actorNames: ["Cube_1", "Cube_2"] })'],
+            },
             "actor_snap_to_socket": {
                 "description": "Snap an actor to another actor's socket for precise modular placement",
                 "parameters": {
@@ -182,7 +222,7 @@ class SystemOperations:
                     "targetSocket": "Socket name on target actor",
                     "sourceSocket": "Optional socket on source actor (defaults to pivot)",
                     "offset": "Optional [X, Y, Z] offset from socket position",
-                    "validate": "Validate snap operation (default: true)",
+                    "validate": "Validate snap operation (default: UEMCP_VALIDATE env var, true if unset)",
                 },
                 "examples": [
                     'actor_snap_to_socket({ sourceActor: "Door_01", targetActor: "Wall_01", '
@@ -191,6 +231,21 @@ class SystemOperations:
                     'targetSocket: "WindowSocket", offset: [0, 0, 10] })',
                 ],
             },
+            "actor_snap_batch": {
+                "description": "Snap many actors to the same socket of one target actor in a single call",
+                "parameters": {
+                    "sourceActors": "Names of actors to snap (will be moved)",
+                    "targetActor": "Name of target actor with socket",
+                    "targetSocket": "Socket name on target actor",
+                    "sourceSocket": "Optional socket on each source actor (defaults to pivot)",
+                    "offsets": "Optional per-actor [X, Y, Z] offsets, parallel to sourceActors",
+                    "validate": "Validate snapped positions (default: UEMCP_VALIDATE env var, true if unset)",
+                },
+                "examples": [
+                    'actor_snap_batch({ sourceActors: ["Lamp_01", "Lamp_02"], targetActor: "Post_01", '
+                    'targetSocket: "LampSocket", offsets: [[0, 0, 0], [0, 0, 50]] })',
+                ],
+            },
         }
 
         # If specific tool requested
@@ -6,6 +6,7 @@ allowing Node.js MCP server to dynamically register tools without
 maintaining duplicate definitions.
 """
 
+import copy
 import inspect
 from typing import Any, Dict, List, Union, get_args, get_origin
 
@@ -63,6 +64,10 @@ class ManifestGenerator:
 
     def __init__(self):
         self.registry = None
+        # (registry, registry generation) -> manifest; commands only change on
+        # (re)registration, so health probes can reuse the last build.
+        self._cache_key = None
+        self._cached_manifest = None
 
     def python_type_to_json_schema(self, python_type: Any) -> Dict[str, Any]:
         """Convert Python type hint to JSON Schema type."""
@@ -227,6 +232,13 @@ class ManifestGenerator:
         from uemcp_command_registry import get_registry
 
         self.registry = get_registry()
+        # Holding the registry itself (not its id) keeps a recycled id from matching
+        cache_key = (self.registry, self.registry.generation)
+        if self._cached_manifest is not None and cache_key == self._cache_key:
+            # Deep copy: callers (including concurrent listener threads) must not
+            # share the cached tools list and categories dict
+            return copy.deepcopy(self._cached_manifest)
+
         tools = []
         categories = {}
 
@@ -244,13 +256,16 @@ class ManifestGenerator:
         # Sort tools by name for consistency
         tools.sort(key=lambda t: t["name"])
 
-        return {
+        manifest = {
             "success": True,
             "version": VERSION,
             "totalTools": len(tools),
             "tools": tools,
             "categories": categories,
         }
+        self._cache_key = cache_key
+        self._cached_manifest = manifest
+        return copy.deepcopy(manifest)
 
 
 # Global manifest generator instance
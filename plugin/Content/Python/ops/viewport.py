@@ -40,6 +40,28 @@ from utils.error_handling import (
 class ViewportOperations:
     """Handles all viewport and camera-related operations."""
 
+    # Camera (pitch, yaw, roll) for each set_mode view
+    _MODE_ROTATIONS = {
+        "top": (-90.0, 0.0, 0.0),  # Look straight down
+        "bottom": (90.0, 0.0, 0.0),  # Look straight up
+        "front": (0.0, 0.0, 0.0),  # Face north (-X)
+        "back": (0.0, 180.0, 0.0),  # Face south (+X)
+        "left": (0.0, -90.0, 0.0),  # Face east (-Y)
+        "right": (0.0, 90.0, 0.0),  # Face west (+Y)
+        "perspective": (-30.0, 45.0, 0.0),  # Default perspective view
+    }
+
+    # Camera offset from the framed origin for each view mode, in multiples of the view distance
+    _MODE_CAMERA_OFFSETS = {
+        "top": (0.0, 0.0, 1.0),
+        "bottom": (0.0, 0.0, -1.0),
+        "front": (-1.0, 0.0, 0.0),
+        "back": (1.0, 0.0, 0.0),
+        "left": (0.0, -1.0, 0.0),
+        "right": (0.0, 1.0, 0.0),
+        "perspective": (-0.7, -0.7, 0.5),
+    }
+
     @validate_inputs(
         {
             "width": [TypeRule(int)],
@@ -433,20 +455,10 @@ class ViewportOperations:
         Returns:
             unreal.Rotator or None: Rotation for the mode, None if invalid
         """
-        rotations = {
-            "top": (-90.0, 0.0, 0.0),  # Look straight down
-            "bottom": (90.0, 0.0, 0.0),  # Look straight up
-            "front": (0.0, 0.0, 0.0),  # Face north (-X)
-            "back": (0.0, 180.0, 0.0),  # Face south (+X)
-            "left": (0.0, -90.0, 0.0),  # Face east (-Y)
-            "right": (0.0, 90.0, 0.0),  # Face west (+Y)
-            "perspective": (-30.0, 45.0, 0.0),  # Default perspective view
-        }
-
-        if mode not in rotations:
+        if mode not in self._MODE_ROTATIONS:
             return None
 
-        pitch, yaw, roll = rotations[mode]
+        pitch, yaw, roll = self._MODE_ROTATIONS[mode]
         rotation = unreal.Rotator()
         rotation.pitch = pitch
         rotation.yaw = yaw
@@ -547,20 +559,13 @@ class ViewportOperations:
         Returns:
             unreal.Vector: Camera position
         """
-        positions = {
-            "top": unreal.Vector(origin.x, origin.y, origin.z + distance),
-            "bottom": unreal.Vector(origin.x, origin.y, origin.z - distance),
-            "front": unreal.Vector(origin.x - distance, origin.y, origin.z),
-            "back": unreal.Vector(origin.x + distance, origin.y, origin.z),
-            "left": unreal.Vector(origin.x, origin.y - distance, origin.z),
-            "right": unreal.Vector(origin.x, origin.y + distance, origin.z),
-            "perspective": unreal.Vector(
-                origin.x - distance * 0.7,
-                origin.y - distance * 0.7,
-                origin.z + distance * 0.5,
-            ),
-        }
-        return positions.get(mode, origin)
+        offset = self._MODE_CAMERA_OFFSETS.get(mode)
+        if offset is None:
+            return origin
+
+        # Only the Vector for the requested mode is constructed
+        dx, dy, dz = offset
+        return unreal.Vector(origin.x + dx * distance, origin.y + dy * distance, origin.z + dz * distance)
 
     @handle_unreal_errors("get_bounds")
     @safe_operation("viewport")
@@ -629,66 +634,60 @@ class ViewportOperations:
         Returns:
             dict: Result with camera adjustment info
         """
+        if not actors and not filter:
+            raise ValidationError("Must provide either actors list or filter pattern")
+
         # Get all actors to check
         editor_actor_subsystem = get_actor_subsystem()
         all_actors = editor_actor_subsystem.get_all_level_actors()
 
-        # Filter actors based on provided criteria
-        actors_to_fit = []
-
+        # Filter actors based on provided criteria, reading each label once
         if actors:
-            # Specific actors requested
-            for actor in all_actors:
-                if actor and hasattr(actor, "get_actor_label"):
-                    if actor.get_actor_label() in actors:
-                        actors_to_fit.append(actor)
-        elif filter:
+            # Specific actors requested; set membership keeps long name lists O(1) per actor
+            wanted_names = set(actors)
+            actors_to_fit = [
+                actor
+                for actor in all_actors
+                if actor and hasattr(actor, "get_actor_label") and actor.get_actor_label() in wanted_names
+            ]
+        else:
             # Filter pattern provided
             filter_lower = filter.lower()
-            for actor in all_actors:
-                if actor and hasattr(actor, "get_actor_label"):
-                    if filter_lower in actor.get_actor_label().lower():
-                        actors_to_fit.append(actor)
-        else:
-            raise ValidationError("Must provide either actors list or filter pattern")
+            actors_to_fit = [
+                actor
+                for actor in all_actors
+                if actor and hasattr(actor, "get_actor_label") and filter_lower in actor.get_actor_label().lower()
+            ]
 
         if not actors_to_fit:
             raise ValidationError("No actors found matching criteria")
 
-        # Calculate combined bounds of all actors
-        combined_min = None
-        combined_max = None
+        # Calculate combined bounds of all actors as plain floats; the only Vector
+        # constructed is the final camera location handed to the editor.
+        min_x = min_y = min_z = float("inf")
+        max_x = max_y = max_z = float("-inf")
 
         for actor in actors_to_fit:
             origin, extent = actor.get_actor_bounds(False)
+            ox, oy, oz = origin.x, origin.y, origin.z
+            ex, ey, ez = extent.x, extent.y, extent.z
 
-            actor_min = unreal.Vector(origin.x - extent.x, origin.y - extent.y, origin.z - extent.z)
-            actor_max = unreal.Vector(origin.x + extent.x, origin.y + extent.y, origin.z + extent.z)
-
-            if combined_min is None:
-                combined_min = actor_min
-                combined_max = actor_max
-            else:
-                combined_min = unreal.Vector(
-                    min(combined_min.x, actor_min.x),
-                    min(combined_min.y, actor_min.y),
-                    min(combined_min.z, actor_min.z),
-                )
-                combined_max = unreal.Vector(
-                    max(combined_max.x, actor_max.x),
-                    max(combined_max.y, actor_max.y),
-                    max(combined_max.z, actor_max.z),
-                )
+            min_x = min(min_x, ox - ex)
+            min_y = min(min_y, oy - ey)
+            min_z = min(min_z, oz - ez)
+            max_x = max(max_x, ox + ex)
+            max_y = max(max_y, oy + ey)
+            max_z = max(max_z, oz + ez)
 
         # Calculate center and size
-        bounds_center = (combined_min + combined_max) * 0.5
-        bounds_size = combined_max - combined_min
+        center_x, center_y, center_z = (min_x + max_x) * 0.5, (min_y + max_y) * 0.5, (min_z + max_z) * 0.5
+        size_x, size_y, size_z = max_x - min_x, max_y - min_y, max_z - min_z
 
         # Apply padding
         padding_factor = 1.0 + (padding / 100.0)
 
         # Calculate required camera distance
-        max_dimension = max(bounds_size.x, bounds_size.y, bounds_size.z)
+        max_dimension = max(size_x, size_y, size_z)
         camera_distance = max_dimension * padding_factor
 
         # Get current camera rotation to maintain view angle
@@ -698,7 +697,11 @@ class ViewportOperations:
         # Position camera to fit all actors
         # Use current rotation to determine camera offset direction
         forward = current_rotation.get_forward_vector()
-        camera_location = bounds_center - forward * camera_distance
+        camera_location = unreal.Vector(
+            center_x - forward.x * camera_distance,
+            center_y - forward.y * camera_distance,
+            center_z - forward.z * camera_distance,
+        )
 
         # Apply the camera position
         editor_subsystem.set_level_viewport_camera_info(camera_location, current_rotation)
@@ -708,8 +711,8 @@ class ViewportOperations:
 
         return {
             "fittedActors": len(actors_to_fit),
-            "boundsCenter": [bounds_center.x, bounds_center.y, bounds_center.z],
-            "boundsSize": [bounds_size.x, bounds_size.y, bounds_size.z],
+            "boundsCenter": [center_x, center_y, center_z],
+            "boundsSize": [size_x, size_y, size_z],
             "cameraLocation": [camera_location.x, camera_location.y, camera_location.z],
             "message": f"Fitted {len(actors_to_fit)} actors in viewport",
         }
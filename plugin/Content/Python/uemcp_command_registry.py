@@ -14,6 +14,9 @@ class CommandRegistry:
     def __init__(self):
         self.handlers: dict[str, tuple[Callable, list[str], bool]] = {}
         self._operation_classes = {}
+        # Bumped on every (re)registration so consumers such as the tool
+        # manifest can tell when their cached view of the handlers is stale
+        self.generation = 0
 
     def register_operations(self, operations_instance, prefix: str = ""):
         """Register all methods from an operations class.
@@ -24,6 +27,7 @@ class CommandRegistry:
         """
         class_name = operations_instance.__class__.__name__
         self._operation_classes[class_name] = operations_instance
+        self.generation += 1
 
         # Get all public methods that don't start with underscore
         for method_name in dir(operations_instance):
@@ -69,6 +73,7 @@ class CommandRegistry:
 
         has_validate = "validate" in params
         self.handlers[name] = (handler, params, has_validate)
+        self.generation += 1
         log_debug(f"Registered command: {name}")
 
     def dispatch(self, command: str, params: dict[str, Any]) -> dict[str, Any]:
@@ -3,14 +3,12 @@
 Force cleanup for stuck UEMCP listener
 """
 
-import subprocess
 import sys
 
-# import os
-import time
-
 import unreal
 
+from utils import force_free_port_silent, is_port_in_use
+
 
 def force_cleanup():
     """Aggressively clean up any stuck listener processes"""
@@ -28,21 +26,14 @@ def force_cleanup():
                 pass
         unreal.log("UEMCP: ✓ Signaled listener to stop")
 
-    # Step 2: Force kill any process on port 8765
+    # Step 2: Force kill any process on port 8765, waiting only until the port is released
     try:
-        if sys.platform == "darwin":  # macOS
-            # Get PIDs
-            result = subprocess.run(["lsof", "-ti:8765"], capture_output=True, text=True)
-            if result.stdout:
-                pids = result.stdout.strip().split("\n")
-                for pid in pids:
-                    stripped_pid = pid.strip()
-                    if stripped_pid.isdigit():
-                        subprocess.run(["kill", "-9", stripped_pid])
-                        unreal.log(f"UEMCP: ✓ Killed process {stripped_pid}")
-                time.sleep(1)
-            else:
-                unreal.log("UEMCP: ✓ No processes found on port 8765")
+        if not is_port_in_use(8765):
+            unreal.log("UEMCP: ✓ No processes found on port 8765")
+        elif force_free_port_silent(8765):
+            unreal.log("UEMCP: ✓ Freed port 8765")
+        else:
+            unreal.log_warning("UEMCP: Port 8765 is still in use")
     except Exception as e:
         unreal.log_error(f"Error killing processes: {e}")
 
@@ -11,7 +11,7 @@ import uuid
 # import os
 # import sys
 # import socket
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import unreal
 
@@ -20,7 +20,7 @@ from ops.tool_manifest import get_tool_manifest
 
 # Import command registry and operations
 from uemcp_command_registry import dispatch_command, register_all_operations
-from utils import log_debug, log_error
+from utils import is_port_in_use, log_debug, log_error
 from version import VERSION
 
 # Global state
@@ -73,6 +73,17 @@ _LEGACY_COMMAND_MAP = {
 class UEMCPHandler(BaseHTTPRequestHandler):
     """HTTP handler for UEMCP commands"""
 
+    # HTTP/1.1 keeps client connections open between commands so the MCP server
+    # does not pay a TCP handshake per tool call. Every response therefore sends
+    # Content-Length. Idle connections are closed after `timeout` seconds, and
+    # any request a kept-alive connection sends after stop_server() is answered
+    # with `Connection: close` instead of being queued.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+    # Headers and body are written separately; with Nagle enabled a kept-alive
+    # connection can stall the body behind the client's delayed ACK.
+    disable_nagle_algorithm = True
+
     def do_GET(self):
         """Provide health check status with full manifest"""
         # Get the manifest (function imported at module level)
@@ -88,14 +99,14 @@ class UEMCPHandler(BaseHTTPRequestHandler):
             "manifest": manifest,
         }
 
-        self.send_response(200)
-        self.send_header("Content-type", "application/json")
-        self.end_headers()
-
-        self.wfile.write(json.dumps(response, indent=2).encode("utf-8"))
+        self._send_json_response(200, response)
 
     def do_POST(self):
         """Handle command execution"""
+        if not server_running:
+            # A kept-alive connection outlived stop_server(); don't queue new work
+            self.send_error(503, "UEMCP listener is shutting down")
+            return
         try:
             command = self._parse_command()
             if command is None:
@@ -258,10 +269,15 @@ class UEMCPHandler(BaseHTTPRequestHandler):
             code: HTTP response code
             data: Data to send as JSON
         """
+        body = json.dumps(data, indent=2).encode("utf-8")
         self.send_response(code)
         self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if not server_running:
+            self.send_header("Connection", "close")
+            self.close_connection = True
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode("utf-8"))
+        self.wfile.write(body)
 
     def _handle_error(self, e):
         """Handle and log errors.
@@ -445,7 +461,10 @@ def _create_server_thread(started_event: threading.Event):
         global httpd, server_running
         local_httpd = None
         try:
-            local_httpd = HTTPServer(("localhost", 8765), UEMCPHandler)
+            # Threaded so a kept-alive connection never blocks other clients;
+            # handlers only enqueue work for the main thread and wait on events.
+            local_httpd = ThreadingHTTPServer(("localhost", 8765), UEMCPHandler)
+            local_httpd.daemon_threads = True
             local_httpd.timeout = 0.5
             httpd = local_httpd
             server_running = True
@@ -554,11 +573,8 @@ def stop_server():
                 except OSError:
                     pass
 
-            # Wait a bit for the thread to exit
-            for _i in range(30):  # Wait up to 3 seconds
-                if not server_thread.is_alive():
-                    break
-                time.sleep(0.1)
+            # Wait up to 3 seconds for the thread to exit, returning as soon as it does
+            server_thread.join(timeout=3.0)
 
             # If still alive, force kill the port
             if server_thread.is_alive():
@@ -590,6 +606,16 @@ def get_status():
     return {"running": server_running, "port": 8765, "version": VERSION}
 
 
+def is_healthy():
+    """Check that the server thread is alive and the port is accepting connections.
+
+    Returns:
+        bool: True if the listener in this process is up and serving
+    """
+    thread = server_thread
+    return bool(server_running and thread is not None and thread.is_alive() and is_port_in_use(8765))
+
+
 # Module-level functions for compatibility with existing code
 def start_listener():
     """Start the UEMCP listener (module-level function for compatibility)."""
@@ -601,6 +627,11 @@ def stop_listener():
     return stop_server()
 
 
+# Modules dropped from sys.modules on restart so the next start re-imports them from disk
+_RELOAD_MODULES = frozenset(("ops", "utils", "uemcp_command_registry"))
+_RELOAD_PACKAGE_PREFIXES = ("ops.", "utils.")
+
+
 def restart_listener():
     """Restart the UEMCP listener (module-level function for compatibility)."""
     global _deferred_restart_tick
@@ -623,11 +654,7 @@ def restart_listener():
     # picked up without a full editor restart.
     import sys as _sys
 
-    stale = [
-        k
-        for k in _sys.modules
-        if k == "ops" or k.startswith("ops.") or k == "uemcp_command_registry" or k == "utils" or k.startswith("utils.")
-    ]
+    stale = [k for k in _sys.modules if k in _RELOAD_MODULES or k.startswith(_RELOAD_PACKAGE_PREFIXES)]
     for k in stale:
         del _sys.modules[k]
     if stale:
@@ -5,10 +5,12 @@ UEMCP Utilities Package - Common utilities and helpers
 # Import commonly used functions for convenience
 from .general import (
     asset_exists,
+    build_actor_name_index,
     create_rotator,
     create_transform,
     create_vector,
     execute_console_command,
+    filter_actors,
     find_actor_by_name,
     format_unreal_type,
     get_actor_subsystem,
@@ -55,8 +57,10 @@ __all__ = [
     "create_rotator",
     "create_transform",
     "find_actor_by_name",
+    "build_actor_name_index",
     "load_asset",
     "get_all_actors",
+    "filter_actors",
     "get_project_info",
     "execute_console_command",
     "asset_exists",
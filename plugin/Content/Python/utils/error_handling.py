@@ -231,17 +231,21 @@ def validate_inputs(validation_schema: Dict[str, List[ValidationRule]]):
     """
 
     def decorator(func):
+        # Resolve the signature once at decoration time; it never changes per call
+        sig = inspect.signature(func)
+        schema_items = [(name, rules) for name, rules in validation_schema.items() if name in sig.parameters]
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Get function signature to map args to parameter names
-            sig = inspect.signature(func)
+            # Map args to parameter names
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
+            arguments = bound_args.arguments
 
             # Validate each parameter according to schema
-            for param_name, rules in validation_schema.items():
-                if param_name in bound_args.arguments:
-                    value = bound_args.arguments[param_name]
+            for param_name, rules in schema_items:
+                if param_name in arguments:
+                    value = arguments[param_name]
                     for rule in rules:
                         error_msg = rule.validate(value, param_name)
                         if error_msg:
@@ -361,12 +365,14 @@ def safe_operation(operation_type: str = "operation"):
 # ============================================================================
 
 
-def require_actor(actor_name: str) -> unreal.Actor:
+def require_actor(actor_name: str, actor_index: Optional[Dict[str, Any]] = None) -> unreal.Actor:
     """
     Find and return an actor by name, raising ProcessingError if not found.
 
     Args:
         actor_name: Name of the actor to find
+        actor_index: Optional label -> actor dict from build_actor_name_index,
+            used instead of scanning the level when resolving several names
 
     Returns:
         unreal.Actor: The found actor
@@ -374,9 +380,12 @@ def require_actor(actor_name: str) -> unreal.Actor:
     Raises:
         ProcessingError: If actor is not found
     """
-    from utils import find_actor_by_name  # Import here to avoid circular imports
+    if actor_index is not None:
+        actor = actor_index.get(actor_name)
+    else:
+        from utils import find_actor_by_name  # Import here to avoid circular imports
 
-    actor = find_actor_by_name(actor_name)
+        actor = find_actor_by_name(actor_name)
     if not actor:
         raise ProcessingError(
             f"Actor '{actor_name}' not found in level", operation="find_actor", details={"actor_name": actor_name}
@@ -413,11 +422,46 @@ def require_asset(asset_path: str) -> unreal.Object:
 
 
 class DisableViewportUpdates:
-    """Context manager to temporarily disable viewport updates for performance."""
+    """Context manager to temporarily disable viewport updates for performance.
+
+    Nested uses (e.g. actor_batch_spawn inside batch_operations) are reference
+    counted so only the outermost block toggles realtime rendering, and it
+    restores whatever realtime state the viewport had on entry.
+
+    Objects passed to ``mark_modified`` while a block is open have ``modify()``
+    called once each when the outermost block exits, instead of once per edit.
+    """
+
+    _depth = 0
+    _pending_modify = {}
+    _saved_realtime = True
+
+    @classmethod
+    def mark_modified(cls, obj):
+        """Call ``obj.modify()`` now, or once at the end of the enclosing batch."""
+        if cls._depth > 0:
+            cls._pending_modify[id(obj)] = obj
+        else:
+            obj.modify()
+
+    @classmethod
+    def _flush_modified(cls):
+        pending = list(cls._pending_modify.values())
+        cls._pending_modify.clear()
+        for obj in pending:
+            try:
+                obj.modify()
+            except Exception as e:
+                log_debug(f"Could not mark object modified: {str(e)}")
 
     def __enter__(self):
+        DisableViewportUpdates._depth += 1
+        if DisableViewportUpdates._depth > 1:
+            self._subsystem = None
+            return self
         try:
             self._subsystem = get_level_editor_subsystem()
+            DisableViewportUpdates._saved_realtime = self._get_realtime(self._subsystem)
             self._subsystem.editor_set_viewport_realtime(False)
             log_debug("Disabled viewport updates for performance")
         except Exception as e:
@@ -425,7 +469,23 @@ class DisableViewportUpdates:
             log_debug(f"Could not disable viewport updates: {str(e)}")
         return self
 
+    @staticmethod
+    def _get_realtime(subsystem):
+        """Current realtime state, assuming on when the editor can't report it."""
+        getter = getattr(subsystem, "editor_get_viewport_realtime", None)
+        if getter is None:
+            return True
+        try:
+            return bool(getter())
+        except Exception as e:
+            log_debug(f"Could not read viewport realtime state: {str(e)}")
+            return True
+
     def __exit__(self, exc_type, exc_val, exc_tb):
+        DisableViewportUpdates._depth -= 1
+        if DisableViewportUpdates._depth > 0:
+            return
+        DisableViewportUpdates._flush_modified()
         subsystem = getattr(self, "_subsystem", None)
         if subsystem is None:
             try:
@@ -433,8 +493,10 @@ class DisableViewportUpdates:
             except RuntimeError:
                 log_debug("Skipping viewport re-enable: subsystem unavailable")
                 return
+        realtime = DisableViewportUpdates._saved_realtime
+        DisableViewportUpdates._saved_realtime = True
         try:
-            subsystem.editor_set_viewport_realtime(True)
-            log_debug("Re-enabled viewport updates")
+            subsystem.editor_set_viewport_realtime(realtime)
+            log_debug(f"Restored viewport realtime to {realtime}")
         except Exception as e:
             log_error(f"Failed to re-enable viewport updates: {str(e)}")
@@ -54,6 +54,11 @@ def create_transform(location, rotation, scale):
     return ue_location, ue_rotation, ue_scale
 
 
+# The EditorActorSubsystem lives as long as the editor, so it is fetched once;
+# hot reload re-imports this module and starts again with an empty cache.
+_actor_subsystem = None
+
+
 def get_actor_subsystem():
     """Get the EditorActorSubsystem (replaces deprecated EditorLevelLibrary).
 
@@ -63,10 +68,13 @@ def get_actor_subsystem():
     Raises:
         RuntimeError: If subsystem is unavailable (e.g., during early startup)
     """
-    subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-    if subsystem is None:
-        raise RuntimeError("EditorActorSubsystem is not available")
-    return subsystem
+    global _actor_subsystem
+    if _actor_subsystem is None:
+        subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        if subsystem is None:
+            raise RuntimeError("EditorActorSubsystem is not available")
+        _actor_subsystem = subsystem
+    return _actor_subsystem
 
 
 def get_level_editor_subsystem():
@@ -99,69 +107,117 @@ def get_unreal_editor_subsystem():
     return subsystem
 
 
+# Label -> actor index shared by find_actor_by_name calls within one editor frame,
+# so a batch of commands resolving actors by name scans the level once per tick.
+_actor_index_cache = {"frame": None, "index": None}
+
+
 def find_actor_by_name(actor_name):
     """Find an actor in the level by name.
 
+    Lookups within the same editor frame reuse one label index. A cached hit is
+    only returned while the actor is still valid and still carries that label;
+    anything else (including a miss) rescans the level, so actors spawned,
+    destroyed or renamed earlier in the frame are seen correctly.
+
     Args:
         actor_name: Name of the actor to find
 
     Returns:
         Actor object or None if not found
     """
-    all_actors = get_actor_subsystem().get_all_level_actors()
-
-    for actor in all_actors:
+    frame = unreal.SystemLibrary.get_frame_count()
+    if _actor_index_cache["frame"] == frame:
+        actor = _actor_index_cache["index"].get(actor_name)
         try:
-            if actor and hasattr(actor, "get_actor_label") and actor.get_actor_label() == actor_name:
+            if actor is not None and unreal.SystemLibrary.is_valid(actor) and actor.get_actor_label() == actor_name:
                 return actor
-        except Exception as e:
-            log_debug(f"Skipping actor due to error: {e}")
-            continue
+        except (RuntimeError, AttributeError) as e:
+            # Raised by wrappers whose engine object has gone away
+            log_debug(f"Discarding cached actor lookup: {e}")
 
-    return None
+    index = build_actor_name_index()
+    _actor_index_cache["frame"] = frame
+    _actor_index_cache["index"] = index
+    return index.get(actor_name)
 
 
-def get_all_actors(filter_text=None, limit=30):
-    """Get all actors in the level with optional filtering.
+def build_actor_name_index(all_actors=None):
+    """Map actor labels to actors from a single level scan.
+
+    Use this instead of repeated find_actor_by_name calls when several names
+    are looked up at once. When labels collide, the first actor in level order
+    wins, matching find_actor_by_name.
+
+    Args:
+        all_actors: Optional pre-fetched actor list (defaults to all level actors)
+
+    Returns:
+        dict: Actor label -> actor
+    """
+    if all_actors is None:
+        all_actors = get_actor_subsystem().get_all_level_actors()
+
+    index = {}
+    for actor in all_actors:
+        if isinstance(actor, unreal.Actor):
+            index.setdefault(actor.get_actor_label(), actor)
+    return index
+
+
+def filter_actors(all_actors, filter_text=None):
+    """Filter a pre-fetched actor list by label or class name.
+
+    Each actor's label and class name are fetched at most once, so callers that
+    need both the matches and their count can share a single level scan.
 
     Args:
+        all_actors: Actors returned by get_all_level_actors()
         filter_text: Optional text to filter actor names/classes
-        limit: Maximum number of actors to return
 
     Returns:
-        list: List of actor dictionaries with properties
+        list: Matching actors in level order
     """
-    all_actors = get_actor_subsystem().get_all_level_actors()
+    if not filter_text:
+        return [a for a in all_actors if isinstance(a, unreal.Actor)]
 
-    # Apply filter if provided
-    if filter_text:
-        filtered_actors = []
-        filter_lower = filter_text.lower()
+    filtered_actors = []
+    filter_lower = filter_text.lower()
 
-        for actor in all_actors:
-            try:
-                if not actor or not hasattr(actor, "get_actor_label"):
-                    continue
+    # The type check screens out anything that is not a live actor up front, so the
+    # loop needs no per-actor exception handling
+    for actor in all_actors:
+        if not isinstance(actor, unreal.Actor):
+            continue
 
-                actor_name = actor.get_actor_label().lower()
-                actor_class = actor.get_class().get_name().lower()
+        if filter_lower in actor.get_actor_label().lower():
+            filtered_actors.append(actor)
+        elif filter_lower in actor.get_class().get_name().lower():
+            filtered_actors.append(actor)
 
-                if filter_lower in actor_name or filter_lower in actor_class:
-                    filtered_actors.append(actor)
-            except Exception as e:
-                log_debug(f"Skipping actor due to error: {e}")
-                continue
+    return filtered_actors
 
-        actors_to_process = filtered_actors
-    else:
-        actors_to_process = [a for a in all_actors if a and hasattr(a, "get_actor_label")]
 
-    # Build actor list with limit
-    actor_list = []
-    for i, actor in enumerate(actors_to_process):
-        if i >= limit:
-            break
+def get_all_actors(filter_text=None, limit=30, offset=0, actors=None):
+    """Get all actors in the level with optional filtering.
 
+    Args:
+        filter_text: Optional text to filter actor names/classes
+        limit: Maximum number of actors to return
+        offset: Number of matching actors to skip
+        actors: Optional pre-fetched actor list to use instead of querying the level
+
+    Returns:
+        list: List of actor dictionaries with properties
+    """
+    if actors is None:
+        actors = get_actor_subsystem().get_all_level_actors()
+
+    actors_to_process = filter_actors(actors, filter_text)[offset : offset + limit]
+
+    # Build actor list
+    actor_list = []
+    for actor in actors_to_process:
         try:
             location = actor.get_actor_location()
             rotation = actor.get_actor_rotation()
@@ -182,7 +238,9 @@ def get_all_actors(filter_text=None, limit=30):
                     actor_data["assetPath"] = mesh_component.static_mesh.get_path_name().split(":")[0]
 
             actor_list.append(actor_data)
-        except Exception:
+        except (AttributeError, RuntimeError, TypeError) as e:
+            # An actor torn down mid-listing is skipped; anything else is a real bug
+            log_debug(f"Skipping actor in listing: {e}")
             continue
 
     return actor_list
@@ -10,12 +10,16 @@ import time
 import unreal
 
 
-def is_port_in_use(port):
-    """Check if a port is currently in use"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    result = sock.connect_ex(("localhost", port))
-    sock.close()
-    return result == 0
+def is_port_in_use(port, timeout=0.2):
+    """Check if a port is currently in use.
+
+    A listener on localhost accepts almost instantly, so the probe is bounded by
+    ``timeout``; without it a refused connection on Windows can take seconds
+    while the stack retries the SYN.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex(("localhost", port)) == 0
 
 
 def find_all_processes_using_port(port):
@@ -165,12 +165,10 @@ def validate_actor_exists(actor_name):
     try:
         all_actors = get_actor_subsystem().get_all_level_actors()
 
+        # The type check skips non-actor entries without per-actor exception handling
         for actor in all_actors:
-            try:
-                if actor and hasattr(actor, "get_actor_label") and actor.get_actor_label() == actor_name:
-                    return result  # Success
-            except Exception:
-                continue
+            if isinstance(actor, unreal.Actor) and actor.get_actor_label() == actor_name:
+                return result  # Success
 
         result.add_error(f"Actor '{actor_name}' not found in level")
     except (AttributeError, RuntimeError, TypeError) as e:
@@ -187,12 +185,9 @@ def validate_actor_deleted(actor_name):
         all_actors = get_actor_subsystem().get_all_level_actors()
 
         for actor in all_actors:
-            try:
-                if actor and hasattr(actor, "get_actor_label") and actor.get_actor_label() == actor_name:
-                    result.add_error(f"Actor '{actor_name}' still exists in level")
-                    return result
-            except Exception:
-                continue
+            if isinstance(actor, unreal.Actor) and actor.get_actor_label() == actor_name:
+                result.add_error(f"Actor '{actor_name}' still exists in level")
+                return result
 
         # Success - actor not found
         return result
@@ -210,14 +205,25 @@ def validate_actor_spawn(
     expected_mesh_path=None,
     expected_folder=None,
 ):
-    """Comprehensive validation for spawned actors"""
+    """Comprehensive validation for spawned actors.
+
+    ``actor_name`` may be the spawned actor itself rather than its name.
+    Callers that hold the actor should pass it directly; passing the name
+    costs a level scan to find it.
+    """
     result = ValidationResult()
 
     # First check if actor exists
-    actor = find_actor_by_name(actor_name)
-    if not actor:
-        result.add_error(f"Spawned actor '{actor_name}' not found in level")
-        return result
+    if isinstance(actor_name, str):
+        actor = find_actor_by_name(actor_name)
+        if not actor:
+            result.add_error(f"Spawned actor '{actor_name}' not found in level")
+            return result
+    else:
+        actor = actor_name
+        if not actor or not unreal.SystemLibrary.is_valid(actor):
+            result.add_error("Spawned actor is no longer valid")
+            return result
 
     # Build validation map
     validations = [
@@ -17,6 +17,7 @@ import pytest
 # isinstance() must be real types, not MagicMock auto-attributes.
 if "unreal" not in sys.modules:
     _base_unreal = MagicMock()
+    _base_unreal.Actor = type("Actor", (), {})
     _base_unreal.SceneComponent = type("SceneComponent", (), {})
     _base_unreal.NiagaraSystem = type("NiagaraSystem", (), {})
     sys.modules["unreal"] = _base_unreal
@@ -0,0 +1,763 @@
+"""
+Unit tests for actor operations.
+
+Tests the pure Python orchestration in ops.actor (batch spawning order,
+result shaping) with the editor subsystems mocked out.
+"""
+
+import importlib
+import inspect
+import os
+import re
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+if "unreal" not in sys.modules:
+    mock_unreal = MagicMock()
+    sys.modules["unreal"] = mock_unreal
+else:
+    mock_unreal = sys.modules["unreal"]
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+import ops.actor  # noqa: E402
+from ops.actor import ActorBoundsInfo, ActorOperations, _neighbour_pairs, _scan_pairs  # noqa: E402
+
+
+def _make_spawned_actor(label="Spawned"):
+    actor = MagicMock()
+    actor.get_actor_label.return_value = label
+    actor.tags = []
+    return actor
+
+
+class TestBatchSpawn:
+    """Test batch_spawn spawns everything before configuring actors."""
+
+    def _run(self, configs, subsystem, load_asset=None, **kwargs):
+        if load_asset is None:
+            load_asset = MagicMock(side_effect=lambda path: MagicMock(name=path))
+        with patch("ops.actor.get_actor_subsystem", return_value=subsystem), patch("ops.actor.load_asset", load_asset):
+            return ActorOperations().batch_spawn(configs, **kwargs)
+
+    def test_labels_applied_after_all_spawns(self):
+        events = []
+        subsystem = MagicMock()
+
+        def spawn(asset, location, rotation):
+            events.append("spawn")
+            actor = _make_spawned_actor()
+            actor.set_actor_label.side_effect = lambda name: events.append(f"label:{name}")
+            return actor
+
+        subsystem.spawn_actor_from_object.side_effect = spawn
+        configs = [
+            {"assetPath": "/Game/A", "name": "A"},
+            {"assetPath": "/Game/B", "name": "B"},
+        ]
+
+        result = self._run(configs, subsystem, validate=False)
+
+        assert result["success"] is True
+        assert events == ["spawn", "spawn", "label:A", "label:B"]
+        assert [a["name"] for a in result["spawnedActors"]] == ["A", "B"]
+
+    def test_unnamed_actor_uses_engine_label(self):
+        subsystem = MagicMock()
+        subsystem.spawn_actor_from_object.return_value = _make_spawned_actor("StaticMeshActor_3")
+
+        result = self._run([{"assetPath": "/Game/A"}], subsystem, validate=False)
+
+        assert result["spawnedActors"][0]["name"] == "StaticMeshActor_3"
+
+    def test_common_folder_applied(self):
+        subsystem = MagicMock()
+        actor = _make_spawned_actor()
+        subsystem.spawn_actor_from_object.return_value = actor
+
+        self._run([{"assetPath": "/Game/A", "folder": "Ignored"}], subsystem, commonFolder="Walls", validate=False)
+
+        actor.set_folder_path.assert_called_once_with("Walls")
+
+    def test_failed_spawn_reported(self):
+        subsystem = MagicMock()
+        subsystem.spawn_actor_from_object.return_value = None
+
+        result = self._run([{"assetPath": "/Game/A"}, {}], subsystem, validate=False)
+
+        assert result["spawnedActors"] == []
+        assert len(result["failedSpawns"]) == 2
+        assert result["failedSpawns"][1]["error"] == "Missing required assetPath"
+
+    def test_actor_refs_not_returned(self):
+        subsystem = MagicMock()
+        actor = _make_spawned_actor()
+        subsystem.spawn_actor_from_object.return_value = actor
+        subsystem.get_all_level_actors.return_value = [actor]
+
+        for validate in (True, False):
+            result = self._run([{"assetPath": "/Game/A", "name": "A"}], subsystem, validate=validate)
+            assert "_actor_ref" not in result["spawnedActors"][0]
+
+    def test_validation_checks_level_membership(self):
+        subsystem = MagicMock()
+        placed, missing = _make_spawned_actor(), _make_spawned_actor()
+        subsystem.spawn_actor_from_object.side_effect = [placed, missing]
+        subsystem.get_all_level_actors.return_value = [placed]
+
+        result = self._run([{"assetPath": "/Game/A", "name": "A"}, {"assetPath": "/Game/A", "name": "B"}], subsystem)
+
+        assert [a["name"] for a in result["spawnedActors"]] == ["A"]
+        assert "Actor B failed validation" in result["failedSpawns"][0]["error"]
+        subsystem.get_all_level_actors.assert_called_once_with()
+
+    def test_asset_loaded_once_per_path(self):
+        subsystem = MagicMock()
+        subsystem.spawn_actor_from_object.side_effect = lambda *args: _make_spawned_actor()
+        load_asset = MagicMock(side_effect=lambda path: MagicMock(name=path))
+        configs = [{"assetPath": "/Game/A"}, {"assetPath": "/Game/B"}, {"assetPath": "/Game/A"}]
+
+        result = self._run(configs, subsystem, load_asset=load_asset, validate=False)
+
+        assert len(result["spawnedActors"]) == 3
+        assert [c.args[0] for c in load_asset.call_args_list] == ["/Game/A", "/Game/B"]
+
+    def test_failed_asset_load_not_retried(self):
+        subsystem = MagicMock()
+        load_asset = MagicMock(return_value=None)
+
+        result = self._run([{"assetPath": "/Game/Missing"}] * 3, subsystem, load_asset=load_asset, validate=False)
+
+        assert len(result["failedSpawns"]) == 3
+        load_asset.assert_called_once_with("/Game/Missing")
+
+    def test_unit_scale_not_reapplied(self):
+        subsystem = MagicMock()
+        unit, scaled = _make_spawned_actor(), _make_spawned_actor()
+        subsystem.spawn_actor_from_object.side_effect = [unit, scaled]
+
+        self._run([{"assetPath": "/Game/A"}, {"assetPath": "/Game/A", "scale": [2, 2, 1]}], subsystem, validate=False)
+
+        unit.set_actor_scale3d.assert_not_called()
+        scaled.set_actor_scale3d.assert_called_once()
+
+    def test_rotators_shared_for_repeated_rotations(self):
+        subsystem = MagicMock()
+        subsystem.spawn_actor_from_object.side_effect = lambda *args: _make_spawned_actor()
+        configs = [
+            {"assetPath": "/Game/A", "rotation": [0, 0, 90]},
+            {"assetPath": "/Game/A", "rotation": [0, 0, 90]},
+            {"assetPath": "/Game/A", "rotation": [0, 0, 180]},
+        ]
+
+        with patch("ops.actor.unreal.Rotator") as rotator:
+            self._run(configs, subsystem, validate=False)
+
+        assert [c.args for c in rotator.call_args_list] == [(0, 0, 90), (0, 0, 180)]
+
+    def test_subsystem_resolved_once_per_batch(self):
+        subsystem = MagicMock()
+        subsystem.spawn_actor_from_object.side_effect = lambda *args: _make_spawned_actor()
+        get_subsystem = MagicMock(return_value=subsystem)
+
+        with patch("ops.actor.get_actor_subsystem", get_subsystem), patch("ops.actor.load_asset", MagicMock()):
+            result = ActorOperations().batch_spawn([{"assetPath": "/Game/A"}] * 4, validate=False)
+
+        assert len(result["spawnedActors"]) == 4
+        get_subsystem.assert_called_once()
+
+    def test_batch_wrapped_in_single_transaction(self):
+        subsystem = MagicMock()
+        subsystem.spawn_actor_from_object.side_effect = lambda *args: _make_spawned_actor()
+
+        with patch("ops.actor.unreal.ScopedEditorTransaction") as transaction:
+            self._run([{"assetPath": "/Game/A"}] * 3, subsystem, validate=False)
+
+        transaction.assert_called_once_with("UEMCP Batch Spawn")
+        transaction.return_value.__enter__.assert_called_once()
+
+
+class TestOrganize:
+    """Test organize matching by name list and pattern."""
+
+    def _actors(self, *labels):
+        actors = []
+        for label in labels:
+            actor = MagicMock()
+            actor.__class__ = mock_unreal.Actor
+            actor.get_actor_label.return_value = label
+            actors.append(actor)
+        return actors
+
+    def test_organize_by_names(self):
+        all_actors = self._actors("Wall_1", "Wall_2", "Floor_1")
+
+        organized = ActorOperations()._organize_actors_by_criteria(all_actors, ["Floor_1", "Wall_1"], None, "House")
+
+        assert organized == ["Wall_1", "Floor_1"]
+        all_actors[0].set_folder_path.assert_called_once_with("House")
+        all_actors[1].set_folder_path.assert_not_called()
+
+    def test_organize_by_pattern(self):
+        all_actors = self._actors("Wall_1", "Wall_2", "Floor_1")
+
+        organized = ActorOperations()._organize_actors_by_criteria(all_actors, None, "Wall", "House")
+
+        assert organized == ["Wall_1", "Wall_2"]
+
+    def test_organize_moves_in_one_transaction(self):
+        all_actors = self._actors("Wall_1", "Wall_2")
+
+        with patch("ops.actor.unreal.ScopedEditorTransaction") as transaction:
+            ActorOperations()._organize_actors_by_criteria(all_actors, None, "Wall", "House")
+
+        transaction.assert_called_once_with("UEMCP Organize Actors")
+
+    def test_organize_by_glob_pattern(self):
+        all_actors = self._actors("Wall_1", "Floor_Wall_1", "Wall_Corner")
+
+        organized = ActorOperations()._organize_actors_by_criteria(all_actors, None, "glob:Wall_?", "House")
+
+        assert organized == ["Wall_1"]
+
+    def test_organize_wildcard_characters_without_prefix_match_literally(self):
+        all_actors = self._actors("Light[0]", "Light0", "Spot_Light[0]_Copy")
+
+        organized = ActorOperations()._organize_actors_by_criteria(all_actors, None, "Light[0]", "House")
+
+        assert organized == ["Light[0]", "Spot_Light[0]_Copy"]
+
+    def test_organize_by_compiled_regex(self):
+        all_actors = self._actors("Wall_1", "Wall_12", "Floor_Wall_3")
+
+        organized = ActorOperations()._organize_actors_by_criteria(all_actors, None, re.compile(r"^Wall_\d$"), "House")
+
+        assert organized == ["Wall_1"]
+
+    def test_organize_skips_non_actors(self):
+        all_actors = [None, MagicMock()] + self._actors("Wall_1")
+
+        organized = ActorOperations()._organize_actors_by_criteria(all_actors, None, "Wall", "House")
+
+        assert organized == ["Wall_1"]
+        all_actors[1].set_folder_path.assert_not_called()
+
+    def test_organize_without_criteria_moves_nothing(self):
+        all_actors = self._actors("Wall_1")
+
+        assert ActorOperations()._organize_actors_by_criteria(all_actors, None, None, "House") == []
+        all_actors[0].set_folder_path.assert_not_called()
+
+
+class TestModify:
+    """Test how modify applies transform changes."""
+
+    def test_location_and_rotation_set_together(self):
+        actor = MagicMock()
+
+        ActorOperations()._apply_actor_modifications(actor, [1, 2, 3], [0, 0, 90], None, None, None)
+
+        actor.set_actor_location_and_rotation.assert_called_once()
+        actor.set_actor_location.assert_not_called()
+        actor.set_actor_rotation.assert_not_called()
+
+    def test_location_only(self):
+        actor = MagicMock()
+
+        ActorOperations()._apply_actor_modifications(actor, [1, 2, 3], None, None, None, None)
+
+        actor.set_actor_location.assert_called_once()
+        actor.set_actor_location_and_rotation.assert_not_called()
+
+    def test_no_changes_returns_without_touching_actor(self):
+        actor = MagicMock()
+
+        with (
+            patch("ops.actor.require_actor", return_value=actor),
+            patch("ops.actor.validate_actor_modifications") as validate,
+        ):
+            result = ActorOperations().modify("Wall")
+
+        assert result["success"] is True
+        assert result["modified"] is False
+        actor.get_actor_location.assert_not_called()
+        validate.assert_not_called()
+
+    def test_result_echoes_set_values_without_engine_reads(self):
+        actor = MagicMock()
+        actor.get_actor_scale3d.return_value = SimpleNamespace(x=1.0, y=1.0, z=2.0)
+
+        result = ActorOperations()._build_modification_result(actor, "Wall", [1, 2, 3], [0, 0, 90])
+
+        assert result["location"] == [1.0, 2.0, 3.0]
+        assert result["rotation"] == [0.0, 0.0, 90.0]
+        assert result["scale"] == [1.0, 1.0, 2.0]
+        actor.get_actor_location.assert_not_called()
+        actor.get_actor_rotation.assert_not_called()
+
+
+class TestDuplicate:
+    """Test duplicate offset handling."""
+
+    def _run(self, subsystem=None, validate=False, **kwargs):
+        source = MagicMock()
+        source.get_actor_location.return_value = SimpleNamespace(x=100.0, y=0.0, z=0.0)
+        source.get_folder_path.return_value = ""
+        with (
+            patch("ops.actor.require_actor", return_value=source),
+            patch("ops.actor.get_actor_subsystem", return_value=subsystem or MagicMock()),
+            patch("ops.actor.unreal.Vector", side_effect=lambda x, y, z: SimpleNamespace(x=x, y=y, z=z)),
+        ):
+            return ActorOperations().duplicate("Wall", validate=validate, **kwargs)
+
+    def test_list_offset(self):
+        result = self._run(offset=[10, 20, 30])
+
+        assert result["location"] == {"x": 110.0, "y": 20.0, "z": 30.0}
+
+    def test_dict_offset(self):
+        result = self._run(offset={"x": 0, "y": -50, "z": 0})
+
+        assert result["location"] == {"x": 100.0, "y": -50.0, "z": 0.0}
+
+    def test_no_offset(self):
+        assert self._run()["location"] == {"x": 100.0, "y": 0.0, "z": 0.0}
+
+    def test_validation_reuses_computed_values(self):
+        subsystem = MagicMock()
+        new_actor = subsystem.spawn_actor_from_object.return_value
+        new_actor.get_actor_label.return_value = "Wall_Copy"
+
+        with patch("ops.actor.validate_actor_spawn", return_value=MagicMock(errors=[], warnings=[])) as validate:
+            result = self._run(subsystem, validate=True, offset=[0, 0, 5])
+
+        assert result["actorName"] == "Wall_Copy"
+        assert validate.call_args.args == (new_actor,)
+        assert validate.call_args.kwargs["expected_location"] == [100.0, 0.0, 5.0]
+        new_actor.get_actor_label.assert_called_once_with()
+
+
+class TestModifyMany:
+    """Test bulk modify resolves names once and reports per-actor failures."""
+
+    def _run(self, index, modifications):
+        with (
+            patch("ops.actor.build_actor_name_index", return_value=index) as build_index,
+            patch("ops.actor.unreal.ScopedEditorTransaction") as transaction,
+        ):
+            result = ActorOperations().modify_many(modifications, validate=False)
+        return result, build_index, transaction
+
+    def test_applies_all_in_one_scan_and_transaction(self):
+        wall, floor = MagicMock(), MagicMock()
+
+        result, build_index, transaction = self._run(
+            {"Wall": wall, "Floor": floor},
+            [{"actorName": "Wall", "location": [1, 2, 3]}, {"actorName": "Floor", "folder": "House"}],
+        )
+
+        assert [r["actorName"] for r in result["modifiedActors"]] == ["Wall", "Floor"]
+        wall.set_actor_location.assert_called_once()
+        floor.set_folder_path.assert_called_once_with("House")
+        build_index.assert_called_once_with()
+        transaction.assert_called_once_with("UEMCP Modify Actors")
+
+    def test_mesh_swaps_mark_each_actor_modified_once_after_batch(self):
+        wall = MagicMock()
+        events = []
+        wall.modify.side_effect = lambda: events.append("modify")
+        mesh_component = wall.get_component_by_class.return_value
+        mesh_component.set_static_mesh.side_effect = lambda mesh: events.append("set_mesh")
+
+        with patch("ops.actor.require_asset"):
+            result, _, _ = self._run(
+                {"Wall": wall}, [{"actorName": "Wall", "mesh": "/Game/A"}, {"actorName": "Wall", "mesh": "/Game/B"}]
+            )
+
+        assert result["modifiedCount"] == 2
+        assert events == ["set_mesh", "set_mesh", "modify"]
+
+    def test_missing_and_invalid_entries_reported(self):
+        wall = MagicMock()
+
+        result, _, _ = self._run({"Wall": wall}, [{"actorName": "Ghost"}, {"actorName": "Wall", "scale": [1, 2]}])
+
+        assert result["modifiedCount"] == 0
+        assert [f["actorName"] for f in result["failedActors"]] == ["Ghost", "Wall"]
+        wall.set_actor_scale3d.assert_not_called()
+
+    def test_failed_mesh_swap_leaves_actor_untouched(self):
+        wall = MagicMock()
+        wall.get_component_by_class.return_value = None
+
+        result, _, _ = self._run({"Wall": wall}, [{"actorName": "Wall", "location": [1, 2, 3], "mesh": "/Game/A"}])
+
+        assert [f["actorName"] for f in result["failedActors"]] == ["Wall"]
+        wall.set_actor_location.assert_not_called()
+
+    def test_non_dict_entry_rejects_whole_batch(self):
+        wall = MagicMock()
+
+        result, build_index, _ = self._run({"Wall": wall}, [{"actorName": "Wall", "folder": "House"}, "Floor"])
+
+        assert result["success"] is False
+        assert "modifications[1]" in result["error"]
+        build_index.assert_not_called()
+        wall.set_folder_path.assert_not_called()
+
+    def test_entry_without_changes_skipped(self):
+        wall, floor = MagicMock(), MagicMock()
+
+        result, _, _ = self._run(
+            {"Wall": wall, "Floor": floor}, [{"actorName": "Wall"}, {"actorName": "Floor", "folder": "F"}]
+        )
+
+        assert [r["actorName"] for r in result["modifiedActors"]] == ["Floor"]
+        assert result["skippedActors"] == ["Wall"]
+        assert result["failedActors"] == []
+
+    def test_deferred_refresh_recorded_inside_transaction(self):
+        wall = MagicMock()
+        events = []
+        wall.modify.side_effect = lambda: events.append("modify")
+
+        with (
+            patch("ops.actor.require_asset"),
+            patch("ops.actor.build_actor_name_index", return_value={"Wall": wall}),
+            patch("ops.actor.unreal.ScopedEditorTransaction") as transaction,
+        ):
+            transaction.return_value.__exit__.side_effect = lambda *args: events.append("end_transaction")
+            ActorOperations().modify_many([{"actorName": "Wall", "mesh": "/Game/A"}], validate=False)
+
+        assert events == ["modify", "end_transaction"]
+
+
+class TestDeleteMany:
+    """Test bulk delete destroys found actors together."""
+
+    def test_destroys_found_actors_in_one_call(self):
+        wall, floor = MagicMock(), MagicMock()
+        subsystem = MagicMock()
+
+        with (
+            patch("ops.actor.build_actor_name_index", side_effect=[{"Wall": wall, "Floor": floor}, {}]),
+            patch("ops.actor.get_actor_subsystem", return_value=subsystem),
+        ):
+            result = ActorOperations().delete_many(["Wall", "Ghost", "Floor"])
+
+        subsystem.destroy_actors.assert_called_once_with([wall, floor])
+        assert result["deletedActors"] == ["Wall", "Floor"]
+        assert result["notFound"] == ["Ghost"]
+        assert result["validated"] is True
+
+    def test_duplicate_names_deleted_once(self):
+        wall = MagicMock()
+        subsystem = MagicMock()
+
+        with (
+            patch("ops.actor.build_actor_name_index", side_effect=[{"Wall": wall}, {}]),
+            patch("ops.actor.get_actor_subsystem", return_value=subsystem),
+        ):
+            result = ActorOperations().delete_many(["Wall", "Ghost", "Wall", "Ghost"])
+
+        subsystem.destroy_actors.assert_called_once_with([wall])
+        assert result["deletedActors"] == ["Wall"]
+        assert result["notFound"] == ["Ghost"]
+
+    def test_non_string_name_rejects_whole_batch(self):
+        with patch("ops.actor.build_actor_name_index") as build_index:
+            result = ActorOperations().delete_many(["Wall", ["A"]])
+
+        assert result["success"] is False
+        assert "actorNames[1]" in result["error"]
+        build_index.assert_not_called()
+
+    def test_validation_reports_survivors(self):
+        wall = MagicMock()
+
+        with (
+            patch("ops.actor.build_actor_name_index", side_effect=[{"Wall": wall}, {"Wall": wall}]),
+            patch("ops.actor.get_actor_subsystem"),
+        ):
+            result = ActorOperations().delete_many(["Wall"], validate=True)
+
+        assert result["validated"] is False
+        assert result["validation_errors"] == ["Actor 'Wall' still exists in level"]
+
+
+def _box(name, location, size):
+    half = [s / 2 for s in size]
+    return ActorBoundsInfo(
+        MagicMock(),
+        name,
+        list(location),
+        [location[i] - half[i] for i in range(3)],
+        [location[i] + half[i] for i in range(3)],
+    )
+
+
+class TestPlacementIssues:
+    """Test gap / overlap classification between actor bounds."""
+
+    def test_gap_reports_smallest_axis_separation(self):
+        a = _box("A", [0, 0, 0], [100, 100, 100])
+        b = _box("B", [150, 300, 0], [100, 100, 100])
+
+        result = ActorOperations()._calculate_gap_overlap(a, b, 10.0)
+
+        assert result == {"type": "gap", "distance": 50, "location": [75.0, 150.0, 0.0], "direction": "X"}
+
+    def test_overlap_reports_deepest_axis(self):
+        a = _box("A", [0, 0, 0], [100, 100, 100])
+        b = _box("B", [80, 40, 0], [100, 100, 100])
+
+        result = ActorOperations()._calculate_gap_overlap(a, b, 10.0)
+
+        assert result["type"] == "overlap"
+        assert result["distance"] == 100
+        assert result["direction"] == "Z"
+        assert result["location"] == [40.0, 20.0, 0.0]
+
+    def test_touching_actors(self):
+        a = _box("A", [0, 0, 0], [100, 100, 100])
+        b = _box("B", [100, 100, 100], [100, 100, 100])
+
+        assert ActorOperations()._calculate_gap_overlap(a, b, 10.0)["type"] == "touching"
+
+    def test_each_pair_checked_once(self):
+        boxes = [_box("A", [0, 0, 0], [100] * 3), _box("B", [200, 0, 0], [100] * 3), _box("C", [60, 0, 0], [100] * 3)]
+
+        gaps, overlaps, _ = ActorOperations()._detect_placement_issues(boxes, 10.0, 300.0)
+
+        assert [g["actors"] for g in gaps] == [["A", "B"], ["B", "C"]]
+        assert [o["actors"] for o in overlaps] == [["A", "C"]]
+
+    def test_scan_pairs_matches_pair_classification(self):
+        boxes = [
+            _box("A", [0, 0, 0], [100] * 3),
+            _box("B", [150, 300, 0], [100] * 3),
+            _box("C", [80, 40, 0], [100] * 3),
+            _box("D", [100, 100, 100], [100] * 3),
+        ]
+        ops = ActorOperations()
+
+        hits = _scan_pairs([b.bounds_min for b in boxes], [b.bounds_max for b in boxes], -1.0, 1000.0)
+
+        expected = []
+        for i in range(len(boxes) - 1):
+            for j in range(i + 1, len(boxes)):
+                a, b = boxes[i], boxes[j]
+                kind, distance, axis = ops._pair_gap_overlap(a.bounds_min, a.bounds_max, b.bounds_min, b.bounds_max)
+                if distance:
+                    expected.append((i, j, kind, distance, axis))
+        assert hits == expected
+
+    def test_distant_actors_not_compared(self):
+        boxes = [
+            _box("A", [0, 0, 0], [100] * 3),
+            _box("Far", [0, 0, 1000], [100] * 3),
+            _box("B", [160, 0, 0], [100] * 3),
+        ]
+
+        gaps, overlaps, _ = ActorOperations()._detect_placement_issues(boxes, 10.0, 300.0)
+
+        assert [g["actors"] for g in gaps] == [["A", "B"]]
+        assert overlaps == []
+
+    def test_sweep_reports_in_actor_order(self):
+        # Listed right-to-left, so the sweep visits them in reverse
+        boxes = [_box(str(i), [(5 - i) * 120, (i % 2) * 30, 0], [100] * 3) for i in range(6)]
+        mins, maxs = [b.bounds_min for b in boxes], [b.bounds_max for b in boxes]
+
+        hits = _scan_pairs(mins, maxs, 10.0, 300.0)
+
+        assert [(i, j) for i, j, *_ in hits] == [(i, j) for i in range(6) for j in range(i + 1, min(i + 4, 6))]
+
+    def test_grid_yields_each_neighbour_pair_once(self):
+        boxes = [_box(str(i), [(i % 4) * 300, (i // 4) * 300, 0], [300, 300, 100]) for i in range(16)]
+
+        pairs = list(_neighbour_pairs([b.bounds_min for b in boxes], [b.bounds_max for b in boxes], 300.0))
+
+        assert len(pairs) == len(set(pairs))
+        assert all(i < j for i, j in pairs)
+        assert (0, 5) in pairs and (0, 3) not in pairs
+
+    def test_large_actor_compared_with_everything(self):
+        boxes = [_box("Floor", [0, 0, -60], [30000, 30000, 100]), _box("A", [9000, 9000, 0], [100] * 3)]
+
+        _, overlaps, _ = ActorOperations()._detect_placement_issues(boxes, 1.0, 300.0)
+
+        assert [o["actors"] for o in overlaps] == [["Floor", "A"]]
+
+    def test_gather_reads_only_location_and_bounds(self):
+        actors = {}
+        for i, name in enumerate(("A", "B")):
+            actor = MagicMock()
+            actor.get_actor_location.return_value = MagicMock(x=i * 100.0, y=0.0, z=0.0)
+            actor.get_actor_bounds.return_value = (MagicMock(), MagicMock(x=50.0, y=50.0, z=50.0))
+            actors[name] = actor
+
+        with patch("ops.actor.build_actor_name_index", return_value=actors):
+            actor_data, error = ActorOperations()._gather_actor_data(["A", "B"])
+
+        assert error is None
+        assert [d.name for d in actor_data] == ["A", "B"]
+        assert actor_data[1].bounds_min == [50.0, -50.0, -50.0]
+        actors["A"].get_actor_label.assert_not_called()
+
+    def test_alignment_reports_only_off_grid_actors(self):
+        boxes = [_box("OnGrid", [300, -600, 0], [100] * 3), _box("Off", [300, 620, 0], [100] * 3)]
+
+        issues = ActorOperations()._check_all_alignments(boxes, 300.0, 10.0)
+
+        assert issues == [
+            {
+                "actor": "Off",
+                "currentLocation": [300, 620, 0],
+                "suggestedLocation": [300, 600.0, 0],
+                "offset": [0, 20.0, 0],
+                "axis": "Y",
+            }
+        ]
+
+    def test_severity_counted_during_detection(self):
+        # Overlap depths 100 (critical), 40 (major) and 20 (minor) against a 300 unit grid
+        boxes = [
+            _box("A", [0, 0, 0], [100] * 3),
+            _box("B", [0, 0, 0], [100] * 3),
+            _box("C", [1000, 0, 0], [100] * 3),
+            _box("D", [1060, 60, 60], [100] * 3),
+            _box("E", [2000, 0, 0], [100] * 3),
+            _box("F", [2080, 80, 80], [100] * 3),
+        ]
+        ops = ActorOperations()
+
+        _, overlaps, counts = ops._detect_placement_issues(boxes, 10.0, 300.0)
+        status = ops._determine_overall_status(counts, [], overlaps, [], 3)
+        result = ops._build_validation_result(counts, [], overlaps, [], status, 6, 0.0)
+
+        assert [o["severity"] for o in overlaps] == ["critical", "major", "minor"]
+        assert counts == (1, 1)
+        assert status == "critical_issues"
+        assert result["summary"]["criticalOverlaps"] == 1
+        assert result["summary"]["majorOverlaps"] == 1
+
+
+class TestSnapBatch:
+    """Test snapping many actors to one socket."""
+
+    def _run(self, index, **kwargs):
+        socket_transform = MagicMock()
+        socket_transform.translation = SimpleNamespace(x=100.0, y=0.0, z=50.0)
+        ops = ActorOperations()
+        with (
+            patch("ops.actor.build_actor_name_index", return_value=index),
+            patch.object(ops, "_get_target_socket_transform", return_value=socket_transform) as socket_lookup,
+            patch("ops.actor.unreal.ScopedEditorTransaction") as transaction,
+        ):
+            result = ops.snap_batch(targetActor="Post", targetSocket="Top", **kwargs)
+        return result, socket_lookup, transaction
+
+    def test_socket_resolved_once_for_all_sources(self):
+        index = {"Post": MagicMock(), "Lamp_1": MagicMock(), "Lamp_2": MagicMock()}
+
+        result, socket_lookup, transaction = self._run(index, sourceActors=["Lamp_1", "Lamp_2"], validate=False)
+
+        assert result["success"] is True
+        assert result["snappedActors"] == ["Lamp_1", "Lamp_2"]
+        assert result["newLocations"] == [[100.0, 0.0, 50.0]] * 2
+        socket_lookup.assert_called_once()
+        transaction.assert_called_once_with("UEMCP Snap Batch")
+        index["Lamp_2"].set_actor_location.assert_called_once()
+
+    def test_missing_source_reported(self):
+        index = {"Post": MagicMock(), "Lamp_1": MagicMock()}
+
+        result, _, _ = self._run(index, sourceActors=["Lamp_1", "Ghost"], validate=False)
+
+        assert result["snappedActors"] == ["Lamp_1"]
+        assert [f["actorName"] for f in result["failedActors"]] == ["Ghost"]
+
+    def test_validation_flags_actors_that_did_not_move(self):
+        lamp, stuck = MagicMock(), MagicMock()
+        lamp.get_actor_location.return_value = SimpleNamespace(x=100.0, y=0.0, z=50.0)
+        stuck.get_actor_location.return_value = SimpleNamespace(x=0.0, y=0.0, z=0.0)
+
+        result, _, _ = self._run({"Post": MagicMock(), "Lamp": lamp, "Stuck": stuck}, sourceActors=["Lamp", "Stuck"])
+
+        assert result["validation"] == {"success": False, "mismatchedActors": ["Stuck"]}
+
+    def test_offsets_must_match_sources(self):
+        result, _, _ = self._run({"Post": MagicMock()}, sourceActors=["A", "B"], offsets=[[0, 0, 1]])
+
+        assert result["success"] is False
+
+    def test_target_in_sources_rejects_whole_batch(self):
+        index = {"Post": MagicMock(), "Lamp": MagicMock()}
+
+        result, socket_lookup, _ = self._run(index, sourceActors=["Lamp", "Post"])
+
+        assert result["success"] is False
+        assert "Post" in result["error"]
+        socket_lookup.assert_not_called()
+        index["Lamp"].set_actor_location.assert_not_called()
+
+    def test_malformed_offset_rejects_whole_batch(self):
+        index = {"Post": MagicMock(), "A": MagicMock(), "B": MagicMock()}
+
+        result, socket_lookup, _ = self._run(index, sourceActors=["A", "B"], offsets=[[0, 0, 1], [0, 1]])
+
+        assert result["success"] is False
+        assert "offsets[1]" in result["error"]
+        socket_lookup.assert_not_called()
+        index["A"].set_actor_location.assert_not_called()
+
+
+class TestSpawnHandlers:
+    """Test spawn helpers: asset type -> handler dispatch and generated names."""
+
+    def test_auto_names_unique_within_one_second(self):
+        with patch("ops.actor.time.time", return_value=1700000000.0):
+            names = {ActorOperations._auto_actor_name() for _ in range(3)}
+
+        assert len(names) == 3
+        assert all(name.startswith("UEMCP_Actor_1700000000_") for name in names)
+
+    def test_exact_type(self):
+        static_mesh = type("StaticMesh", (), {})()
+
+        assert ActorOperations._get_spawn_handler(static_mesh) is ActorOperations._spawn_static_mesh
+
+    def test_subclass_uses_parent_handler(self):
+        blueprint = type("Blueprint", (), {})
+        anim_blueprint = type("AnimBlueprint", (blueprint,), {})()
+
+        assert ActorOperations._get_spawn_handler(anim_blueprint) is ActorOperations._spawn_blueprint
+
+    def test_unsupported_type(self):
+        assert ActorOperations._get_spawn_handler(type("SoundWave", (), {})()) is None
+
+
+class TestValidateDefault:
+    """Test the UEMCP_VALIDATE environment default for validate parameters."""
+
+    def _reload_with(self, value):
+        with patch.dict(os.environ, {"UEMCP_VALIDATE": value}):
+            return importlib.reload(ops.actor)
+
+    def test_env_disables_validation_by_default(self):
+        try:
+            for value, expected in (("0", False), ("off", False), (" TRUE ", True), ("1", True)):
+                module = self._reload_with(value)
+                assert module._DEFAULT_VALIDATE is expected
+                signature = inspect.signature(module.ActorOperations.modify_many)
+                assert signature.parameters["validate"].default is expected
+        finally:
+            # Restore the module as loaded without the variable set
+            with patch.dict(os.environ):
+                os.environ.pop("UEMCP_VALIDATE", None)
+                importlib.reload(ops.actor)
+
+        assert ops.actor._DEFAULT_VALIDATE is True
@@ -1,12 +1,12 @@
 """
 Unit tests for Enhanced Input System operations.
 
-Tests TRIGGER_TYPE_MAP and MODIFIER_TYPE_MAP constants without requiring Unreal Engine.
+Tests TRIGGER_TYPE_MAP and MODIFIER_TYPE_MAP constants and list_actions without requiring Unreal Engine.
 """
 
 import os
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 if "unreal" not in sys.modules:
     mock_unreal = MagicMock()
@@ -89,3 +89,29 @@ class TestModifierTypeMap:
         from ops.input_system import MODIFIER_TYPE_MAP
 
         assert MODIFIER_TYPE_MAP["deadzone"] == "InputModifierDeadZone"
+
+
+class TestListActions:
+    """Test list_actions registry filtering."""
+
+    def _asset_data(self, name):
+        data = MagicMock()
+        data.asset_name = name
+        data.package_name = f"/Game/Input/{name}"
+        return data
+
+    def test_only_matching_actions_loaded(self):
+        from ops.input_system import list_actions
+
+        registry = MagicMock()
+        registry.get_assets.return_value = [self._asset_data("IA_Jump"), self._asset_data("IA_Move")]
+
+        with (
+            patch.object(mock_unreal.AssetRegistryHelpers, "get_asset_registry", return_value=registry),
+            patch.object(mock_unreal.EditorAssetLibrary, "load_asset") as load_asset,
+        ):
+            result = list_actions(path="/Game/Input", filter="jump")
+
+        load_asset.assert_called_once_with("/Game/Input/IA_Jump.IA_Jump")
+        assert [a["name"] for a in result["actions"]] == ["IA_Jump"]
+        assert result["actions"][0]["path"] == "/Game/Input/IA_Jump.IA_Jump"
@@ -0,0 +1,126 @@
+"""
+Unit tests for level operations.
+
+Tests the pure Python outliner tree handling in ops.level without a running
+editor.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+if "unreal" not in sys.modules:
+    sys.modules["unreal"] = MagicMock()
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+from ops.level import LevelOperations  # noqa: E402
+
+
+def _folder(actors=None, subfolders=None):
+    return {"actors": actors or [], "subfolders": subfolders or {}}
+
+
+class TestFinalizeFolders:
+    """Test the combined sort / prune / count walk over the outliner tree."""
+
+    def test_sorts_and_counts(self):
+        tree = {"House": _folder(["Wall_2", "Wall_1"], {"Doors": _folder(["Door_B", "Door_A"])})}
+
+        count = LevelOperations()._finalize_folders(tree, showEmpty=False)
+
+        assert count == 2
+        assert tree["House"]["actors"] == ["Wall_1", "Wall_2"]
+        assert tree["House"]["subfolders"]["Doors"]["actors"] == ["Door_A", "Door_B"]
+
+    def test_prunes_nested_empty_folders(self):
+        tree = {"Deep": _folder(subfolders={"Deeper": _folder()}), "Lights": _folder(["Sun"])}
+
+        count = LevelOperations()._finalize_folders(tree, showEmpty=False)
+
+        assert count == 1
+        assert list(tree) == ["Lights"]
+
+    def test_keeps_empty_folders_when_requested(self):
+        tree = {"Deep": _folder(subfolders={"Deeper": _folder()})}
+
+        count = LevelOperations()._finalize_folders(tree, showEmpty=True)
+
+        assert count == 2
+        assert "Deeper" in tree["Deep"]["subfolders"]
+
+
+class TestBuildFolderStructure:
+    """Test grouping actors into the outliner tree."""
+
+    def _actor(self, label, folder):
+        actor = MagicMock()
+        actor.__class__ = sys.modules["unreal"].Actor
+        actor.get_actor_label.return_value = label
+        actor.get_folder_path.return_value = folder
+        return actor
+
+    def test_groups_actors_sharing_a_folder(self):
+        actors = [
+            self._actor("Wall_1", "House/Walls"),
+            self._actor("Wall_2", "House/Walls"),
+            self._actor("Roof", "House"),
+            self._actor("Cube", ""),
+        ]
+
+        tree, unorganized, organized = LevelOperations()._build_folder_structure(actors, maxDepth=10)
+
+        assert tree["House"]["actors"] == ["Roof"]
+        assert tree["House"]["subfolders"]["Walls"]["actors"] == ["Wall_1", "Wall_2"]
+        assert unorganized == ["Cube"]
+        assert organized == 3
+
+    def test_actors_beyond_max_depth_not_listed(self):
+        actors = [self._actor("Door", "House/Walls/Doors"), self._actor("Window", "House/Walls/Doors")]
+
+        tree, _, organized = LevelOperations()._build_folder_structure(actors, maxDepth=2)
+
+        assert tree["House"]["subfolders"]["Walls"] == _folder()
+        assert organized == 2
+
+
+class TestResetDemoScene:
+    """Test reset_demo_scene actor filtering and save behaviour."""
+
+    def _actor(self, label):
+        actor = MagicMock()
+        actor.get_actor_label.return_value = label
+        return actor
+
+    def _run(self, actors, **kwargs):
+        editor = MagicMock()
+        editor.get_all_level_actors.return_value = actors
+        with (
+            patch("ops.level.get_actor_subsystem", return_value=editor),
+            patch("ops.level.unreal.EditorLoadingAndSavingUtils") as saving,
+        ):
+            result = LevelOperations().reset_demo_scene(delete_test_assets=False, **kwargs)
+        return result, editor, saving
+
+    def test_keeps_baseline_actors(self):
+        actors = [self._actor("Demo_Sign"), self._actor("SkyLight"), self._actor("Cube_1")]
+
+        result, editor, _ = self._run(actors)
+
+        assert result["removedActors"] == ["Cube_1"]
+        editor.destroy_actors.assert_called_once_with([actors[2]])
+        editor.destroy_actor.assert_not_called()
+
+    def test_saves_only_map_packages_when_actors_removed(self):
+        result, _, saving = self._run([self._actor("Cube_1")])
+
+        assert result["saved"] is True
+        saving.save_dirty_packages.assert_called_once_with(True, False)
+
+    def test_skips_save_when_nothing_removed(self):
+        result, editor, saving = self._run([self._actor("Demo_Sign")])
+
+        assert result["saved"] is False
+        saving.save_dirty_packages.assert_not_called()
+        editor.destroy_actors.assert_not_called()
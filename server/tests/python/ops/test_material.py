@@ -0,0 +1,93 @@
+"""
+Unit tests for material operations.
+
+Tests material assignment bookkeeping in ops.material with actors and the
+editor subsystem mocked out.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+if "unreal" not in sys.modules:
+    sys.modules["unreal"] = MagicMock()
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+from ops.material import MaterialOperations  # noqa: E402
+
+
+def _material(path):
+    material = MagicMock()
+    material.get_path_name.return_value = path
+    return material
+
+
+def _mesh_actor(label, current_material=None):
+    actor = MagicMock()
+    actor.__class__ = sys.modules["unreal"].Actor
+    actor.get_actor_label.return_value = label
+    actor.static_mesh_component.get_material.return_value = current_material
+    return actor
+
+
+class TestApplyMaterialToActors:
+    """Test batched material assignment."""
+
+    def _run(self, actors, actor_names, material):
+        subsystem = MagicMock()
+        subsystem.get_all_level_actors.return_value = actors
+        with (
+            patch("ops.material.get_actor_subsystem", return_value=subsystem),
+            patch("ops.material.require_asset", return_value=material),
+        ):
+            result = MaterialOperations().apply_material_to_actors(actor_names, "/Game/M_Red")
+        return result, subsystem
+
+    def test_applies_and_selects_once(self):
+        material = _material("/Game/M_Red.M_Red")
+        actors = [_mesh_actor("A"), _mesh_actor("B"), _mesh_actor("C")]
+
+        result, subsystem = self._run(actors, ["A", "C", "Missing"], material)
+
+        assert result["success"] is True
+        assert result["appliedActors"] == ["A", "C"]
+        assert [f["actorName"] for f in result["failedActors"]] == ["Missing"]
+        actors[0].static_mesh_component.set_material.assert_called_once_with(0, material)
+        actors[1].static_mesh_component.set_material.assert_not_called()
+        subsystem.set_selected_level_actors.assert_called_once_with([actors[0], actors[2]])
+
+    def test_skips_slot_already_using_material(self):
+        material = _material("/Game/M_Red.M_Red")
+        actor = _mesh_actor("A", current_material=_material("/Game/M_Red.M_Red"))
+
+        result, _ = self._run([actor], ["A"], material)
+
+        assert result["appliedActors"] == ["A"]
+        actor.static_mesh_component.set_material.assert_not_called()
+
+    def test_adds_to_existing_selection(self):
+        material = _material("/Game/M_Red.M_Red")
+        picked, target = _mesh_actor("Picked"), _mesh_actor("A")
+        subsystem = MagicMock()
+        subsystem.get_all_level_actors.return_value = [picked, target]
+        subsystem.get_selected_level_actors.return_value = [picked]
+
+        with (
+            patch("ops.material.get_actor_subsystem", return_value=subsystem),
+            patch("ops.material.require_asset", return_value=material),
+        ):
+            MaterialOperations().apply_material_to_actors(["A"], "/Game/M_Red")
+
+        subsystem.set_selected_level_actors.assert_called_once_with([picked, target])
+
+    def test_repeated_names_applied_once(self):
+        material = _material("/Game/M_Red.M_Red")
+        actor = _mesh_actor("A")
+
+        result, _ = self._run([actor], ["A", "A", "Missing", "Missing"], material)
+
+        assert result["appliedActors"] == ["A"]
+        assert [f["actorName"] for f in result["failedActors"]] == ["Missing"]
+        actor.static_mesh_component.set_material.assert_called_once_with(0, material)
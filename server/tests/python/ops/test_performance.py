@@ -36,6 +36,7 @@ plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "
 sys.path.insert(0, plugin_path)
 
 from ops.performance import (  # noqa: E402
+    _LOD_ARG_SUPPORT,
     _is_instanced_component,
     _normalize_path,
     _safe_mesh_triangle_count,
@@ -50,10 +51,11 @@ from ops.performance import (  # noqa: E402
 # ---------------------------------------------------------------------------
 
 
-def _make_static_mesh(name="SM_Cube", path="/Game/Meshes/SM_Cube", tris=100, verts=80, lods=1):
+def _make_static_mesh(name="SM_Cube", path=None, tris=100, verts=80, lods=1):
     sm = Mock()
     sm.get_name.return_value = name
-    sm.get_path_name.return_value = path
+    # Distinct meshes need distinct asset paths, as in the engine
+    sm.get_path_name.return_value = path or f"/Game/Meshes/{name}"
     sm.get_num_triangles = Mock(return_value=tris)
     sm.get_num_vertices = Mock(return_value=verts)
     sm.get_num_lods.return_value = lods
@@ -119,6 +121,12 @@ def _make_actor(label="Actor_0", class_name="StaticMeshActor", sm_comps=None, sk
 class TestSafeMeshCounts:
     """Test the fallback logic for triangle/vertex counting."""
 
+    def setup_method(self):
+        _LOD_ARG_SUPPORT.clear()
+
+    def teardown_method(self):
+        _LOD_ARG_SUPPORT.clear()
+
     def test_triangle_count_via_get_num_triangles(self):
         sm = _make_static_mesh(tris=500)
         assert _safe_mesh_triangle_count(sm) == 500
@@ -151,6 +159,21 @@ class TestSafeMeshCounts:
         sm = Mock(spec=[])
         assert _safe_mesh_vertex_count(sm) == -1
 
+    def test_signature_probed_once(self):
+        def no_lod_arg(*args):
+            if args:
+                raise TypeError("get_num_triangles() takes no arguments")
+            return 42
+
+        first, second = Mock(), Mock()
+        first.get_num_triangles = Mock(side_effect=no_lod_arg)
+        second.get_num_triangles = Mock(side_effect=no_lod_arg)
+
+        assert _safe_mesh_triangle_count(first) == 42
+        assert _safe_mesh_triangle_count(second) == 42
+        # Once the no-argument form is known, the LOD-index form is not retried
+        second.get_num_triangles.assert_called_once_with()
+
 
 # ---------------------------------------------------------------------------
 # Tests for _is_instanced_component
@@ -213,6 +236,18 @@ class TestSceneBreakdownIntegration:
         assert result["actors_total_with_meshes"] == 5
         assert result["scene_triangles"] == sum((i + 1) * 100 for i in range(5))
 
+    @patch("ops.performance._get_all_actors")
+    def test_scene_breakdown_limit_keeps_top_entries_by_name(self, mock_actors):
+        """Limited name sort returns the alphabetically first actors."""
+        actors = []
+        for label in ("Charlie", "Alpha", "Delta", "Bravo"):
+            sm = _make_static_mesh(name=f"SM_{label}")
+            actors.append(_make_actor(label, sm_comps=[_make_sm_component(sm, [_make_material()])]))
+        mock_actors.return_value = actors
+
+        result = scene_breakdown(limit=2, sort_by="name")
+        assert [a["actor_name"] for a in result["actors"]] == ["Alpha", "Bravo"]
+
     @patch("ops.performance._get_all_actors")
     def test_scene_breakdown_invalid_sort_key(self, mock_actors):
         """scene_breakdown returns error for invalid sort_by."""
@@ -277,6 +312,33 @@ class TestRenderingStatsIntegration:
         # Instanced component: counted separately
         assert result["instanced_mesh_components"] == 1
 
+    @patch("ops.performance._get_all_actors")
+    def test_rendering_stats_scales_instanced_totals(self, mock_actors):
+        """Instanced components contribute triangles once per instance."""
+        sm = _make_static_mesh(tris=100, verts=80)
+        regular_comp = _make_sm_component(sm, [_make_material()], is_instanced=False)
+        instanced_comp = _make_sm_component(sm, [_make_material()], is_instanced=True, instance_count=10)
+        mock_actors.return_value = [_make_actor("Mixed", sm_comps=[regular_comp, instanced_comp])]
+
+        result = rendering_stats()
+        assert result["total_triangles"] == 100 + 100 * 10
+        assert result["total_vertices"] == 80 + 80 * 10
+        assert result["unique_meshes"] == 1
+
+    @patch("ops.performance._get_all_actors")
+    def test_rendering_stats_counts_shared_mesh_once(self, mock_actors):
+        """Triangle/vertex counts are read once per unique mesh but summed per component."""
+        sm = _make_static_mesh(tris=100, verts=80)
+        mock_actors.return_value = [
+            _make_actor(f"Cube_{i}", sm_comps=[_make_sm_component(sm, [_make_material()])]) for i in range(5)
+        ]
+
+        result = rendering_stats()
+        assert result["total_triangles"] == 500
+        assert result["total_vertices"] == 400
+        assert sm.get_num_triangles.call_count == 1
+        assert sm.get_num_vertices.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # Integration tests: call gpu_stats() with mocked actors
@@ -0,0 +1,83 @@
+"""
+Unit tests for the tool manifest generator.
+
+Tests manifest building and reuse against a stub command registry.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+if "unreal" not in sys.modules:
+    sys.modules["unreal"] = MagicMock()
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+from ops.tool_manifest import ManifestGenerator  # noqa: E402
+from uemcp_command_registry import CommandRegistry  # noqa: E402
+
+
+def actor_spawn(assetPath: str, name: str = ""):
+    """Spawn an actor."""
+
+
+def actor_spawn_v2(assetPath: str, name: str = "", folder: str = ""):
+    """Spawn an actor into a folder."""
+
+
+def _registry():
+    registry = CommandRegistry()
+    registry.register_command("actor_spawn", actor_spawn)
+    return registry
+
+
+class TestManifestGenerator:
+    """Test manifest generation and caching."""
+
+    def test_manifest_reused_until_registry_changes(self):
+        registry = _registry()
+        generator = ManifestGenerator()
+
+        with (
+            patch("uemcp_command_registry.get_registry", return_value=registry),
+            patch.object(generator, "extract_tool_definition", wraps=generator.extract_tool_definition) as extract,
+        ):
+            first = generator.generate_manifest()
+            second = generator.generate_manifest()
+            assert extract.call_count == 1
+
+            registry.register_command("actor_delete", actor_spawn, ["assetPath"])
+            third = generator.generate_manifest()
+
+        assert first == second
+        assert first["totalTools"] == 1
+        assert third["totalTools"] == 2
+        assert first["tools"][0]["inputSchema"]["required"] == ["assetPath"]
+
+    def test_reregistration_invalidates_cache(self):
+        registry = _registry()
+        generator = ManifestGenerator()
+
+        with patch("uemcp_command_registry.get_registry", return_value=registry):
+            first = generator.generate_manifest()
+            # Same command count, different signature
+            registry.register_command("actor_spawn", actor_spawn_v2)
+            second = generator.generate_manifest()
+
+        assert "folder" not in first["tools"][0]["inputSchema"]["properties"]
+        assert "folder" in second["tools"][0]["inputSchema"]["properties"]
+
+    def test_callers_cannot_mutate_cached_manifest(self):
+        registry = _registry()
+        generator = ManifestGenerator()
+
+        with patch("uemcp_command_registry.get_registry", return_value=registry):
+            first = generator.generate_manifest()
+            first["tools"][0]["name"] = "changed"
+            first["tools"].clear()
+            first["categories"].clear()
+            second = generator.generate_manifest()
+
+        assert [tool["name"] for tool in second["tools"]] == ["actor_spawn"]
+        assert second["categories"]
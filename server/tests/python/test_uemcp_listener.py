@@ -0,0 +1,85 @@
+"""
+Unit tests for the UEMCP HTTP listener.
+
+Tests kept-alive connection handling against a real ThreadingHTTPServer on an ephemeral port.
+"""
+
+import http.client
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+if "unreal" not in sys.modules:
+    sys.modules["unreal"] = MagicMock()
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+import uemcp_listener  # noqa: E402
+
+
+@pytest.fixture
+def listener():
+    """Serve UEMCPHandler on an ephemeral port with the listener marked running."""
+    server = uemcp_listener.ThreadingHTTPServer(("localhost", 0), uemcp_listener.UEMCPHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    with (
+        patch.object(uemcp_listener, "server_running", True),
+        patch.object(uemcp_listener, "get_tool_manifest", return_value={}),
+        patch.object(uemcp_listener, "command_queue") as command_queue,
+    ):
+        thread.start()
+        yield server, command_queue
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+class TestKeepAlive:
+    """Test HTTP/1.1 connection reuse and shutdown."""
+
+    def test_connection_reused_while_running(self, listener):
+        server, _ = listener
+        conn = http.client.HTTPConnection("localhost", server.server_address[1], timeout=5)
+
+        for _ in range(2):
+            conn.request("GET", "/")
+            response = conn.getresponse()
+            response.read()
+            assert response.status == 200
+            assert response.getheader("Connection") is None
+        conn.close()
+
+    def test_kept_alive_connection_closed_after_stop(self, listener):
+        server, command_queue = listener
+        conn = http.client.HTTPConnection("localhost", server.server_address[1], timeout=5)
+        conn.request("GET", "/")
+        conn.getresponse().read()
+
+        # The listener stops while the client still holds its connection open
+        uemcp_listener.server_running = False
+        conn.request("POST", "/", body=b'{"type": "actor_list", "params": {}}')
+        response = conn.getresponse()
+        response.read()
+
+        assert response.status == 503
+        assert response.getheader("Connection") == "close"
+        command_queue.put.assert_not_called()
+        conn.close()
+
+    def test_response_in_flight_at_stop_closes_connection(self, listener):
+        server, _ = listener
+        conn = http.client.HTTPConnection("localhost", server.server_address[1], timeout=5)
+
+        uemcp_listener.server_running = False
+        conn.request("GET", "/")
+        response = conn.getresponse()
+        response.read()
+
+        assert response.status == 200
+        assert response.getheader("Connection") == "close"
+        conn.close()
@@ -0,0 +1,135 @@
+"""
+Unit tests for error handling context managers.
+
+Tests input validation and the viewport suspension bookkeeping in
+utils.error_handling with the level editor subsystem mocked out.
+"""
+
+import inspect
+import os
+import sys
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+if "unreal" not in sys.modules:
+    sys.modules["unreal"] = MagicMock()
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+from utils.error_handling import (  # noqa: E402
+    DisableViewportUpdates,
+    ProcessingError,
+    TypeRule,
+    ValidationError,
+    require_actor,
+    validate_inputs,
+)
+
+
+class TestDisableViewportUpdates:
+    """Test realtime viewport toggling."""
+
+    def test_toggles_realtime(self):
+        subsystem = MagicMock()
+        with patch("utils.error_handling.get_level_editor_subsystem", return_value=subsystem):
+            with DisableViewportUpdates():
+                subsystem.editor_set_viewport_realtime.assert_called_once_with(False)
+
+        assert subsystem.editor_set_viewport_realtime.call_args_list == [call(False), call(True)]
+
+    def test_nested_blocks_only_toggle_outermost(self):
+        subsystem = MagicMock()
+        with patch("utils.error_handling.get_level_editor_subsystem", return_value=subsystem):
+            with DisableViewportUpdates():
+                with DisableViewportUpdates():
+                    pass
+                # Inner exit must not re-enable realtime while the outer block is active
+                assert subsystem.editor_set_viewport_realtime.call_args_list == [call(False)]
+
+        assert subsystem.editor_set_viewport_realtime.call_args_list == [call(False), call(True)]
+        assert DisableViewportUpdates._depth == 0
+
+    def test_restores_realtime_state_from_entry(self):
+        subsystem = MagicMock()
+        subsystem.editor_get_viewport_realtime.return_value = False
+        with patch("utils.error_handling.get_level_editor_subsystem", return_value=subsystem):
+            with DisableViewportUpdates():
+                with DisableViewportUpdates():
+                    pass
+
+        # Realtime was off before the batch, so it must stay off afterwards
+        assert subsystem.editor_set_viewport_realtime.call_args_list == [call(False), call(False)]
+        assert DisableViewportUpdates._saved_realtime is True
+
+    def test_reenabled_after_exception(self):
+        subsystem = MagicMock()
+        with patch("utils.error_handling.get_level_editor_subsystem", return_value=subsystem):
+            try:
+                with DisableViewportUpdates():
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+
+        assert subsystem.editor_set_viewport_realtime.call_args_list[-1] == call(True)
+        assert DisableViewportUpdates._depth == 0
+
+    def test_modify_deferred_to_outermost_exit(self):
+        actor = MagicMock()
+        with patch("utils.error_handling.get_level_editor_subsystem", return_value=MagicMock()):
+            with DisableViewportUpdates():
+                with DisableViewportUpdates():
+                    DisableViewportUpdates.mark_modified(actor)
+                DisableViewportUpdates.mark_modified(actor)
+                actor.modify.assert_not_called()
+
+        actor.modify.assert_called_once_with()
+
+    def test_modify_immediate_outside_block(self):
+        actor = MagicMock()
+
+        DisableViewportUpdates.mark_modified(actor)
+
+        actor.modify.assert_called_once_with()
+
+
+class TestValidateInputs:
+    """Test the validate_inputs decorator."""
+
+    def test_signature_resolved_once(self):
+        with patch("utils.error_handling.inspect.signature", wraps=inspect.signature) as signature:
+
+            @validate_inputs({"count": [TypeRule(int)]})
+            def op(name, count=1):
+                return count
+
+            assert op("a") == 1
+            assert op("a", count=3) == 3
+
+        assert signature.call_count == 1
+
+    def test_defaults_and_keywords_validated(self):
+        @validate_inputs({"count": [TypeRule(int)], "missing": [TypeRule(int)]})
+        def op(name, count="bad"):
+            return count
+
+        with pytest.raises(ValidationError):
+            op("a")
+        assert op("a", count=2) == 2
+        with pytest.raises(ValidationError):
+            op("a", "also bad")
+
+
+class TestRequireActor:
+    """Test actor lookup with and without a pre-built name index."""
+
+    def test_uses_index_without_scanning_level(self):
+        actor = MagicMock()
+        with patch("utils.find_actor_by_name") as find:
+            assert require_actor("Wall_1", {"Wall_1": actor}) is actor
+        find.assert_not_called()
+
+    def test_missing_from_index_raises(self):
+        with pytest.raises(ProcessingError):
+            require_actor("Wall_2", {"Wall_1": MagicMock()})
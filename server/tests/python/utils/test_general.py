@@ -0,0 +1,138 @@
+"""
+Unit tests for general utilities.
+
+Tests the frame-scoped actor lookup and subsystem caching in utils.general
+with the editor subsystems mocked out.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+if "unreal" not in sys.modules:
+    sys.modules["unreal"] = MagicMock()
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+from utils import general  # noqa: E402
+
+
+def _actor(label):
+    actor = MagicMock()
+    actor.__class__ = general.unreal.Actor
+    actor.get_actor_label.return_value = label
+    return actor
+
+
+class TestFindActorByName:
+    """Test that lookups within one frame share a single level scan."""
+
+    def _patches(self, actors, frame=1, valid=True):
+        subsystem = MagicMock()
+        subsystem.get_all_level_actors.return_value = actors
+        system_library = MagicMock()
+        system_library.get_frame_count.return_value = frame
+        system_library.is_valid.return_value = valid
+        return (
+            subsystem,
+            system_library,
+            patch.object(general, "get_actor_subsystem", return_value=subsystem),
+            patch.object(general.unreal, "SystemLibrary", system_library),
+            patch.dict(general._actor_index_cache, {"frame": None, "index": None}),
+        )
+
+    def test_same_frame_lookups_scan_once(self):
+        wall, floor = _actor("Wall"), _actor("Floor")
+        subsystem, _, p1, p2, p3 = self._patches([wall, floor])
+
+        with p1, p2, p3:
+            assert general.find_actor_by_name("Wall") is wall
+            assert general.find_actor_by_name("Floor") is floor
+
+        subsystem.get_all_level_actors.assert_called_once_with()
+
+    def test_miss_rescans_for_new_actors(self):
+        subsystem, _, p1, p2, p3 = self._patches([_actor("Wall")])
+
+        with p1, p2, p3:
+            assert general.find_actor_by_name("Door") is None
+            door = _actor("Door")
+            subsystem.get_all_level_actors.return_value = [door]
+            assert general.find_actor_by_name("Door") is door
+
+    def test_destroyed_actor_not_returned_from_cache(self):
+        wall = _actor("Wall")
+        subsystem, system_library, p1, p2, p3 = self._patches([wall])
+
+        with p1, p2, p3:
+            general.find_actor_by_name("Wall")
+            system_library.is_valid.return_value = False
+            subsystem.get_all_level_actors.return_value = []
+            assert general.find_actor_by_name("Wall") is None
+
+    def test_stale_cached_actor_error_rescans(self):
+        wall, new_wall = _actor("Wall"), _actor("Wall")
+        subsystem, _, p1, p2, p3 = self._patches([wall])
+
+        with p1, p2, p3:
+            general.find_actor_by_name("Wall")
+            wall.get_actor_label.side_effect = RuntimeError("underlying object was destroyed")
+            subsystem.get_all_level_actors.return_value = [new_wall]
+            assert general.find_actor_by_name("Wall") is new_wall
+
+    def test_new_frame_rescans(self):
+        subsystem, system_library, p1, p2, p3 = self._patches([_actor("Wall")])
+
+        with p1, p2, p3:
+            general.find_actor_by_name("Wall")
+            system_library.get_frame_count.return_value = 2
+            general.find_actor_by_name("Wall")
+
+        assert subsystem.get_all_level_actors.call_count == 2
+
+
+class TestFilterActors:
+    """Test label / class filtering over a pre-fetched actor list."""
+
+    def test_skips_non_actors(self):
+        wall = _actor("Wall")
+
+        assert general.filter_actors([None, MagicMock(), wall]) == [wall]
+
+    def test_matches_label_or_class(self):
+        wall, light = _actor("Wall_1"), _actor("Sun")
+        light.get_class.return_value.get_name.return_value = "DirectionalLight"
+        wall.get_class.return_value.get_name.return_value = "StaticMeshActor"
+
+        assert general.filter_actors([wall, light], "light") == [light]
+        assert general.filter_actors([wall, light], "WALL") == [wall]
+
+
+class TestGetActorSubsystem:
+    """Test the EditorActorSubsystem is fetched once."""
+
+    def test_subsystem_fetched_once(self):
+        subsystem = MagicMock()
+
+        with (
+            patch.object(general, "_actor_subsystem", None),
+            patch.object(general.unreal, "get_editor_subsystem", return_value=subsystem) as get_editor_subsystem,
+        ):
+            assert general.get_actor_subsystem() is subsystem
+            assert general.get_actor_subsystem() is subsystem
+
+        get_editor_subsystem.assert_called_once()
+
+    def test_unavailable_subsystem_not_cached(self):
+        with (
+            patch.object(general, "_actor_subsystem", None),
+            patch.object(general.unreal, "get_editor_subsystem", return_value=None) as get_editor_subsystem,
+        ):
+            for _ in range(2):
+                with pytest.raises(RuntimeError):
+                    general.get_actor_subsystem()
+
+        assert get_editor_subsystem.call_count == 2
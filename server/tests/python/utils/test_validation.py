@@ -5,7 +5,17 @@ These tests focus on the pure Python validation logic that can be tested
 without Unreal Engine dependencies.
 """
 
-from unittest.mock import Mock
+import os
+import sys
+from unittest.mock import MagicMock, Mock, patch
+
+if "unreal" not in sys.modules:
+    sys.modules["unreal"] = MagicMock()
+
+plugin_path = os.path.join(os.path.dirname(__file__), "../../../..", "plugin", "Content", "Python")
+sys.path.insert(0, plugin_path)
+
+from utils import validation  # noqa: E402
 
 
 class TestValidationResult:
@@ -499,3 +509,60 @@ class TestValidationUtilities:
         assert "⚠ Warnings (1):" in formatted
         assert "  - Critical error" in formatted
         assert "  - Minor warning" in formatted
+
+
+class TestActorPresenceChecks:
+    """Test the level scans behind delete / existence validation."""
+
+    def _actor(self, label):
+        actor = MagicMock()
+        actor.__class__ = validation.unreal.Actor
+        actor.get_actor_label.return_value = label
+        return actor
+
+    def _subsystem(self, actors):
+        subsystem = MagicMock()
+        subsystem.get_all_level_actors.return_value = actors
+        return patch.object(validation, "get_actor_subsystem", return_value=subsystem)
+
+    def test_deleted_skips_non_actors(self):
+        with self._subsystem([None, MagicMock(), self._actor("Wall")]):
+            assert validation.validate_actor_deleted("Cube").success is True
+
+    def test_deleted_reports_survivor(self):
+        with self._subsystem([self._actor("Cube")]):
+            result = validation.validate_actor_deleted("Cube")
+
+        assert result.errors == ["Actor 'Cube' still exists in level"]
+
+    def test_exists(self):
+        with self._subsystem([MagicMock(), self._actor("Cube")]):
+            assert validation.validate_actor_exists("Cube").success is True
+            assert validation.validate_actor_exists("Wall").success is False
+
+    def test_spawn_validation_uses_given_actor(self):
+        actor = self._actor("Cube")
+        actor.get_actor_location.return_value = Mock(x=1.0, y=2.0, z=3.0)
+
+        with patch.object(validation, "find_actor_by_name") as find_actor:
+            result = validation.validate_actor_spawn(actor, expected_location=[1, 2, 3])
+
+        assert result.success is True
+        find_actor.assert_not_called()
+
+    def test_spawn_validation_by_name_still_supported(self):
+        with patch.object(validation, "find_actor_by_name", return_value=None):
+            result = validation.validate_actor_spawn("Ghost")
+
+        assert result.errors == ["Spawned actor 'Ghost' not found in level"]
+
+    def test_spawn_validation_keeps_actor_name_keyword(self):
+        actor = self._actor("Cube")
+
+        with patch.object(validation, "find_actor_by_name", return_value=actor) as find_actor:
+            by_name = validation.validate_actor_spawn(actor_name="Cube")
+            by_actor = validation.validate_actor_spawn(actor_name=actor)
+
+        assert by_name.success is True
+        assert by_actor.success is True
+        find_actor.assert_called_once_with("Cube")